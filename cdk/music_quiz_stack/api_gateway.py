@@ -78,7 +78,7 @@ class MusicQuizApi(Construct):
 
         # PUT /admin/quiz-sessions/{sessionId} - Update session (status, title, description)
         session_admin.add_method(
-            "PUT", apigateway.LambdaIntegration(lambda_functions.update_session)
+            "PUT", apigateway.LambdaIntegration(lambda_functions.update_session_alias)
         )
 
         # POST /admin/quiz-sessions/{sessionId}/complete
@@ -129,7 +129,8 @@ class MusicQuizApi(Construct):
 
         # PUT /admin/quiz-sessions/{sessionId}/participants/{participantId} - Update
         participant_admin.add_method(
-            "PUT", apigateway.LambdaIntegration(lambda_functions.update_participant)
+            "PUT",
+            apigateway.LambdaIntegration(lambda_functions.update_participant_alias),
         )
 
         # DELETE /admin/quiz-sessions/{sessionId}/participants/{participantId} - Delete one
@@ -238,7 +239,7 @@ class MusicQuizApi(Construct):
 
         # PUT /super-admin/tenants/{tenantId} - Update tenant
         tenant.add_method(
-            "PUT", apigateway.LambdaIntegration(lambda_functions.update_tenant)
+            "PUT", apigateway.LambdaIntegration(lambda_functions.update_tenant_alias)
         )
 
         # DELETE /super-admin/tenants/{tenantId} - Delete tenant
@@ -265,7 +266,8 @@ class MusicQuizApi(Construct):
 
         # PUT /super-admin/admins/{adminId} - Update admin
         admin_resource.add_method(
-            "PUT", apigateway.LambdaIntegration(lambda_functions.update_tenant_admin)
+            "PUT",
+            apigateway.LambdaIntegration(lambda_functions.update_tenant_admin_alias),
         )
 
         # DELETE /super-admin/admins/{adminId} - Delete admin
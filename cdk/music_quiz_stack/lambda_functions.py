@@ -3,9 +3,13 @@ Lambda function constructs for Music Quiz application.
 """
 
 from aws_cdk import aws_lambda as lambda_, Duration, BundlingOptions
+from aws_cdk import aws_events as events, aws_events_targets as targets
 from constructs import Construct
 import os
 
+# Pre-initialized execution environments kept per admin update endpoint
+ADMIN_PROVISIONED_CONCURRENCY = 1
+
 
 class LambdaFunctions(Construct):
     """Construct for creating all Lambda functions."""
@@ -47,12 +51,13 @@ class LambdaFunctions(Construct):
         # Get the parent directory (project root)
         project_root = os.path.join(os.path.dirname(__file__), "..", "..")
 
-        # Lambda layer for common utilities with dependencies
+        # Lambda layer for common utilities with dependencies. Built from
+        # lambda/common so handlers import e.g. `auth` directly from the layer
         common_layer = lambda_.LayerVersion(
             self,
             "CommonLayer",
             code=lambda_.Code.from_asset(
-                os.path.join(project_root, "lambda_layer"),
+                os.path.join(project_root, "lambda", "common"),
                 bundling=BundlingOptions(
                     image=lambda_.Runtime.PYTHON_3_11.bundling_image,
                     command=[
@@ -696,3 +701,36 @@ class LambdaFunctions(Construct):
         quiz_sessions_table.grant_read_data(self.join_session)
         global_participants_table.grant_read_data(self.join_session)
         session_participations_table.grant_read_write_data(self.join_session)
+
+        # Provisioned concurrency for the admin update endpoints. API Gateway
+        # invokes these through the "live" alias so requests land on
+        # pre-initialized execution environments instead of cold starts.
+        self.update_participant_alias = self.update_participant.add_alias(
+            "live", provisioned_concurrent_executions=ADMIN_PROVISIONED_CONCURRENCY
+        )
+        self.update_session_alias = self.update_session.add_alias(
+            "live", provisioned_concurrent_executions=ADMIN_PROVISIONED_CONCURRENCY
+        )
+        self.update_tenant_alias = self.update_tenant.add_alias(
+            "live", provisioned_concurrent_executions=ADMIN_PROVISIONED_CONCURRENCY
+        )
+        self.update_tenant_admin_alias = self.update_tenant_admin.add_alias(
+            "live", provisioned_concurrent_executions=ADMIN_PROVISIONED_CONCURRENCY
+        )
+
+        # Warm-up schedule: ping every function so containers (and their
+        # module-scope clients) stay initialized. Handlers short-circuit these
+        # events. EventBridge allows at most 5 targets per rule.
+        warmup_functions = [
+            fn for fn in vars(self).values() if isinstance(fn, lambda_.Function)
+        ]
+        for index in range(0, len(warmup_functions), 5):
+            events.Rule(
+                self,
+                f"WarmupRule{index // 5 + 1}",
+                schedule=events.Schedule.rate(Duration.minutes(5)),
+                targets=[
+                    targets.LambdaFunction(fn)
+                    for fn in warmup_functions[index : index + 5]
+                ],
+            )
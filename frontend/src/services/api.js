@@ -90,25 +90,17 @@ export default {
   },
 
   // Audio
-  uploadAudio(file, sessionId) {
-    return new Promise((resolve, reject) => {
-      const reader = new FileReader()
-      reader.onload = async () => {
-        try {
-          const base64Data = reader.result.split(',')[1]
-          const response = await apiClient.post('/admin/audio', {
-            audioData: base64Data,
-            fileName: file.name,
-            sessionId
-          })
-          resolve(response)
-        } catch (error) {
-          reject(error)
-        }
-      }
-      reader.onerror = reject
-      reader.readAsDataURL(file)
+  async uploadAudio(file, sessionId) {
+    // Request a pre-signed URL, then send the file straight to S3
+    const response = await apiClient.post('/admin/audio', {
+      fileName: file.name,
+      sessionId
+    })
+    const extension = file.name.includes('.') ? file.name.split('.').pop() : 'mp3'
+    await axios.put(response.data.uploadUrl, file, {
+      headers: { 'Content-Type': `audio/${extension}` }
     })
+    return response
   },
 
   getAudioUrl(audioKey) {
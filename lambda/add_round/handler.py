@@ -10,19 +10,21 @@ Endpoint: POST /admin/quiz-sessions/{sessionId}/rounds
 
 import json
 import os
-import sys
 import uuid
 from datetime import datetime
 from decimal import Decimal
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
-from auth import validate_token
+from auth import ADMIN_ROLES, extract_bearer, validate_token
 from cors import add_cors_headers
-from errors import error_response
+from errors import (
+    ADMIN_ROLE_REQUIRED_RESPONSE,
+    INVALID_TOKEN_RESPONSE,
+    TOKEN_EXPIRED_RESPONSE,
+    error_response,
+)
 from db import get_item, put_item, update_item
 from tenant_middleware import validate_tenant_access
+from warmup import is_warmup_event, warmup_response
 import jwt
 
 
@@ -83,40 +85,27 @@ def lambda_handler(event, context):
         Error (409): Max rounds limit reached
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Validate Authorization header
-        headers = event.get("headers", {})
-        auth_header = headers.get("Authorization") or headers.get("authorization")
-
-        if not auth_header:
-            return error_response(
-                401, "MISSING_TOKEN", "Authorization header is required"
-            )
-
-        # Extract token from "Bearer <token>" format
-        if not auth_header.startswith("Bearer "):
-            return error_response(
-                401,
-                "INVALID_AUTH_FORMAT",
-                "Authorization header must be 'Bearer <token>'",
-            )
-
-        token = auth_header[7:]  # Remove "Bearer " prefix
+        token, auth_error = extract_bearer(event.get("headers"))
+        if auth_error:
+            return auth_error
 
         # Validate JWT token
         try:
             payload = validate_token(token)
         except jwt.ExpiredSignatureError:
-            return error_response(401, "TOKEN_EXPIRED", "Token has expired")
+            return TOKEN_EXPIRED_RESPONSE
         except jwt.InvalidTokenError:
-            return error_response(401, "INVALID_TOKEN", "Invalid token")
+            return INVALID_TOKEN_RESPONSE
 
         # Check if user has admin role
-        role = payload.get("role", "admin")
-        if role not in ["admin", "tenant_admin", "super_admin"]:
-            return error_response(
-                403, "INSUFFICIENT_PERMISSIONS", "Admin role required"
-            )
+        role = payload.get("role")
+        if role not in ADMIN_ROLES:
+            return ADMIN_ROLE_REQUIRED_RESPONSE
 
         # Extract tenant ID from token and create tenant context
         admin_tenant_id = payload.get("tenantId")
@@ -9,15 +9,12 @@ Endpoint: POST /admin/login
 
 import json
 import os
-import sys
-
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
 
 from auth import generate_token, verify_password
 from cors import add_cors_headers
 from errors import error_response
 from db import query
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -46,6 +43,9 @@ def lambda_handler(event, context):
         Error (401): Invalid credentials
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Parse request body
         if not event.get("body"):
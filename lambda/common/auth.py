@@ -2,10 +2,13 @@
 Authentication utility module for JWT token management and password hashing.
 """
 
+import hashlib
 import jwt
 import os
+import time
 from datetime import datetime, timedelta
-from passlib.hash import pbkdf2_sha256
+
+from errors import INVALID_AUTH_FORMAT_RESPONSE, MISSING_TOKEN_RESPONSE
 
 
 # JWT secret should be stored in AWS Secrets Manager in production
@@ -13,6 +16,15 @@ JWT_SECRET = os.environ.get("JWT_SECRET", "default-secret-change-in-production")
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
 
+# Roles allowed to call admin endpoints
+ADMIN_ROLES = frozenset({"admin", "tenant_admin", "super_admin"})
+
+# Validated token payloads, kept at module scope so they survive across warm
+# invocations. Keyed by a hash of the token so raw tokens are not held.
+TOKEN_CACHE_TTL_SECONDS = 60
+TOKEN_CACHE_MAX_ENTRIES = 4096
+_token_cache = {}
+
 
 def generate_token(user_id, role, tenant_id=None):
     """
@@ -48,6 +60,10 @@ def validate_token(token, allow_legacy=True):
     """
     Validate and decode a JWT token.
 
+    Successfully decoded payloads are cached for up to TOKEN_CACHE_TTL_SECONDS
+    (never past the token's own expiry), so repeat calls with the same token on
+    a warm container skip signature verification. Failures are never cached.
+
     Args:
         token (str): JWT token string
         allow_legacy (bool): If True, accept tokens without tenantId (backward compatibility)
@@ -59,20 +75,62 @@ def validate_token(token, allow_legacy=True):
         jwt.ExpiredSignatureError: If token has expired
         jwt.InvalidTokenError: If token is invalid
     """
-    try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-
-        # For backward compatibility, legacy tokens without tenantId are still valid
-        # The calling code can add a default tenantId if needed
-        if not allow_legacy and "tenantId" not in payload:
-            raise jwt.InvalidTokenError("Token missing tenant context")
-
-        return payload
-    except jwt.ExpiredSignatureError:
-        raise jwt.ExpiredSignatureError("Token has expired")
-    except jwt.InvalidTokenError:
+    now = time.time()
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(cache_key)
+
+    if cached and cached[0] > now:
+        payload = cached[1]
+    else:
+        try:
+            payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        except jwt.ExpiredSignatureError:
+            raise jwt.ExpiredSignatureError("Token has expired")
+        except jwt.InvalidTokenError:
+            raise jwt.InvalidTokenError("Invalid token")
+
+        expires_at = now + TOKEN_CACHE_TTL_SECONDS
+        if "exp" in payload:
+            expires_at = min(expires_at, payload["exp"])
+
+        _token_cache.pop(cache_key, None)
+        if len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _token_cache[next(iter(_token_cache))]
+        _token_cache[cache_key] = (expires_at, payload)
+
+    # For backward compatibility, legacy tokens without tenantId are still valid
+    # The calling code can add a default tenantId if needed
+    if not allow_legacy and "tenantId" not in payload:
         raise jwt.InvalidTokenError("Invalid token")
 
+    return dict(payload)
+
+
+def extract_bearer(headers):
+    """
+    Extract the token from a "Bearer <token>" Authorization header.
+
+    Args:
+        headers (dict): Request headers (may be None)
+
+    Returns:
+        tuple: (token, error_response) - one of them will be None
+    """
+    auth_header = None
+    if headers:
+        auth_header = headers.get("Authorization") or headers.get("authorization")
+
+    if not auth_header:
+        return None, MISSING_TOKEN_RESPONSE
+
+    # Single split on the first space instead of a prefix check plus slice
+    scheme, _, token = auth_header.partition(" ")
+    if scheme != "Bearer" or not token:
+        return None, INVALID_AUTH_FORMAT_RESPONSE
+
+    return token, None
+
 
 def hash_password(password):
     """
@@ -84,6 +142,8 @@ def hash_password(password):
     Returns:
         str: Hashed password string
     """
+    from passlib.hash import pbkdf2_sha256
+
     return pbkdf2_sha256.hash(password)
 
 
@@ -98,4 +158,6 @@ def verify_password(password, password_hash):
     Returns:
         bool: True if password matches, False otherwise
     """
+    from passlib.hash import pbkdf2_sha256
+
     return pbkdf2_sha256.verify(password, password_hash)
@@ -6,9 +6,9 @@ supporting legacy tokens without tenant context and defaulting to the primary te
 """
 
 import os
-from auth import validate_token
+from auth import extract_bearer, validate_token
 from db import get_item
-from errors import error_response
+from errors import INVALID_TOKEN_RESPONSE, TOKEN_EXPIRED_RESPONSE
 import jwt
 
 
@@ -38,31 +38,17 @@ def extract_token_with_fallback(event):
     Validates: Requirements 6.4, 15.5
     """
     # Extract Authorization header
-    headers = event.get("headers", {})
-    auth_header = headers.get("Authorization") or headers.get("authorization")
-
-    if not auth_header:
-        return None, error_response(
-            401, "MISSING_TOKEN", "Authorization header is required"
-        )
-
-    # Extract token from "Bearer <token>" format
-    if not auth_header.startswith("Bearer "):
-        return None, error_response(
-            401,
-            "INVALID_AUTH_FORMAT",
-            "Authorization header must be 'Bearer <token>'",
-        )
-
-    token = auth_header[7:]  # Remove "Bearer " prefix
+    token, auth_error = extract_bearer(event.get("headers"))
+    if auth_error:
+        return None, auth_error
 
     # Validate JWT token
     try:
         payload = validate_token(token)
     except jwt.ExpiredSignatureError:
-        return None, error_response(401, "TOKEN_EXPIRED", "Token has expired")
+        return None, TOKEN_EXPIRED_RESPONSE
     except jwt.InvalidTokenError:
-        return None, error_response(401, "INVALID_TOKEN", "Invalid token")
+        return None, INVALID_TOKEN_RESPONSE
 
     # Extract token context
     token_context = {
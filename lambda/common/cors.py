@@ -3,6 +3,14 @@ CORS utility module for adding Cross-Origin Resource Sharing headers to Lambda r
 """
 
 
+# Headers added to every response, built once per container
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type,Authorization,X-Amz-Date,X-Api-Key,X-Amz-Security-Token'
+}
+
+
 def add_cors_headers(response):
     """
     Add CORS headers to a Lambda response.
@@ -17,12 +25,9 @@ def add_cors_headers(response):
         dict: Response dictionary with CORS headers added
     """
     if 'headers' not in response:
-        response['headers'] = {}
-    
-    response['headers'].update({
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type,Authorization,X-Amz-Date,X-Api-Key,X-Amz-Security-Token'
-    })
+        # Copy so per-response header changes never leak into CORS_HEADERS
+        response['headers'] = CORS_HEADERS.copy()
+    else:
+        response['headers'].update(CORS_HEADERS)
     
     return response
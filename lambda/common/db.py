@@ -2,12 +2,58 @@
 Database utility module for DynamoDB operations.
 """
 
+import time
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 
-# Initialize DynamoDB client
-dynamodb = boto3.resource("dynamodb")
+# Shared client configuration: keep-alive connections, a larger pool and
+# adaptive retries so warm invocations reuse connections across requests
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Initialize DynamoDB resource and the low-level client sharing its pool
+dynamodb = boto3.resource("dynamodb", config=DYNAMODB_CONFIG)
+ddb_client = dynamodb.meta.client
+
+# Table objects by name, built once per container
+_tables = {}
+
+
+def iso_now():
+    """
+    Current UTC time as an ISO 8601 string with microseconds and a "Z" suffix.
+
+    Used for the createdAt/updatedAt attributes of stored items.
+
+    Returns:
+        str: Timestamp such as "2024-01-01T12:00:00.000000Z"
+    """
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)) + (
+        f".{nanos // 1000:06d}Z"
+    )
+
+
+def get_table(table_name):
+    """
+    Get a (cached) Table resource for a DynamoDB table.
+
+    Args:
+        table_name (str): Name of the DynamoDB table
+
+    Returns:
+        Table: boto3 Table resource
+    """
+    table = _tables.get(table_name)
+    if table is None:
+        table = _tables[table_name] = dynamodb.Table(table_name)
+    return table
 
 
 def get_item(table_name, key):
@@ -25,7 +71,7 @@ def get_item(table_name, key):
         ClientError: If DynamoDB operation fails
     """
     try:
-        table = dynamodb.Table(table_name)
+        table = get_table(table_name)
         response = table.get_item(Key=key)
         return response.get("Item")
     except ClientError as e:
@@ -47,7 +93,7 @@ def put_item(table_name, item):
         ClientError: If DynamoDB operation fails
     """
     try:
-        table = dynamodb.Table(table_name)
+        table = get_table(table_name)
         response = table.put_item(Item=item)
         return response
     except ClientError as e:
@@ -69,7 +115,7 @@ def delete_item(table_name, key):
         ClientError: If DynamoDB operation fails
     """
     try:
-        table = dynamodb.Table(table_name)
+        table = get_table(table_name)
         response = table.delete_item(Key=key)
         return response
     except ClientError as e:
@@ -82,6 +128,8 @@ def query(
     expression_attribute_values,
     index_name=None,
     expression_attribute_names=None,
+    projection_expression=None,
+    limit=None,
 ):
     """
     Query items from a DynamoDB table.
@@ -92,6 +140,8 @@ def query(
         expression_attribute_values (dict): Values for the expression
         index_name (str, optional): Name of GSI to query
         expression_attribute_names (dict, optional): Attribute name mappings
+        projection_expression (str, optional): Attributes to return for each item
+        limit (int, optional): Maximum number of items to evaluate
 
     Returns:
         list: List of items matching the query
@@ -100,18 +150,18 @@ def query(
         ClientError: If DynamoDB operation fails
     """
     try:
-        table = dynamodb.Table(table_name)
+        table = get_table(table_name)
 
-        query_params = {
-            "KeyConditionExpression": key_condition_expression,
-            "ExpressionAttributeValues": expression_attribute_values,
-        }
+        query_params = _query_params(
+            key_condition_expression,
+            expression_attribute_values,
+            index_name,
+            expression_attribute_names,
+            projection_expression,
+        )
 
-        if index_name:
-            query_params["IndexName"] = index_name
-
-        if expression_attribute_names:
-            query_params["ExpressionAttributeNames"] = expression_attribute_names
+        if limit:
+            query_params["Limit"] = limit
 
         response = table.query(**query_params)
         return response.get("Items", [])
@@ -119,6 +169,81 @@ def query(
         raise ClientError(error_response=e.response, operation_name="Query")
 
 
+def query_iter(
+    table_name,
+    key_condition_expression,
+    expression_attribute_values,
+    index_name=None,
+    expression_attribute_names=None,
+    projection_expression=None,
+):
+    """
+    Lazily iterate over all items matching a query, across all result pages.
+
+    Pages are fetched on demand, so callers can start processing items as soon
+    as the first page arrives and only one page is held in memory at a time.
+
+    Args:
+        table_name (str): Name of the DynamoDB table
+        key_condition_expression (str): Key condition expression for the query
+        expression_attribute_values (dict): Values for the expression
+        index_name (str, optional): Name of GSI to query
+        expression_attribute_names (dict, optional): Attribute name mappings
+        projection_expression (str, optional): Attributes to return for each item
+
+    Yields:
+        dict: Each item matching the query
+
+    Raises:
+        ClientError: If DynamoDB operation fails
+    """
+    try:
+        table = get_table(table_name)
+
+        query_params = _query_params(
+            key_condition_expression,
+            expression_attribute_values,
+            index_name,
+            expression_attribute_names,
+            projection_expression,
+        )
+
+        while True:
+            response = table.query(**query_params)
+            yield from response.get("Items", [])
+
+            if "LastEvaluatedKey" not in response:
+                break
+            query_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+    except ClientError as e:
+        raise ClientError(error_response=e.response, operation_name="Query")
+
+
+def _query_params(
+    key_condition_expression,
+    expression_attribute_values,
+    index_name=None,
+    expression_attribute_names=None,
+    projection_expression=None,
+):
+    """Build the keyword arguments for a Table.query call."""
+    query_params = {
+        "KeyConditionExpression": key_condition_expression,
+        "ExpressionAttributeValues": expression_attribute_values,
+    }
+
+    if index_name:
+        query_params["IndexName"] = index_name
+
+    if expression_attribute_names:
+        query_params["ExpressionAttributeNames"] = expression_attribute_names
+
+    if projection_expression:
+        query_params["ProjectionExpression"] = projection_expression
+
+    return query_params
+
+
 def scan(table_name, filter_expression=None, expression_attribute_values=None):
     """
     Scan all items from a DynamoDB table.
@@ -135,7 +260,7 @@ def scan(table_name, filter_expression=None, expression_attribute_values=None):
         ClientError: If DynamoDB operation fails
     """
     try:
-        table = dynamodb.Table(table_name)
+        table = get_table(table_name)
 
         scan_params = {}
 
@@ -165,6 +290,8 @@ def update_item(
     update_expression,
     expression_attribute_values,
     expression_attribute_names=None,
+    condition_expression=None,
+    return_values="ALL_NEW",
 ):
     """
     Update an item in a DynamoDB table.
@@ -175,32 +302,61 @@ def update_item(
         update_expression (str): Update expression
         expression_attribute_values (dict): Values for the expression
         expression_attribute_names (dict, optional): Attribute name mappings
+        condition_expression (str, optional): Condition that must hold for the
+            update to succeed; raises ConditionalCheckFailedException otherwise
+        return_values (str, optional): Which attributes DynamoDB returns
+            ("ALL_NEW", "UPDATED_NEW", "NONE", ...); defaults to "ALL_NEW"
 
     Returns:
-        dict: Updated item attributes
+        dict: Item attributes selected by return_values (None for "NONE")
 
     Raises:
         ClientError: If DynamoDB operation fails
     """
     try:
-        table = dynamodb.Table(table_name)
+        table = get_table(table_name)
 
         update_params = {
             "Key": key,
             "UpdateExpression": update_expression,
             "ExpressionAttributeValues": expression_attribute_values,
-            "ReturnValues": "ALL_NEW",
+            "ReturnValues": return_values,
         }
 
         if expression_attribute_names:
             update_params["ExpressionAttributeNames"] = expression_attribute_names
 
+        if condition_expression:
+            update_params["ConditionExpression"] = condition_expression
+
         response = table.update_item(**update_params)
         return response.get("Attributes")
     except ClientError as e:
         raise ClientError(error_response=e.response, operation_name="UpdateItem")
 
 
+def transact_write_items(transact_items):
+    """
+    Apply several condition checks and writes atomically in one request.
+
+    Items use the resource-level (plain Python) attribute value format.
+
+    Args:
+        transact_items (list): TransactItems entries (ConditionCheck, Put,
+            Update, Delete)
+
+    Raises:
+        ClientError: If DynamoDB operation fails; a failed condition raises
+            TransactionCanceledException with per-item CancellationReasons
+    """
+    try:
+        ddb_client.transact_write_items(TransactItems=transact_items)
+    except ClientError as e:
+        raise ClientError(
+            error_response=e.response, operation_name="TransactWriteItems"
+        )
+
+
 def validate_tenant_access(resource_tenant_id, user_tenant_id, user_role):
     """
     Validate that a user has access to a resource based on tenant isolation.
@@ -2,11 +2,6 @@
 Error handling utility module for consistent error responses across Lambda functions.
 """
 import json
-import sys
-import os
-
-# Add common directory to path for imports
-sys.path.insert(0, os.path.dirname(__file__))
 
 from cors import add_cors_headers
 
@@ -41,3 +36,31 @@ def error_response(status_code, error_code, message, details=None):
     }
 
     return add_cors_headers(response)
+
+
+def _prebuilt(status_code, error_code, message):
+    """Build a constant error response once at import time."""
+    return error_response(status_code, error_code, message)
+
+
+# Error responses whose bodies never vary, built once per container so the
+# authentication failure paths return a shared dict instead of re-encoding
+# the same JSON on every request. Callers must not mutate them.
+MISSING_TOKEN_RESPONSE = _prebuilt(
+    401, "MISSING_TOKEN", "Authorization header is required"
+)
+INVALID_AUTH_FORMAT_RESPONSE = _prebuilt(
+    401, "INVALID_AUTH_FORMAT", "Authorization header must be 'Bearer <token>'"
+)
+TOKEN_EXPIRED_RESPONSE = _prebuilt(401, "TOKEN_EXPIRED", "Token has expired")
+INVALID_TOKEN_RESPONSE = _prebuilt(401, "INVALID_TOKEN", "Invalid token")
+ADMIN_ROLE_REQUIRED_RESPONSE = _prebuilt(
+    403, "INSUFFICIENT_PERMISSIONS", "Admin role required"
+)
+PARTICIPANT_ROLE_REQUIRED_RESPONSE = _prebuilt(
+    403, "INSUFFICIENT_PERMISSIONS", "Participant authentication required"
+)
+MISSING_PARTICIPANT_ID_RESPONSE = _prebuilt(
+    401, "INVALID_TOKEN", "Token missing participant ID"
+)
+MISSING_TENANT_ID_RESPONSE = _prebuilt(401, "INVALID_TOKEN", "Token missing tenant ID")
@@ -0,0 +1,41 @@
+"""
+Metrics utility module for CloudWatch Embedded Metric Format (EMF) output.
+
+Lambda forwards stdout to CloudWatch Logs, which extracts EMF log lines into
+metrics directly, so counters need no metric filters or Logs Insights queries.
+"""
+
+import json
+import time
+
+
+def emit_metric(namespace, name, value=1, unit="Count", dimensions=None):
+    """
+    Write a single metric to stdout as one EMF log line.
+
+    The line is printed rather than logged so no log-level or timestamp
+    prefix is added in front of the JSON object.
+
+    Args:
+        namespace (str): CloudWatch metric namespace (e.g. 'MusicQuiz/Upload')
+        name (str): Metric name (e.g. 'S3UploadError')
+        value (int | float): Metric value; defaults to 1
+        unit (str): CloudWatch unit; defaults to 'Count'
+        dimensions (dict, optional): Dimension names mapped to string values
+    """
+    dimensions = dimensions or {}
+    record = {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": namespace,
+                    "Dimensions": [list(dimensions)],
+                    "Metrics": [{"Name": name, "Unit": unit}],
+                }
+            ],
+        },
+        **dimensions,
+        name: value,
+    }
+    print(json.dumps(record, separators=(",", ":")))
@@ -5,18 +5,87 @@ This module provides middleware functions for validating participant JWT tokens
 and ensuring participant authentication across API endpoints.
 """
 
+import logging
 import os
+import time
 import jwt
-from auth import validate_token
+from auth import extract_bearer, validate_token
 from db import get_item
-from errors import error_response
+from errors import (
+    INVALID_TOKEN_RESPONSE,
+    MISSING_PARTICIPANT_ID_RESPONSE,
+    MISSING_TENANT_ID_RESPONSE,
+    PARTICIPANT_ROLE_REQUIRED_RESPONSE,
+    TOKEN_EXPIRED_RESPONSE,
+    error_response,
+)
+from metrics import emit_metric
+
 
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 # Environment variables
 GLOBAL_PARTICIPANTS_TABLE = os.environ.get(
     "GLOBAL_PARTICIPANTS_TABLE", "GlobalParticipants"
 )
 
+# Per-container cache of participant records: participantId -> (expires_at, record)
+PARTICIPANT_CACHE_TTL_SECONDS = 30
+PARTICIPANT_CACHE_MAX_ENTRIES = 2048
+_participant_cache = {}
+
+# CloudWatch namespace for participant authentication failure counters
+METRICS_NAMESPACE = "MusicQuiz/ParticipantAuth"
+
+
+def get_participant(participant_id):
+    """
+    Get a global participant record, served from cache while it is fresh.
+
+    Records are cached for PARTICIPANT_CACHE_TTL_SECONDS, so repeat requests
+    from the same participant on a warm container skip the DynamoDB read.
+    Missing participants are never cached.
+
+    Args:
+        participant_id (str): UUID of the participant
+
+    Returns:
+        dict: Participant record if found, None otherwise
+
+    Raises:
+        ClientError: If DynamoDB operation fails
+    """
+    now = time.time()
+    cached = _participant_cache.get(participant_id)
+
+    if cached and cached[0] > now:
+        return dict(cached[1])
+
+    participant = get_item(GLOBAL_PARTICIPANTS_TABLE, {"participantId": participant_id})
+    if participant:
+        _participant_cache.pop(participant_id, None)
+        if len(_participant_cache) >= PARTICIPANT_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _participant_cache[next(iter(_participant_cache))]
+        _participant_cache[participant_id] = (
+            now + PARTICIPANT_CACHE_TTL_SECONDS,
+            participant,
+        )
+        participant = dict(participant)
+
+    return participant
+
+
+def forget_participant(participant_id):
+    """
+    Drop a participant record from the cache after it has been modified.
+
+    Args:
+        participant_id (str): UUID of the participant
+    """
+    _participant_cache.pop(participant_id, None)
+
 
 def extract_participant_from_token(event):
     """
@@ -47,31 +116,17 @@ def extract_participant_from_token(event):
     Validates: Requirements 7.3, 7.4, 7.5
     """
     # Extract Authorization header
-    headers = event.get("headers", {})
-    auth_header = headers.get("Authorization") or headers.get("authorization")
-
-    if not auth_header:
-        return None, error_response(
-            401, "MISSING_TOKEN", "Authorization header is required"
-        )
-
-    # Extract token from "Bearer <token>" format
-    if not auth_header.startswith("Bearer "):
-        return None, error_response(
-            401,
-            "INVALID_AUTH_FORMAT",
-            "Authorization header must be 'Bearer <token>'",
-        )
-
-    token = auth_header[7:]  # Remove "Bearer " prefix
+    token, auth_error = extract_bearer(event.get("headers"))
+    if auth_error:
+        return None, auth_error
 
     # Validate JWT token signature and expiration
     try:
         payload = validate_token(token)
     except jwt.ExpiredSignatureError:
-        return None, error_response(401, "TOKEN_EXPIRED", "Token has expired")
+        return None, TOKEN_EXPIRED_RESPONSE
     except jwt.InvalidTokenError:
-        return None, error_response(401, "INVALID_TOKEN", "Invalid token")
+        return None, INVALID_TOKEN_RESPONSE
 
     # Extract participant context from token payload
     participant_id = payload.get("sub")
@@ -80,20 +135,14 @@ def extract_participant_from_token(event):
 
     # Validate that this is a participant token
     if role != "participant":
-        return None, error_response(
-            403,
-            "INSUFFICIENT_PERMISSIONS",
-            "Participant authentication required",
-        )
+        return None, PARTICIPANT_ROLE_REQUIRED_RESPONSE
 
     # Validate required fields are present in token
     if not participant_id:
-        return None, error_response(
-            401, "INVALID_TOKEN", "Token missing participant ID"
-        )
+        return None, MISSING_PARTICIPANT_ID_RESPONSE
 
     if not tenant_id:
-        return None, error_response(401, "INVALID_TOKEN", "Token missing tenant ID")
+        return None, MISSING_TENANT_ID_RESPONSE
 
     # Build participant context
     participant_context = {
@@ -144,27 +193,37 @@ def require_participant_auth(event):
 
     # Verify participant exists in database
     try:
-        participant = get_item(
-            GLOBAL_PARTICIPANTS_TABLE, {"participantId": participant_id}
-        )
-    except Exception as e:
-        print(f"Error fetching participant {participant_id}: {str(e)}")
+        participant = get_participant(participant_id)
+    except Exception:
+        logger.exception("Error fetching participant %s", participant_id)
         return None, error_response(
             500, "DATABASE_ERROR", "Failed to validate participant"
         )
 
     if not participant:
+        emit_metric(
+            METRICS_NAMESPACE,
+            "ParticipantAuthFailure",
+            dimensions={"Reason": "PARTICIPANT_NOT_FOUND"},
+        )
         return None, error_response(
             404,
             "PARTICIPANT_NOT_FOUND",
             f"Participant {participant_id} not found",
         )
 
-    # Verify tenant ID in token matches participant record
+    # Verify tenant ID in token matches participant record (also on cache hits,
+    # so a tenant change fails closed)
     if participant.get("tenantId") != participant_context["tenantId"]:
-        print(
-            f"Token tenant mismatch: token has {participant_context['tenantId']}, "
-            f"participant record has {participant.get('tenantId')}"
+        logger.warning(
+            "Token tenant mismatch: token has %s, participant record has %s",
+            participant_context["tenantId"],
+            participant.get("tenantId"),
+        )
+        emit_metric(
+            METRICS_NAMESPACE,
+            "ParticipantAuthFailure",
+            dimensions={"Reason": "TENANT_MISMATCH"},
         )
         return None, error_response(
             401, "INVALID_TOKEN", "Token tenant ID does not match participant record"
@@ -196,9 +255,10 @@ def validate_participant_tenant_access(participant_context, resource_tenant_id):
 
     # Participants can only access resources from their own tenant
     if participant_tenant_id != resource_tenant_id:
-        print(
-            f"Cross-tenant access attempt: participant tenant {participant_tenant_id}, "
-            f"resource tenant {resource_tenant_id}"
+        logger.warning(
+            "Cross-tenant access attempt: participant tenant %s, resource tenant %s",
+            participant_tenant_id,
+            resource_tenant_id,
         )
         return error_response(
             403,
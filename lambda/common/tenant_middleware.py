@@ -5,15 +5,27 @@ This module provides middleware functions for validating tenant context in JWT t
 and ensuring tenant isolation across API endpoints.
 """
 
+import functools
+import logging
 import os
-from auth import validate_token
+from auth import ADMIN_ROLES, extract_bearer, validate_token
 from db import get_item
-from errors import error_response
+from errors import (
+    ADMIN_ROLE_REQUIRED_RESPONSE,
+    INVALID_TOKEN_RESPONSE,
+    TOKEN_EXPIRED_RESPONSE,
+    error_response,
+)
+from warmup import is_warmup_event, warmup_response
 import jwt
 
 
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
 # Environment variables
 TENANTS_TABLE = os.environ.get("TENANTS_TABLE", "MusicQuiz-Tenants")
+QUIZ_SESSIONS_TABLE = os.environ.get("QUIZ_SESSIONS_TABLE", "MusicQuiz-Sessions")
 
 
 def extract_tenant_from_token(event):
@@ -36,31 +48,17 @@ def extract_tenant_from_token(event):
         }
     """
     # Extract Authorization header
-    headers = event.get("headers", {})
-    auth_header = headers.get("Authorization") or headers.get("authorization")
-
-    if not auth_header:
-        return None, error_response(
-            401, "MISSING_TOKEN", "Authorization header is required"
-        )
-
-    # Extract token from "Bearer <token>" format
-    if not auth_header.startswith("Bearer "):
-        return None, error_response(
-            401,
-            "INVALID_AUTH_FORMAT",
-            "Authorization header must be 'Bearer <token>'",
-        )
-
-    token = auth_header[7:]  # Remove "Bearer " prefix
+    token, auth_error = extract_bearer(event.get("headers"))
+    if auth_error:
+        return None, auth_error
 
     # Validate JWT token
     try:
         payload = validate_token(token)
     except jwt.ExpiredSignatureError:
-        return None, error_response(401, "TOKEN_EXPIRED", "Token has expired")
+        return None, TOKEN_EXPIRED_RESPONSE
     except jwt.InvalidTokenError:
-        return None, error_response(401, "INVALID_TOKEN", "Invalid token")
+        return None, INVALID_TOKEN_RESPONSE
 
     # Extract tenant context
     tenant_context = {
@@ -92,8 +90,8 @@ def validate_tenant_active(tenant_id):
 
     try:
         tenant = get_item(TENANTS_TABLE, {"tenantId": tenant_id})
-    except Exception as e:
-        print(f"Error fetching tenant {tenant_id}: {str(e)}")
+    except Exception:
+        logger.exception("Error fetching tenant %s", tenant_id)
         return None, error_response(500, "DATABASE_ERROR", "Failed to validate tenant")
 
     if not tenant:
@@ -146,10 +144,8 @@ def require_tenant_admin(event):
 
     # Check if user has admin role
     role = tenant_context.get("role")
-    if role not in ["admin", "tenant_admin", "super_admin"]:
-        return None, error_response(
-            403, "INSUFFICIENT_PERMISSIONS", "Admin role required"
-        )
+    if role not in ADMIN_ROLES:
+        return None, ADMIN_ROLE_REQUIRED_RESPONSE
 
     # For tenant admins, validate tenant is active
     tenant_id = tenant_context.get("tenantId")
@@ -164,6 +160,70 @@ def require_tenant_admin(event):
     return tenant_context, None
 
 
+def admin_route(roles=ADMIN_ROLES):
+    """
+    Decorator for admin Lambda handlers that handles the shared boilerplate.
+
+    The wrapped handler receives the tenant context as a third argument and
+    only needs to contain its business logic. The decorator:
+    1. Short-circuits scheduled warm-up pings
+    2. Extracts and validates the bearer token (401 on failure)
+    3. Checks the role against the allowed roles (403 on failure)
+    4. Turns unexpected exceptions into a 500 INTERNAL_ERROR response
+
+    Args:
+        roles (frozenset): Roles allowed to call the handler
+
+    Returns:
+        function: Decorator producing a standard lambda_handler(event, context)
+
+    Example usage in a Lambda handler:
+        @admin_route()
+        def lambda_handler(event, context, tenant_context):
+            admin_tenant_id = tenant_context["tenantId"]
+    """
+
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(event, context):
+            if is_warmup_event(event):
+                return warmup_response()
+
+            try:
+                token, auth_error = extract_bearer(event.get("headers"))
+                if auth_error:
+                    return auth_error
+
+                try:
+                    payload = validate_token(token)
+                except jwt.ExpiredSignatureError:
+                    return TOKEN_EXPIRED_RESPONSE
+                except jwt.InvalidTokenError:
+                    return INVALID_TOKEN_RESPONSE
+
+                role = payload.get("role")
+                if role not in roles:
+                    return ADMIN_ROLE_REQUIRED_RESPONSE
+
+                tenant_context = {
+                    "adminId": payload.get("sub"),
+                    "role": role,
+                    "tenantId": payload.get("tenantId"),
+                }
+
+                return handler(event, context, tenant_context)
+
+            except Exception:
+                logger.exception("Unexpected error")
+                return error_response(
+                    500, "INTERNAL_ERROR", "An unexpected error occurred"
+                )
+
+        return wrapper
+
+    return decorator
+
+
 def validate_tenant_access(tenant_context, resource_tenant_id):
     """
     Validate that the authenticated user has access to a resource belonging to a specific tenant.
@@ -188,9 +248,10 @@ def validate_tenant_access(tenant_context, resource_tenant_id):
 
     # Tenant admins can only access their own tenant's resources
     if user_tenant_id != resource_tenant_id:
-        print(
-            f"Cross-tenant access attempt: user tenant {user_tenant_id}, "
-            f"resource tenant {resource_tenant_id}"
+        logger.warning(
+            "Cross-tenant access attempt: user tenant %s, resource tenant %s",
+            user_tenant_id,
+            resource_tenant_id,
         )
         return error_response(
             403,
@@ -199,3 +260,37 @@ def validate_tenant_access(tenant_context, resource_tenant_id):
         )
 
     return None
+
+
+def session_access_error(session_id, tenant_context):
+    """
+    Explain why a precondition on a quiz session failed.
+
+    Handlers that enforce session existence and tenant ownership through a
+    conditional write call this only on the error path, so the happy path
+    never reads the session.
+
+    Args:
+        session_id (str): UUID of the quiz session
+        tenant_context (dict): Tenant context of the calling admin
+
+    Returns:
+        dict: Error response for a missing or inaccessible session, None if
+            the session exists and is accessible
+    """
+    try:
+        session = get_item(QUIZ_SESSIONS_TABLE, {"sessionId": session_id})
+    except Exception as e:
+        logger.warning("DynamoDB get error: %s", e)
+        return error_response(500, "DATABASE_ERROR", "Failed to retrieve quiz session")
+
+    if not session:
+        return error_response(
+            404, "SESSION_NOT_FOUND", f"Quiz session {session_id} not found"
+        )
+
+    session_tenant_id = session.get("tenantId")
+    if session_tenant_id:
+        return validate_tenant_access(tenant_context, session_tenant_id)
+
+    return None
@@ -10,17 +10,14 @@ Endpoint: POST /admin/quiz-sessions
 
 import json
 import os
-import sys
 import uuid
 from datetime import datetime
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
 from cors import add_cors_headers
 from errors import error_response
 from db import put_item
 from tenant_middleware import require_tenant_admin
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -60,6 +57,9 @@ def lambda_handler(event, context):
         Error (404): Tenant not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Validate admin authentication and extract tenant context
         tenant_context, error = require_tenant_admin(event)
@@ -9,16 +9,13 @@ Endpoint: POST /super-admin/tenants
 
 import json
 import os
-import sys
 import uuid
 from datetime import datetime
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
 from cors import add_cors_headers
 from errors import error_response
 from db import put_item
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -49,6 +46,9 @@ def lambda_handler(event, context):
         Error (400): Invalid request body or missing required fields
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Parse request body
         if not event.get("body"):
@@ -9,17 +9,14 @@ Endpoint: POST /super-admin/tenants/{tenantId}/admins
 
 import json
 import os
-import sys
 import uuid
 from datetime import datetime
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
 from auth import hash_password
 from cors import add_cors_headers
 from errors import error_response
 from db import get_item, put_item, query
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -58,6 +55,9 @@ def lambda_handler(event, context):
         Error (409): Username already exists
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Extract tenantId from path parameters
         tenant_id = event.get("pathParameters", {}).get("tenantId")
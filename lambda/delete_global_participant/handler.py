@@ -9,15 +9,12 @@ Endpoint: DELETE /participants/{participantId}
 
 import json
 import os
-import sys
-
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
 
 from cors import add_cors_headers
 from errors import error_response
 from db import get_item, delete_item, query
 from participant_middleware import extract_participant_from_token
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -53,6 +50,9 @@ def lambda_handler(event, context):
         Error (404): Participant not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Extract participantId from path parameters
         participant_id = event.get("pathParameters", {}).get("participantId")
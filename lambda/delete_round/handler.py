@@ -4,15 +4,18 @@ Lambda function to delete a round from a quiz session.
 
 import json
 import os
-import sys
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
-from auth import validate_token
+from auth import ADMIN_ROLES, extract_bearer, validate_token
 from cors import add_cors_headers
-from errors import error_response
+from errors import (
+    ADMIN_ROLE_REQUIRED_RESPONSE,
+    INVALID_TOKEN_RESPONSE,
+    TOKEN_EXPIRED_RESPONSE,
+    error_response,
+)
+from db import get_table
 from tenant_middleware import validate_tenant_access
+from warmup import is_warmup_event, warmup_response
 import jwt
 import boto3
 from botocore.exceptions import ClientError
@@ -21,8 +24,7 @@ QUIZ_SESSIONS_TABLE = os.environ.get("QUIZ_SESSIONS_TABLE", "MusicQuiz-Sessions"
 QUIZ_ROUNDS_TABLE = os.environ.get("QUIZ_ROUNDS_TABLE", "MusicQuiz-Rounds")
 AUDIO_BUCKET = os.environ.get("AUDIO_BUCKET", "music-quiz-audio")
 
-# Initialize AWS clients
-dynamodb = boto3.resource("dynamodb")
+# Initialize AWS clients (DynamoDB resource is shared from db)
 s3_client = boto3.client("s3")
 
 
@@ -32,42 +34,35 @@ def lambda_handler(event, context):
 
     DELETE /admin/quiz-sessions/{sessionId}/rounds/{roundNumber}
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Validate Authorization header
-        headers = event.get("headers", {})
-        auth_header = headers.get("Authorization") or headers.get("authorization")
-
-        if not auth_header:
-            return error_response(
-                401, "MISSING_TOKEN", "Authorization header is required"
-            )
-
-        if not auth_header.startswith("Bearer "):
-            return error_response(
-                401,
-                "INVALID_AUTH_FORMAT",
-                "Authorization header must be 'Bearer <token>'",
-            )
-
-        token = auth_header[7:]
+        token, auth_error = extract_bearer(event.get("headers"))
+        if auth_error:
+            return auth_error
 
         # Validate JWT token
         try:
             payload = validate_token(token)
         except jwt.ExpiredSignatureError:
-            return error_response(401, "TOKEN_EXPIRED", "Token has expired")
+            return TOKEN_EXPIRED_RESPONSE
         except jwt.InvalidTokenError:
-            return error_response(401, "INVALID_TOKEN", "Invalid token")
+            return INVALID_TOKEN_RESPONSE
 
         # Check if user has admin role
-        role = payload.get("role", "admin")
-        if role not in ["admin", "tenant_admin", "super_admin"]:
-            return error_response(
-                403, "INSUFFICIENT_PERMISSIONS", "Admin role required"
-            )
+        role = payload.get("role")
+        if role not in ADMIN_ROLES:
+            return ADMIN_ROLE_REQUIRED_RESPONSE
 
-        # Extract tenant ID from token
+        # Extract tenant ID from token and create tenant context
         admin_tenant_id = payload.get("tenantId")
+        tenant_context = {
+            "adminId": payload.get("sub"),
+            "role": role,
+            "tenantId": admin_tenant_id,
+        }
 
         # Extract parameters
         path_parameters = event.get("pathParameters", {})
@@ -86,8 +81,8 @@ def lambda_handler(event, context):
                 400, "INVALID_ROUND_NUMBER", "Round number must be an integer"
             )
 
-        sessions_table = dynamodb.Table(QUIZ_SESSIONS_TABLE)
-        rounds_table = dynamodb.Table(QUIZ_ROUNDS_TABLE)
+        sessions_table = get_table(QUIZ_SESSIONS_TABLE)
+        rounds_table = get_table(QUIZ_ROUNDS_TABLE)
 
         # Get session to validate tenant access
         session_response = sessions_table.get_item(Key={"sessionId": session_id})
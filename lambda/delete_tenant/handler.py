@@ -9,15 +9,12 @@ Endpoint: DELETE /super-admin/tenants/{tenantId}
 
 import json
 import os
-import sys
 from datetime import datetime
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
 from cors import add_cors_headers
 from errors import error_response
 from db import get_item, update_item
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -42,6 +39,9 @@ def lambda_handler(event, context):
         Error (404): Tenant not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Get tenant ID from path parameters
         path_parameters = event.get("pathParameters", {})
@@ -9,14 +9,11 @@ Endpoint: DELETE /super-admin/admins/{adminId}
 
 import json
 import os
-import sys
-
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
 
 from cors import add_cors_headers
 from errors import error_response
 from db import get_item, delete_item
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -41,6 +38,9 @@ def lambda_handler(event, context):
         Error (404): Admin not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Extract adminId from path parameters
         admin_id = event.get("pathParameters", {}).get("adminId")
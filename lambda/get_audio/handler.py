@@ -7,13 +7,10 @@ Endpoint: GET /audio/{audioKey}
 """
 import json
 import os
-import sys
-
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
 
 from cors import add_cors_headers
 from errors import error_response
+from warmup import is_warmup_event, warmup_response
 import boto3
 from botocore.exceptions import ClientError
 
@@ -45,6 +42,9 @@ def lambda_handler(event, context):
         Error (404): Audio file not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Extract audio key from query parameters
         query_params = event.get("queryStringParameters") or {}
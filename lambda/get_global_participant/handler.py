@@ -8,14 +8,11 @@ Endpoint: GET /participants/{participantId}
 
 import json
 import os
-import sys
-
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
 
 from cors import add_cors_headers
 from errors import error_response
 from db import get_item
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -44,6 +41,9 @@ def lambda_handler(event, context):
         Error (404): Participant not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Get participant ID from path parameters
         path_parameters = event.get("pathParameters", {})
@@ -9,15 +9,12 @@ Endpoint: GET /quiz-sessions/{sessionId}
 
 import json
 import os
-import sys
 from decimal import Decimal
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
 from cors import add_cors_headers
 from errors import error_response
 from db import get_item, query
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -71,6 +68,9 @@ def lambda_handler(event, context):
         Error (404): Session not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Extract session ID from path parameters
         path_parameters = event.get("pathParameters", {})
@@ -12,13 +12,9 @@ Validates: Requirements 3.1, 3.2, 3.3, 3.4, 11.2
 
 import json
 import os
-import sys
 import uuid
 from datetime import datetime
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
 from cors import add_cors_headers
 from errors import error_response
 from db import get_item, put_item, query
@@ -26,6 +22,7 @@ from participant_middleware import (
     require_participant_auth,
     validate_participant_tenant_access,
 )
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -59,6 +56,9 @@ def lambda_handler(event, context):
         Error (404): Session not found or participant not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Require participant authentication
         participant_context, error = require_participant_auth(event)
@@ -9,15 +9,12 @@ Endpoint: GET /quiz-sessions
 
 import json
 import os
-import sys
 from decimal import Decimal
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
 from cors import add_cors_headers
 from errors import error_response
 from db import scan
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -60,6 +57,9 @@ def lambda_handler(event, context):
 
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Query all sessions (public endpoint)
         try:
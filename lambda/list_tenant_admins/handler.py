@@ -9,14 +9,11 @@ Endpoint: GET /super-admin/tenants/{tenantId}/admins
 
 import json
 import os
-import sys
-
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
 
 from cors import add_cors_headers
 from errors import error_response
 from db import query, get_item
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -52,6 +49,9 @@ def lambda_handler(event, context):
         Error (404): Tenant not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Extract tenantId from path parameters
         tenant_id = event.get("pathParameters", {}).get("tenantId")
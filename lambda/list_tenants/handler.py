@@ -9,14 +9,11 @@ Endpoint: GET /super-admin/tenants
 
 import json
 import os
-import sys
-
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
 
 from cors import add_cors_headers
 from errors import error_response
 from db import scan, query
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -46,6 +43,9 @@ def lambda_handler(event, context):
 
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Get optional status filter from query parameters
         status_filter = None
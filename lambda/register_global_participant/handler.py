@@ -9,17 +9,14 @@ Endpoint: POST /participants/register
 
 import json
 import os
-import sys
 import uuid
 from datetime import datetime
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
 from auth import generate_token
 from cors import add_cors_headers
 from errors import error_response
 from db import get_item, put_item, scan
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -56,6 +53,9 @@ def lambda_handler(event, context):
         Error (403): Tenant is inactive
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Parse request body
         if not event.get("body"):
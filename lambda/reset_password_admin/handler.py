@@ -9,16 +9,13 @@ Endpoint: POST /super-admin/admins/{adminId}/reset-password
 
 import json
 import os
-import sys
 from datetime import datetime
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
 from auth import hash_password
 from cors import add_cors_headers
 from errors import error_response
 from db import get_item, update_item
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -66,6 +63,9 @@ def lambda_handler(event, context):
         Error (404): Admin not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Extract adminId from path parameters
         admin_id = event.get("pathParameters", {}).get("adminId")
@@ -8,53 +8,54 @@ Endpoint: DELETE /admin/quiz-sessions/{sessionId}/points
 
 import json
 import os
-import sys
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
-from auth import validate_token
+from auth import ADMIN_ROLES, extract_bearer, validate_token
 from cors import add_cors_headers
-from errors import error_response
-from db import query, get_item
+from errors import (
+    ADMIN_ROLE_REQUIRED_RESPONSE,
+    INVALID_TOKEN_RESPONSE,
+    TOKEN_EXPIRED_RESPONSE,
+    error_response,
+)
+from db import query_iter, get_item, get_table
 from tenant_middleware import validate_tenant_access
+from warmup import is_warmup_event, warmup_response
 import jwt
-import boto3
 
 # Environment variables
 QUIZ_SESSIONS_TABLE = os.environ.get("QUIZ_SESSIONS_TABLE", "MusicQuiz-Sessions")
 ANSWERS_TABLE = os.environ.get("ANSWERS_TABLE", "MusicQuiz-Answers")
 
-dynamodb = boto3.resource("dynamodb")
-
 
 def lambda_handler(event, context):
     """Handle reset points requests."""
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Validate Authorization
-        headers = event.get("headers", {})
-        auth_header = headers.get("Authorization") or headers.get("authorization")
-
-        if not auth_header or not auth_header.startswith("Bearer "):
-            return error_response(401, "MISSING_TOKEN", "Authorization required")
-
-        token = auth_header[7:]
+        token, auth_error = extract_bearer(event.get("headers"))
+        if auth_error:
+            return auth_error
 
         try:
             payload = validate_token(token)
         except jwt.ExpiredSignatureError:
-            return error_response(401, "TOKEN_EXPIRED", "Token has expired")
+            return TOKEN_EXPIRED_RESPONSE
         except jwt.InvalidTokenError:
-            return error_response(401, "INVALID_TOKEN", "Invalid token")
+            return INVALID_TOKEN_RESPONSE
 
-        role = payload.get("role", "admin")
-        if role not in ["admin", "tenant_admin", "super_admin"]:
-            return error_response(
-                403, "INSUFFICIENT_PERMISSIONS", "Admin role required"
-            )
+        role = payload.get("role")
+        if role not in ADMIN_ROLES:
+            return ADMIN_ROLE_REQUIRED_RESPONSE
 
-        # Extract tenant ID from token
+        # Extract tenant ID from token and create tenant context
         admin_tenant_id = payload.get("tenantId")
+        tenant_context = {
+            "adminId": payload.get("sub"),
+            "role": role,
+            "tenantId": admin_tenant_id,
+        }
 
         # Extract session ID
         path_parameters = event.get("pathParameters", {})
@@ -80,28 +81,26 @@ def lambda_handler(event, context):
             if access_error:
                 return access_error
 
-        # Get all answers for this session
-        try:
-            answers = query(
-                ANSWERS_TABLE,
-                "sessionId = :sessionId",
-                {":sessionId": session_id},
-                index_name="SessionRoundIndex",
-            )
-        except Exception as e:
-            print(f"Query error: {str(e)}")
-            answers = []
-
-        # Delete all answers
-        answers_table = dynamodb.Table(ANSWERS_TABLE)
+        # Stream answer keys page by page straight into batched deletes
+        # (only the key is needed, so nothing else is projected)
+        answers_table = get_table(ANSWERS_TABLE)
         deleted_count = 0
 
-        for answer in answers:
-            try:
-                answers_table.delete_item(Key={"answerId": answer["answerId"]})
-                deleted_count += 1
-            except Exception as e:
-                print(f"Delete error: {str(e)}")
+        try:
+            with answers_table.batch_writer() as batch:
+                for answer in query_iter(
+                    ANSWERS_TABLE,
+                    "sessionId = :sessionId",
+                    {":sessionId": session_id},
+                    index_name="SessionRoundIndex",
+                    expression_attribute_names={"#aid": "answerId"},
+                    projection_expression="#aid",
+                ):
+                    batch.delete_item(Key={"answerId": answer["answerId"]})
+                    deleted_count += 1
+        except Exception as e:
+            print(f"Delete error: {str(e)}")
+            return error_response(500, "DATABASE_ERROR", "Failed to reset points")
 
         response = {
             "statusCode": 200,
@@ -9,17 +9,20 @@ Endpoint: POST /admin/quiz-sessions/{sessionId}/rounds/{roundNumber}/start
 
 import json
 import os
-import sys
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
-from auth import validate_token
+from auth import ADMIN_ROLES, extract_bearer, validate_token
 from cors import add_cors_headers
-from errors import error_response
+from errors import (
+    ADMIN_ROLE_REQUIRED_RESPONSE,
+    INVALID_TOKEN_RESPONSE,
+    TOKEN_EXPIRED_RESPONSE,
+    error_response,
+)
 from db import get_item, update_item
-from tenant_middleware import validate_tenant_access
+from tenant_middleware import session_access_error
+from warmup import is_warmup_event, warmup_response
 import jwt
+from botocore.exceptions import ClientError
 
 
 # Environment variables
@@ -45,39 +48,27 @@ def lambda_handler(event, context):
         Error (404): Session or round not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Validate Authorization header
-        headers = event.get("headers", {})
-        auth_header = headers.get("Authorization") or headers.get("authorization")
-
-        if not auth_header:
-            return error_response(
-                401, "MISSING_TOKEN", "Authorization header is required"
-            )
-
-        if not auth_header.startswith("Bearer "):
-            return error_response(
-                401,
-                "INVALID_AUTH_FORMAT",
-                "Authorization header must be 'Bearer <token>'",
-            )
-
-        token = auth_header[7:]
+        token, auth_error = extract_bearer(event.get("headers"))
+        if auth_error:
+            return auth_error
 
         # Validate JWT token
         try:
             payload = validate_token(token)
         except jwt.ExpiredSignatureError:
-            return error_response(401, "TOKEN_EXPIRED", "Token has expired")
+            return TOKEN_EXPIRED_RESPONSE
         except jwt.InvalidTokenError:
-            return error_response(401, "INVALID_TOKEN", "Invalid token")
+            return INVALID_TOKEN_RESPONSE
 
         # Check if user has admin role
-        role = payload.get("role", "admin")
-        if role not in ["admin", "tenant_admin", "super_admin"]:
-            return error_response(
-                403, "INSUFFICIENT_PERMISSIONS", "Admin role required"
-            )
+        role = payload.get("role")
+        if role not in ADMIN_ROLES:
+            return ADMIN_ROLE_REQUIRED_RESPONSE
 
         # Extract tenant ID from token and create tenant context
         admin_tenant_id = payload.get("tenantId")
@@ -104,27 +95,6 @@ def lambda_handler(event, context):
                 400, "INVALID_ROUND_NUMBER", "Round number must be an integer"
             )
 
-        # Check if session exists
-        try:
-            session = get_item(QUIZ_SESSIONS_TABLE, {"sessionId": session_id})
-        except Exception as e:
-            print(f"DynamoDB get error: {str(e)}")
-            return error_response(
-                500, "DATABASE_ERROR", "Failed to retrieve quiz session"
-            )
-
-        if not session:
-            return error_response(
-                404, "SESSION_NOT_FOUND", f"Quiz session {session_id} not found"
-            )
-
-        # Validate tenant access
-        session_tenant_id = session.get("tenantId")
-        if session_tenant_id:
-            access_error = validate_tenant_access(tenant_context, session_tenant_id)
-            if access_error:
-                return access_error
-
         # Check if round exists
         try:
             round_item = get_item(
@@ -136,25 +106,44 @@ def lambda_handler(event, context):
             return error_response(500, "DATABASE_ERROR", "Failed to retrieve round")
 
         if not round_item:
-            return error_response(404, "ROUND_NOT_FOUND", "Round not found")
+            return session_access_error(session_id, tenant_context) or error_response(
+                404, "ROUND_NOT_FOUND", "Round not found"
+            )
 
-        # Update session to set current round, start timestamp, and status to active
+        # Update session to set current round, start timestamp, and status to
+        # active. Session existence and tenant ownership are enforced by the
+        # condition, so no separate read of the session is needed.
         from datetime import datetime
 
         round_started_at = str(int(datetime.utcnow().timestamp()))
+        expression_values = {
+            ":round": round_number,
+            ":startTime": round_started_at,
+            ":status": "active",
+        }
+        condition_expression = "attribute_exists(sessionId)"
+        if role != "super_admin":
+            condition_expression += (
+                " AND (attribute_not_exists(tenantId) OR tenantId = :tenantId)"
+            )
+            expression_values[":tenantId"] = admin_tenant_id
 
         try:
             update_item(
                 QUIZ_SESSIONS_TABLE,
                 {"sessionId": session_id},
                 "SET currentRound = :round, roundStartedAt = :startTime, #status = :status",
-                {
-                    ":round": round_number,
-                    ":startTime": round_started_at,
-                    ":status": "active",
-                },
+                expression_values,
                 {"#status": "status"},
+                condition_expression=condition_expression,
             )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return session_access_error(session_id, tenant_context) or error_response(
+                    500, "DATABASE_ERROR", "Failed to start round"
+                )
+            print(f"DynamoDB update error: {str(e)}")
+            return error_response(500, "DATABASE_ERROR", "Failed to start round")
         except Exception as e:
             print(f"DynamoDB update error: {str(e)}")
             return error_response(500, "DATABASE_ERROR", "Failed to start round")
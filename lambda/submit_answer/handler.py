@@ -8,16 +8,14 @@ Endpoint: POST /participants/answers
 
 import json
 import os
-import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
 from cors import add_cors_headers
 from errors import error_response
 from db import get_item, put_item, query, update_item
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -32,6 +30,47 @@ SESSION_PARTICIPATIONS_TABLE = os.environ.get(
 )
 ANSWERS_TABLE = os.environ.get("ANSWERS_TABLE", "MusicQuiz-Answers")
 
+# Thread pool for issuing the independent pre-flight reads concurrently
+_executor = ThreadPoolExecutor(max_workers=3)
+
+
+def _validate_submission(body):
+    """
+    Validate a parsed answer submission body.
+
+    Args:
+        body: Parsed JSON request body
+
+    Returns:
+        tuple: (fields, error_response)
+            - fields (tuple): participantId, sessionId, roundNumber, answer
+            - error_response (dict): Error response if validation fails, None otherwise
+    """
+    if type(body) is not dict:
+        return None, error_response(
+            400, "INVALID_REQUEST", "Request body must be a JSON object"
+        )
+
+    participant_id = body.get("participantId")
+    session_id = body.get("sessionId")
+    round_number = body.get("roundNumber")
+    answer = body.get("answer")
+
+    if not participant_id or not session_id or round_number is None or answer is None:
+        return None, error_response(
+            400,
+            "MISSING_FIELDS",
+            "participantId, sessionId, roundNumber, and answer are required",
+        )
+
+    # Answer must be an integer 0-3 (exact type check also rejects booleans)
+    if type(answer) is not int or not 0 <= answer <= 3:
+        return None, error_response(
+            400, "INVALID_ANSWER", "Answer must be an integer between 0 and 3"
+        )
+
+    return (participant_id, session_id, round_number, answer), None
+
 
 def lambda_handler(event, context):
     """
@@ -51,6 +90,9 @@ def lambda_handler(event, context):
         Error (404): Session, round, or participant not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Parse request body
         if not event.get("body"):
@@ -64,34 +106,33 @@ def lambda_handler(event, context):
             )
 
         # Validate required fields
-        participant_id = body.get("participantId")
-        session_id = body.get("sessionId")
-        round_number = body.get("roundNumber")
-        answer = body.get("answer")
-
-        if not all(
-            [participant_id, session_id, round_number is not None, answer is not None]
-        ):
-            return error_response(
-                400,
-                "MISSING_FIELDS",
-                "participantId, sessionId, roundNumber, and answer are required",
-            )
-
-        # Validate answer is 0-3
-        if not isinstance(answer, int) or answer < 0 or answer > 3:
-            return error_response(
-                400, "INVALID_ANSWER", "Answer must be an integer between 0 and 3"
-            )
+        fields, error = _validate_submission(body)
+        if error:
+            return error
+
+        participant_id, session_id, round_number, answer = fields
+
+        # The participation, session and round lookups are independent, so
+        # issue them concurrently; results are still checked in order below
+        participations_future = _executor.submit(
+            query,
+            SESSION_PARTICIPATIONS_TABLE,
+            "participantId = :participantId",
+            {":participantId": participant_id},
+            index_name="ParticipantIndex",
+        )
+        session_future = _executor.submit(
+            get_item, QUIZ_SESSIONS_TABLE, {"sessionId": session_id}
+        )
+        round_future = _executor.submit(
+            get_item,
+            QUIZ_ROUNDS_TABLE,
+            {"sessionId": session_id, "roundNumber": round_number},
+        )
 
         # Look up SessionParticipation by participantId and sessionId
         try:
-            participations = query(
-                SESSION_PARTICIPATIONS_TABLE,
-                "participantId = :participantId",
-                {":participantId": participant_id},
-                index_name="ParticipantIndex",
-            )
+            participations = participations_future.result()
 
             # Find the participation for this specific session
             participation = None
@@ -118,7 +159,7 @@ def lambda_handler(event, context):
 
         # Check session status - reject answers for completed sessions
         try:
-            session = get_item(QUIZ_SESSIONS_TABLE, {"sessionId": session_id})
+            session = session_future.result()
             if not session:
                 return error_response(404, "SESSION_NOT_FOUND", "Session not found")
 
@@ -135,10 +176,7 @@ def lambda_handler(event, context):
 
         # Check if round exists
         try:
-            round_item = get_item(
-                QUIZ_ROUNDS_TABLE,
-                {"sessionId": session_id, "roundNumber": round_number},
-            )
+            round_item = round_future.result()
         except Exception as e:
             print(f"DynamoDB get error: {str(e)}")
             return error_response(500, "DATABASE_ERROR", "Failed to retrieve round")
@@ -152,9 +190,8 @@ def lambda_handler(event, context):
         # Calculate points based on response time
         points = 0
         if is_correct:
-            # Get session to find when round started
+            # Use the session fetched above to find when round started
             try:
-                session = get_item(QUIZ_SESSIONS_TABLE, {"sessionId": session_id})
                 round_started_at = session.get("roundStartedAt")
 
                 if round_started_at:
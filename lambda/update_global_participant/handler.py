@@ -8,16 +8,13 @@ Endpoint: PUT /participants/{participantId}
 
 import json
 import os
-import sys
 from datetime import datetime
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
 from cors import add_cors_headers
 from errors import error_response
 from db import update_item, scan
-from participant_middleware import require_participant_auth
+from participant_middleware import forget_participant, require_participant_auth
+from warmup import is_warmup_event, warmup_response
 
 
 # Environment variables
@@ -55,6 +52,9 @@ def lambda_handler(event, context):
         Error (404): Participant not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Get participant ID from path parameters
         path_parameters = event.get("pathParameters", {})
@@ -169,6 +169,8 @@ def lambda_handler(event, context):
             print(f"DynamoDB update error: {str(e)}")
             return error_response(500, "DATABASE_ERROR", "Failed to update participant")
 
+        forget_participant(participant_id)
+
         # Return updated profile (exclude token for security)
         profile = {
             "participantId": updated_participant["participantId"],
@@ -6,27 +6,124 @@ This Lambda function updates a participant's name and avatar.
 Endpoint: PUT /admin/quiz-sessions/{sessionId}/participants/{participantId}
 """
 
-import json
+import logging
 import os
-import sys
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
-from auth import validate_token
 from cors import add_cors_headers
 from errors import error_response
-from db import get_item, update_item
-from tenant_middleware import validate_tenant_access
-import jwt
+from db import transact_write_items
+from tenant_middleware import admin_route
+import orjson
+from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 # Environment variables
 PARTICIPANTS_TABLE = os.environ.get("PARTICIPANTS_TABLE", "MusicQuiz-Participants")
 QUIZ_SESSIONS_TABLE = os.environ.get("QUIZ_SESSIONS_TABLE", "MusicQuiz-Sessions")
 
 
-def lambda_handler(event, context):
+def _validate_participant_update(body):
+    """
+    Validate a parsed participant update body.
+
+    Args:
+        body: Parsed JSON request body
+
+    Returns:
+        tuple: (fields, error_response)
+            - fields (tuple): name, avatar
+            - error_response (dict): Error response if validation fails, None otherwise
+    """
+    if type(body) is not dict:
+        return None, error_response(
+            400, "INVALID_REQUEST", "Request body must be a JSON object"
+        )
+
+    name = body.get("name")
+    avatar = body.get("avatar")
+
+    if not name or not avatar:
+        return None, error_response(
+            400,
+            "MISSING_FIELDS",
+            "name and avatar are required",
+            {"required_fields": ["name", "avatar"]},
+        )
+
+    if type(name) is not str or type(avatar) is not str:
+        return None, error_response(
+            400, "INVALID_FIELD_VALUE", "name and avatar must be strings"
+        )
+
+    return (name, avatar), None
+
+
+def _session_condition(session_id, tenant_context):
+    """
+    Build the ConditionCheck guarding a participant update.
+
+    The session must exist and, unless the caller is a super admin, either
+    belong to the caller's tenant or predate multi-tenancy (no tenantId).
+
+    Args:
+        session_id (str): UUID of the quiz session
+        tenant_context (dict): Tenant context from admin_route
+
+    Returns:
+        dict: ConditionCheck entry for transact_write_items
+    """
+    condition = {
+        "TableName": QUIZ_SESSIONS_TABLE,
+        "Key": {"sessionId": session_id},
+        "ConditionExpression": "attribute_exists(sessionId)",
+        "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+    }
+
+    if tenant_context.get("role") != "super_admin":
+        condition[
+            "ConditionExpression"
+        ] += " AND (attribute_not_exists(tenantId) OR tenantId = :tenantId)"
+        condition["ExpressionAttributeValues"] = {
+            ":tenantId": tenant_context.get("tenantId")
+        }
+
+    return condition
+
+
+def _cancellation_error(error):
+    """
+    Map the cancellation reasons of a failed update transaction to a response.
+
+    Args:
+        error (dict): ClientError response of a TransactionCanceledException
+
+    Returns:
+        dict: 403/404 error response, or None if no condition check failed
+    """
+    reasons = error.get("CancellationReasons") or []
+    codes = [reason.get("Code") for reason in reasons]
+
+    if codes and codes[0] == "ConditionalCheckFailed":
+        # The old item is only returned when the session exists, so a
+        # failure with an item means it belongs to another tenant
+        if reasons[0].get("Item"):
+            return error_response(
+                403,
+                "CROSS_TENANT_ACCESS",
+                "You do not have permission to access this resource",
+            )
+        return error_response(404, "SESSION_NOT_FOUND", "Session not found")
+
+    if len(codes) > 1 and codes[1] == "ConditionalCheckFailed":
+        return error_response(404, "PARTICIPANT_NOT_FOUND", "Participant not found")
+
+    return None
+
+
+@admin_route()
+def lambda_handler(event, context, tenant_context):
     """
     Handle update participant requests.
 
@@ -51,139 +148,80 @@ def lambda_handler(event, context):
         Error (404): Participant not found
         Error (500): Internal server error
     """
-    try:
-        # Validate Authorization header
-        headers = event.get("headers", {})
-        auth_header = headers.get("Authorization") or headers.get("authorization")
-
-        if not auth_header:
-            return error_response(
-                401, "MISSING_TOKEN", "Authorization header is required"
-            )
-
-        if not auth_header.startswith("Bearer "):
-            return error_response(
-                401,
-                "INVALID_AUTH_FORMAT",
-                "Authorization header must be 'Bearer <token>'",
-            )
-
-        token = auth_header[7:]
-
-        # Validate JWT token
-        try:
-            payload = validate_token(token)
-        except jwt.ExpiredSignatureError:
-            return error_response(401, "TOKEN_EXPIRED", "Token has expired")
-        except jwt.InvalidTokenError:
-            return error_response(401, "INVALID_TOKEN", "Invalid token")
-
-        # Check if user has admin role
-        role = payload.get("role", "admin")
-        if role not in ["admin", "tenant_admin", "super_admin"]:
-            return error_response(
-                403, "INSUFFICIENT_PERMISSIONS", "Admin role required"
-            )
-
-        # Extract tenant ID from token
-        admin_tenant_id = payload.get("tenantId")
-
-        # Extract parameters
-        path_parameters = event.get("pathParameters", {})
-        session_id = path_parameters.get("sessionId")
-        participant_id = path_parameters.get("participantId")
-
-        if not session_id or not participant_id:
-            return error_response(
-                400,
-                "MISSING_PARAMETERS",
-                "Session ID and participant ID are required",
-            )
+    # Extract parameters
+    path_parameters = event.get("pathParameters", {})
+    session_id = path_parameters.get("sessionId")
+    participant_id = path_parameters.get("participantId")
+
+    if not session_id or not participant_id:
+        return error_response(
+            400,
+            "MISSING_PARAMETERS",
+            "Session ID and participant ID are required",
+        )
+
+    # Parse and validate request body before touching DynamoDB
+    if not event.get("body"):
+        return error_response(400, "INVALID_REQUEST", "Request body is required")
 
-        # Validate tenant access to session
-        try:
-            session = get_item(QUIZ_SESSIONS_TABLE, {"sessionId": session_id})
-        except Exception as e:
-            print(f"DynamoDB get error for session: {str(e)}")
-            return error_response(500, "DATABASE_ERROR", "Failed to retrieve session")
-
-        if not session:
-            return error_response(404, "SESSION_NOT_FOUND", "Session not found")
-
-        session_tenant_id = session.get("tenantId")
-        if session_tenant_id:
-            access_error = validate_tenant_access(tenant_context, session_tenant_id)
-            if access_error:
-                return access_error
-
-        # Parse request body
-        if not event.get("body"):
-            return error_response(400, "INVALID_REQUEST", "Request body is required")
-
-        try:
-            body = json.loads(event["body"])
-        except json.JSONDecodeError:
-            return error_response(
-                400, "INVALID_JSON", "Request body must be valid JSON"
-            )
-
-        name = body.get("name")
-        avatar = body.get("avatar")
-
-        if not name or not avatar:
-            return error_response(
-                400,
-                "MISSING_FIELDS",
-                "name and avatar are required",
-                {"required_fields": ["name", "avatar"]},
-            )
+    try:
+        body = orjson.loads(event["body"])
+    except orjson.JSONDecodeError:
+        return error_response(400, "INVALID_JSON", "Request body must be valid JSON")
 
-        # Check if participant exists
-        try:
-            participant = get_item(
-                PARTICIPANTS_TABLE,
-                {"sessionId": session_id, "participantId": participant_id},
-            )
-        except Exception as e:
-            print(f"DynamoDB get error: {str(e)}")
-            return error_response(
-                500, "DATABASE_ERROR", "Failed to retrieve participant"
-            )
+    fields, validation_error = _validate_participant_update(body)
+    if validation_error:
+        return validation_error
+    name, avatar = fields
 
-        if not participant:
-            return error_response(404, "PARTICIPANT_NOT_FOUND", "Participant not found")
-
-        # Update participant
-        try:
-            update_item(
-                PARTICIPANTS_TABLE,
-                {"sessionId": session_id, "participantId": participant_id},
-                "SET #name = :name, avatar = :avatar",
-                {":name": name, ":avatar": avatar},
-                {"#name": "name"},  # name is a reserved keyword
-            )
-        except Exception as e:
-            print(f"DynamoDB update error: {str(e)}")
-            return error_response(500, "DATABASE_ERROR", "Failed to update participant")
-
-        # Return success response
-        response = {
-            "statusCode": 200,
-            "body": json.dumps(
+    # Check the session (existence and tenant) and update the participant
+    # in one transaction instead of a session read followed by a write.
+    try:
+        transact_write_items(
+            [
+                {"ConditionCheck": _session_condition(session_id, tenant_context)},
                 {
-                    "message": "Participant updated successfully",
-                    "participantId": participant_id,
-                    "name": name,
-                    "avatar": avatar,
-                }
-            ),
-        }
-
-        return add_cors_headers(response)
-
+                    "Update": {
+                        "TableName": PARTICIPANTS_TABLE,
+                        "Key": {"participantId": participant_id},
+                        "UpdateExpression": "SET #name = :name, avatar = :avatar",
+                        # The participant must belong to the checked session
+                        "ConditionExpression": (
+                            "attribute_exists(participantId) AND sessionId = :sid"
+                        ),
+                        # name is a reserved keyword
+                        "ExpressionAttributeNames": {"#name": "name"},
+                        "ExpressionAttributeValues": {
+                            ":name": name,
+                            ":avatar": avatar,
+                            ":sid": session_id,
+                        },
+                    }
+                },
+            ]
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "TransactionCanceledException":
+            cancel_error = _cancellation_error(e.response)
+            if cancel_error:
+                return cancel_error
+        logger.warning("DynamoDB transaction error: %s", e)
+        return error_response(500, "DATABASE_ERROR", "Failed to update participant")
     except Exception as e:
-        print(f"Unexpected error in update participant: {str(e)}")
-        import traceback
-
-        traceback.print_exc()
-        return error_response(500, "INTERNAL_ERROR", "An unexpected error occurred")
+        logger.warning("DynamoDB transaction error: %s", e)
+        return error_response(500, "DATABASE_ERROR", "Failed to update participant")
+
+    # Return success response
+    response = {
+        "statusCode": 200,
+        "body": orjson.dumps(
+            {
+                "message": "Participant updated successfully",
+                "participantId": participant_id,
+                "name": name,
+                "avatar": avatar,
+            }
+        ).decode(),
+    }
+
+    return add_cors_headers(response)
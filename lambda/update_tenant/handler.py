@@ -7,22 +7,26 @@ It updates tenant information (name, description, status) in the Tenants table.
 Endpoint: PUT /super-admin/tenants/{tenantId}
 """
 
-import json
+import logging
 import os
-import sys
-from datetime import datetime
-
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
 
 from cors import add_cors_headers
 from errors import error_response
-from db import get_item, update_item
+from db import iso_now, update_item
+from warmup import is_warmup_event, warmup_response
+import orjson
+from botocore.exceptions import ClientError
+
 
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 # Environment variables
 TENANTS_TABLE = os.environ.get("TENANTS_TABLE", "Tenants")
 
+# Allowed values for the status field
+VALID_STATUSES = frozenset({"active", "inactive"})
+
 
 def lambda_handler(event, context):
     """
@@ -52,6 +56,9 @@ def lambda_handler(event, context):
         Error (404): Tenant not found
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Get tenant ID from path parameters
         path_parameters = event.get("pathParameters", {})
@@ -67,22 +74,15 @@ def lambda_handler(event, context):
             return error_response(400, "INVALID_REQUEST", "Request body is required")
 
         try:
-            body = json.loads(event["body"])
-        except json.JSONDecodeError:
+            body = orjson.loads(event["body"])
+        except orjson.JSONDecodeError:
             return error_response(
                 400, "INVALID_JSON", "Request body must be valid JSON"
             )
 
-        # Check if tenant exists
-        try:
-            existing_tenant = get_item(TENANTS_TABLE, {"tenantId": tenant_id})
-        except Exception as e:
-            print(f"DynamoDB get error: {str(e)}")
-            return error_response(500, "DATABASE_ERROR", "Failed to retrieve tenant")
-
-        if not existing_tenant:
+        if type(body) is not dict:
             return error_response(
-                404, "TENANT_NOT_FOUND", f"Tenant with ID {tenant_id} not found"
+                400, "INVALID_REQUEST", "Request body must be a JSON object"
             )
 
         # Build update expression
@@ -104,7 +104,7 @@ def lambda_handler(event, context):
         # Update status if provided
         if "status" in body:
             status = body["status"]
-            if status not in ["active", "inactive"]:
+            if status not in VALID_STATUSES:
                 return error_response(
                     400,
                     "INVALID_FIELD_VALUE",
@@ -115,7 +115,7 @@ def lambda_handler(event, context):
             expression_names["#status"] = "status"
 
         # Always update updatedAt timestamp
-        now = datetime.utcnow().isoformat() + "Z"
+        now = iso_now()
         update_parts.append("updatedAt = :updatedAt")
         expression_values[":updatedAt"] = now
 
@@ -129,7 +129,8 @@ def lambda_handler(event, context):
         # Build update expression
         update_expression = "SET " + ", ".join(update_parts)
 
-        # Update tenant in DynamoDB
+        # Update tenant in DynamoDB. The condition replaces a separate
+        # existence read, so a missing tenant costs no extra round trip.
         try:
             updated_tenant = update_item(
                 TENANTS_TABLE,
@@ -137,24 +138,29 @@ def lambda_handler(event, context):
                 update_expression,
                 expression_values,
                 expression_names if expression_names else None,
+                condition_expression="attribute_exists(tenantId)",
             )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return error_response(
+                    404, "TENANT_NOT_FOUND", f"Tenant with ID {tenant_id} not found"
+                )
+            logger.warning("DynamoDB update error: %s", e)
+            return error_response(500, "DATABASE_ERROR", "Failed to update tenant")
         except Exception as e:
-            print(f"DynamoDB update error: {str(e)}")
+            logger.warning("DynamoDB update error: %s", e)
             return error_response(500, "DATABASE_ERROR", "Failed to update tenant")
 
         # Return success response
         response = {
             "statusCode": 200,
-            "body": json.dumps(updated_tenant),
+            "body": orjson.dumps(updated_tenant).decode(),
         }
 
         return add_cors_headers(response)
 
-    except Exception as e:
+    except Exception:
         # Log unexpected errors
-        print(f"Unexpected error in update tenant: {str(e)}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("Unexpected error in update tenant")
 
         return error_response(500, "INTERNAL_ERROR", "An unexpected error occurred")
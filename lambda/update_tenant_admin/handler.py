@@ -7,18 +7,18 @@ It supports updating username, email, and tenantId (reassignment).
 Endpoint: PUT /super-admin/admins/{adminId}
 """
 
-import json
+import logging
 import os
-import sys
-from datetime import datetime
-
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
 
 from cors import add_cors_headers
 from errors import error_response
-from db import get_item, update_item, query
+from db import get_item, iso_now, update_item, query
+from warmup import is_warmup_event, warmup_response
+import orjson
+
 
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 # Environment variables
 ADMINS_TABLE = os.environ.get("ADMINS_TABLE", "Admins")
@@ -56,6 +56,9 @@ def lambda_handler(event, context):
         Error (409): Username already exists
         Error (500): Internal server error
     """
+    if is_warmup_event(event):
+        return warmup_response()
+
     try:
         # Extract adminId from path parameters
         admin_id = event.get("pathParameters", {}).get("adminId")
@@ -67,17 +70,22 @@ def lambda_handler(event, context):
             return error_response(400, "INVALID_REQUEST", "Request body is required")
 
         try:
-            body = json.loads(event["body"])
-        except json.JSONDecodeError:
+            body = orjson.loads(event["body"])
+        except orjson.JSONDecodeError:
             return error_response(
                 400, "INVALID_JSON", "Request body must be valid JSON"
             )
 
+        if type(body) is not dict:
+            return error_response(
+                400, "INVALID_REQUEST", "Request body must be a JSON object"
+            )
+
         # Check if admin exists
         try:
             admin = get_item(ADMINS_TABLE, {"adminId": admin_id})
         except Exception as e:
-            print(f"DynamoDB get error: {str(e)}")
+            logger.warning("DynamoDB get error: %s", e)
             return error_response(500, "DATABASE_ERROR", "Failed to query admin")
 
         if not admin:
@@ -98,15 +106,14 @@ def lambda_handler(event, context):
                     "username = :username",
                     {":username": new_username},
                     index_name="UsernameIndex",
+                    limit=1,
                 )
             except Exception as e:
-                print(f"DynamoDB query error: {str(e)}")
+                logger.warning("DynamoDB query error: %s", e)
                 return error_response(500, "DATABASE_ERROR", "Failed to check username")
 
-            # Filter out the current admin from results
-            existing_admins = [a for a in existing_admins if a["adminId"] != admin_id]
-
-            if existing_admins and len(existing_admins) > 0:
+            # Usernames are unique, so at most one admin can hold it
+            if existing_admins and existing_admins[0]["adminId"] != admin_id:
                 return error_response(
                     409, "DUPLICATE_USERNAME", "Username already exists"
                 )
@@ -128,7 +135,7 @@ def lambda_handler(event, context):
             try:
                 tenant = get_item(TENANTS_TABLE, {"tenantId": new_tenant_id})
             except Exception as e:
-                print(f"DynamoDB get error: {str(e)}")
+                logger.warning("DynamoDB get error: %s", e)
                 return error_response(500, "DATABASE_ERROR", "Failed to query tenant")
 
             if not tenant:
@@ -151,15 +158,15 @@ def lambda_handler(event, context):
         # If no updates, return current admin
         if not update_parts:
             # Remove password hash from response
-            safe_admin = {k: v for k, v in admin.items() if k != "passwordHash"}
+            admin.pop("passwordHash", None)
             response = {
                 "statusCode": 200,
-                "body": json.dumps(safe_admin),
+                "body": orjson.dumps(admin).decode(),
             }
             return add_cors_headers(response)
 
         # Add updatedAt timestamp
-        now = datetime.utcnow().isoformat() + "Z"
+        now = iso_now()
         update_parts.append("updatedAt = :updatedAt")
         expression_values[":updatedAt"] = now
 
@@ -178,25 +185,22 @@ def lambda_handler(event, context):
                 else None,
             )
         except Exception as e:
-            print(f"DynamoDB update error: {str(e)}")
+            logger.warning("DynamoDB update error: %s", e)
             return error_response(500, "DATABASE_ERROR", "Failed to update admin")
 
         # Remove password hash from response
-        safe_admin = {k: v for k, v in updated_admin.items() if k != "passwordHash"}
+        updated_admin.pop("passwordHash", None)
 
         # Return success response
         response = {
             "statusCode": 200,
-            "body": json.dumps(safe_admin),
+            "body": orjson.dumps(updated_admin).decode(),
         }
 
         return add_cors_headers(response)
 
-    except Exception as e:
+    except Exception:
         # Log unexpected errors
-        print(f"Unexpected error in update tenant admin: {str(e)}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("Unexpected error in update tenant admin")
 
         return error_response(500, "INTERNAL_ERROR", "An unexpected error occurred")
@@ -7,26 +7,33 @@ It validates the admin JWT token, generates a unique S3 key, and uploads the aud
 Endpoint: POST /admin/audio
 """
 
-import json
+import logging
 import os
-import sys
-import uuid
-import base64
-from datetime import datetime
+import secrets
+import binascii
+from concurrent.futures import ThreadPoolExecutor, wait
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
-from auth import validate_token
+from auth import ADMIN_ROLES, extract_bearer, validate_token
 from cors import add_cors_headers
-from errors import error_response
-from db import get_item
+from errors import (
+    ADMIN_ROLE_REQUIRED_RESPONSE,
+    INVALID_TOKEN_RESPONSE,
+    TOKEN_EXPIRED_RESPONSE,
+    error_response,
+)
+from db import ddb_client, get_item
+from metrics import emit_metric
 from tenant_middleware import validate_tenant_access
+from warmup import is_warmup_event, prime_connection, warmup_response
+import orjson
 import jwt
 import boto3
 from botocore.exceptions import ClientError
 
 
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
 # Environment variables
 AUDIO_BUCKET = os.environ.get("AUDIO_BUCKET", "music-quiz-audio")
 QUIZ_SESSIONS_TABLE = os.environ.get("QUIZ_SESSIONS_TABLE", "MusicQuiz-Sessions")
@@ -34,6 +41,106 @@ QUIZ_SESSIONS_TABLE = os.environ.get("QUIZ_SESSIONS_TABLE", "MusicQuiz-Sessions"
 # Initialize S3 client
 s3_client = boto3.client("s3")
 
+# Open the S3 and DynamoDB connections during INIT rather than on first use
+prime_connection(s3_client.head_bucket, Bucket=AUDIO_BUCKET)
+prime_connection(ddb_client.describe_table, TableName=QUIZ_SESSIONS_TABLE)
+
+# Base64 audio is decoded and uploaded one multipart part at a time, so only
+# a few decoded parts are resident next to the encoded request body. Parts
+# must be at least 5 MiB (except the last); each part maps to a whole number
+# of 4-character base64 groups.
+UPLOAD_PART_SIZE = 5 * 1024 * 1024
+UPLOAD_PART_B64_CHARS = -(-UPLOAD_PART_SIZE // 3) * 4
+
+# Parts in flight at once; the next part is decoded while these upload
+UPLOAD_CONCURRENCY = 2
+_upload_executor = ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY)
+
+# Lifetime of pre-signed PUT URLs handed out for direct browser uploads
+UPLOAD_URL_EXPIRATION_SECONDS = 900
+
+# CloudWatch namespace for upload failure counters
+METRICS_NAMESPACE = "MusicQuiz/Upload"
+
+
+def upload_base64_audio(audio_key, audio_data_b64, content_type):
+    """
+    Decode base64 audio data and upload it to S3 in bounded chunks.
+
+    Payloads that fit in a single part are uploaded with one PutObject;
+    larger ones are decoded part by part into a multipart upload. Up to
+    UPLOAD_CONCURRENCY parts upload in the background while the next one is
+    decoded, and the upload is aborted if decoding or any part upload fails.
+
+    Args:
+        audio_key (str): S3 key of the audio object
+        audio_data_b64 (str): Base64 encoded audio data
+        content_type (str): Content type of the audio object
+
+    Raises:
+        binascii.Error: If audio_data_b64 is not valid base64
+        ClientError: If the S3 upload fails
+    """
+    # Accept line-wrapped (MIME) base64, which would otherwise shift the part
+    # boundaries off whole 4-character groups; any other character outside
+    # the alphabet is rejected by the strict decodes below, whatever the size
+    audio_data_b64 = "".join(audio_data_b64.split())
+
+    if len(audio_data_b64) <= UPLOAD_PART_B64_CHARS:
+        s3_client.put_object(
+            Bucket=AUDIO_BUCKET,
+            Key=audio_key,
+            Body=binascii.a2b_base64(audio_data_b64, strict_mode=True),
+            ContentType=content_type,
+        )
+        return
+
+    upload_id = s3_client.create_multipart_upload(
+        Bucket=AUDIO_BUCKET, Key=audio_key, ContentType=content_type
+    )["UploadId"]
+
+    def upload_part(part_number, chunk):
+        part = s3_client.upload_part(
+            Bucket=AUDIO_BUCKET,
+            Key=audio_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=chunk,
+        )
+        return {"PartNumber": part_number, "ETag": part["ETag"]}
+
+    parts = []
+    in_flight = []
+    try:
+        starts = range(0, len(audio_data_b64), UPLOAD_PART_B64_CHARS)
+        for part_number, start in enumerate(starts, start=1):
+            chunk = binascii.a2b_base64(
+                audio_data_b64[start : start + UPLOAD_PART_B64_CHARS],
+                strict_mode=True,
+            )
+            # Wait for the oldest part before queueing another, which bounds
+            # the decoded bytes held in memory
+            if len(in_flight) >= UPLOAD_CONCURRENCY:
+                parts.append(in_flight.pop(0).result())
+            in_flight.append(_upload_executor.submit(upload_part, part_number, chunk))
+
+        while in_flight:
+            parts.append(in_flight.pop(0).result())
+
+        s3_client.complete_multipart_upload(
+            Bucket=AUDIO_BUCKET,
+            Key=audio_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except Exception:
+        # Let running part uploads finish so none land after the abort
+        wait(in_flight)
+        s3_client.abort_multipart_upload(
+            Bucket=AUDIO_BUCKET, Key=audio_key, UploadId=upload_id
+        )
+        raise
+
 
 def lambda_handler(event, context):
     """
@@ -43,19 +150,32 @@ def lambda_handler(event, context):
         Authorization: Bearer <jwt_token>
         Content-Type: audio/* or application/json (for base64)
 
-    Expected input (JSON with base64):
+    Expected input (JSON for a direct upload to S3):
+        {
+            "fileName": "song.mp3",
+            "sessionId": "uuid"
+        }
+
+    Or JSON with base64 audio uploaded through the Lambda (legacy):
         {
             "audioData": "base64_encoded_audio",
             "fileName": "song.mp3",
             "sessionId": "uuid"
         }
 
-    Or raw binary data in body with query parameters
+    Or a binary body (base64-encoded by API Gateway) with query parameters
 
     Returns:
-        Success (201):
+        Success (201), direct upload - the client PUTs the file to uploadUrl
+        with the same Content-Type (audio/<extension>):
+            {
+                "audioKey": "sessions/{sessionId}/audio/{hex_id}.mp3",
+                "uploadUrl": "presigned_put_url"
+            }
+
+        Success (201), uploaded through the Lambda:
             {
-                "audioKey": "sessions/{sessionId}/audio/{uuid}.mp3",
+                "audioKey": "sessions/{sessionId}/audio/{hex_id}.mp3",
                 "url": "presigned_url"
             }
 
@@ -64,55 +184,50 @@ def lambda_handler(event, context):
         Error (403): Insufficient permissions
         Error (500): Internal server error
     """
-    try:
-        # Validate Authorization header
-        headers = event.get("headers", {})
-        auth_header = headers.get("Authorization") or headers.get("authorization")
-
-        if not auth_header:
-            return error_response(
-                401, "MISSING_TOKEN", "Authorization header is required"
-            )
+    if is_warmup_event(event):
+        return warmup_response()
 
-        # Extract token from "Bearer <token>" format
-        if not auth_header.startswith("Bearer "):
-            return error_response(
-                401,
-                "INVALID_AUTH_FORMAT",
-                "Authorization header must be 'Bearer <token>'",
-            )
+    try:
+        # Lower-case header names once; HTTP header names are case-insensitive
+        headers = {k.lower(): v for k, v in (event.get("headers") or {}).items()}
 
-        token = auth_header[7:]  # Remove "Bearer " prefix
+        # Validate Authorization header
+        token, auth_error = extract_bearer(headers)
+        if auth_error:
+            return auth_error
 
         # Validate JWT token
         try:
             payload = validate_token(token)
         except jwt.ExpiredSignatureError:
-            return error_response(401, "TOKEN_EXPIRED", "Token has expired")
+            return TOKEN_EXPIRED_RESPONSE
         except jwt.InvalidTokenError:
-            return error_response(401, "INVALID_TOKEN", "Invalid token")
+            return INVALID_TOKEN_RESPONSE
 
         # Check if user has admin role
-        role = payload.get("role", "admin")
-        if role not in ["admin", "tenant_admin", "super_admin"]:
-            return error_response(
-                403, "INSUFFICIENT_PERMISSIONS", "Admin role required"
-            )
+        role = payload.get("role")
+        if role not in ADMIN_ROLES:
+            return ADMIN_ROLE_REQUIRED_RESPONSE
 
-        # Extract tenant ID from token
+        # Extract tenant ID from token and create tenant context
         admin_tenant_id = payload.get("tenantId")
+        tenant_context = {
+            "adminId": payload.get("sub"),
+            "role": role,
+            "tenantId": admin_tenant_id,
+        }
 
         # Parse request body
         if not event.get("body"):
             return error_response(400, "INVALID_REQUEST", "Request body is required")
 
-        content_type = headers.get("Content-Type") or headers.get("content-type", "")
+        content_type = headers.get("content-type", "")
 
         # Handle JSON with base64 encoded audio
         if "application/json" in content_type:
             try:
-                body = json.loads(event["body"])
-            except json.JSONDecodeError:
+                body = orjson.loads(event["body"])
+            except orjson.JSONDecodeError:
                 return error_response(
                     400, "INVALID_JSON", "Request body must be valid JSON"
                 )
@@ -121,7 +236,7 @@ def lambda_handler(event, context):
             file_name = body.get("fileName", "audio.mp3")
             session_id = body.get("sessionId")
 
-            if not audio_data_b64:
+            if "audioData" in body and not audio_data_b64:
                 return error_response(
                     400,
                     "MISSING_FIELDS",
@@ -137,26 +252,22 @@ def lambda_handler(event, context):
                     {"required_fields": ["sessionId"]},
                 )
 
-            # Decode base64 audio data
-            try:
-                audio_data = base64.b64decode(audio_data_b64)
-            except Exception as e:
-                print(f"Base64 decode error: {str(e)}")
+            # Decoded while uploading, after the session checks
+            if audio_data_b64 is not None and not isinstance(audio_data_b64, str):
                 return error_response(
                     400, "INVALID_AUDIO_DATA", "audioData must be valid base64"
                 )
 
         else:
-            # Handle raw binary data
-            audio_data = event["body"]
-            if event.get("isBase64Encoded"):
-                audio_data = base64.b64decode(audio_data)
-            else:
-                audio_data = (
-                    audio_data.encode("utf-8")
-                    if isinstance(audio_data, str)
-                    else audio_data
+            # Handle binary data; API Gateway base64-encodes binary bodies, so
+            # anything else is text that was never audio
+            if not event.get("isBase64Encoded"):
+                return error_response(
+                    400,
+                    "INVALID_BINARY",
+                    "Binary upload must be base64-encoded by API Gateway",
                 )
+            audio_data_b64 = event["body"]
 
             # Get session ID from query parameters
             query_params = event.get("queryStringParameters") or {}
@@ -174,7 +285,7 @@ def lambda_handler(event, context):
         try:
             session = get_item(QUIZ_SESSIONS_TABLE, {"sessionId": session_id})
         except Exception as e:
-            print(f"DynamoDB get error for session: {str(e)}")
+            logger.warning("DynamoDB get error for session: %s", e)
             return error_response(500, "DATABASE_ERROR", "Failed to retrieve session")
 
         if not session:
@@ -190,19 +301,48 @@ def lambda_handler(event, context):
         file_extension = file_name.split(".")[-1] if "." in file_name else "mp3"
 
         # Generate unique S3 key
-        unique_id = str(uuid.uuid4())
+        unique_id = secrets.token_hex(16)
         audio_key = f"sessions/{session_id}/audio/{unique_id}.{file_extension}"
 
+        # Without audio data, hand out a pre-signed PUT URL so the client
+        # uploads straight to S3 instead of through API Gateway and Lambda
+        if audio_data_b64 is None:
+            try:
+                upload_url = s3_client.generate_presigned_url(
+                    "put_object",
+                    Params={
+                        "Bucket": AUDIO_BUCKET,
+                        "Key": audio_key,
+                        "ContentType": f"audio/{file_extension}",
+                    },
+                    ExpiresIn=UPLOAD_URL_EXPIRATION_SECONDS,
+                )
+            except ClientError as e:
+                logger.warning("Presigned upload URL generation error: %s", e)
+                return error_response(
+                    500, "UPLOAD_ERROR", "Failed to create audio upload URL"
+                )
+
+            response = {
+                "statusCode": 201,
+                "body": orjson.dumps(
+                    {"audioKey": audio_key, "uploadUrl": upload_url}
+                ).decode(),
+            }
+
+            return add_cors_headers(response)
+
         # Upload to S3
         try:
-            s3_client.put_object(
-                Bucket=AUDIO_BUCKET,
-                Key=audio_key,
-                Body=audio_data,
-                ContentType=f"audio/{file_extension}",
+            upload_base64_audio(audio_key, audio_data_b64, f"audio/{file_extension}")
+        except binascii.Error as e:
+            logger.warning("Base64 decode error: %s", e)
+            return error_response(
+                400, "INVALID_AUDIO_DATA", "audioData must be valid base64"
             )
         except ClientError as e:
-            print(f"S3 upload error: {str(e)}")
+            logger.warning("S3 upload error: %s", e)
+            emit_metric(METRICS_NAMESPACE, "S3UploadError")
             return error_response(500, "UPLOAD_ERROR", "Failed to upload audio file")
 
         # Generate presigned URL (valid for 1 hour)
@@ -213,7 +353,7 @@ def lambda_handler(event, context):
                 ExpiresIn=3600,
             )
         except ClientError as e:
-            print(f"Presigned URL generation error: {str(e)}")
+            logger.warning("Presigned URL generation error: %s", e)
             # File uploaded but URL generation failed - still return success
             presigned_url = None
 
@@ -224,16 +364,13 @@ def lambda_handler(event, context):
 
         response = {
             "statusCode": 201,
-            "body": json.dumps(response_body),
+            "body": orjson.dumps(response_body).decode(),
         }
 
         return add_cors_headers(response)
 
-    except Exception as e:
+    except Exception:
         # Log unexpected errors
-        print(f"Unexpected error in upload audio: {str(e)}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("Unexpected error in upload audio")
 
         return error_response(500, "INTERNAL_ERROR", "An unexpected error occurred")
@@ -7,26 +7,31 @@ It validates the admin JWT token, generates a unique S3 key, and uploads the ima
 Endpoint: POST /admin/image
 """
 
-import json
+import logging
 import os
-import sys
-import uuid
+import secrets
 import base64
-from datetime import datetime
 
-# Add common utilities to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "common"))
-
-from auth import validate_token
+from auth import ADMIN_ROLES, extract_bearer, validate_token
 from cors import add_cors_headers
-from errors import error_response
-from db import get_item
+from errors import (
+    ADMIN_ROLE_REQUIRED_RESPONSE,
+    INVALID_TOKEN_RESPONSE,
+    TOKEN_EXPIRED_RESPONSE,
+    error_response,
+)
+from db import ddb_client, get_item
 from tenant_middleware import validate_tenant_access
+from warmup import is_warmup_event, prime_connection, warmup_response
+import orjson
 import jwt
 import boto3
 from botocore.exceptions import ClientError
 
 
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
 # Environment variables
 AUDIO_BUCKET = os.environ.get("AUDIO_BUCKET", "music-quiz-audio")
 QUIZ_SESSIONS_TABLE = os.environ.get("QUIZ_SESSIONS_TABLE", "MusicQuiz-Sessions")
@@ -34,6 +39,10 @@ QUIZ_SESSIONS_TABLE = os.environ.get("QUIZ_SESSIONS_TABLE", "MusicQuiz-Sessions"
 # Initialize S3 client
 s3_client = boto3.client("s3")
 
+# Open the S3 and DynamoDB connections during INIT rather than on first use
+prime_connection(s3_client.head_bucket, Bucket=AUDIO_BUCKET)
+prime_connection(ddb_client.describe_table, TableName=QUIZ_SESSIONS_TABLE)
+
 
 def lambda_handler(event, context):
     """
@@ -55,7 +64,7 @@ def lambda_handler(event, context):
     Returns:
         Success (201):
             {
-                "imageKey": "sessions/{sessionId}/images/{uuid}.jpg",
+                "imageKey": "sessions/{sessionId}/images/{hex_id}.jpg",
                 "url": "presigned_url"
             }
 
@@ -64,55 +73,50 @@ def lambda_handler(event, context):
         Error (403): Insufficient permissions
         Error (500): Internal server error
     """
-    try:
-        # Validate Authorization header
-        headers = event.get("headers", {})
-        auth_header = headers.get("Authorization") or headers.get("authorization")
-
-        if not auth_header:
-            return error_response(
-                401, "MISSING_TOKEN", "Authorization header is required"
-            )
+    if is_warmup_event(event):
+        return warmup_response()
 
-        # Extract token from "Bearer <token>" format
-        if not auth_header.startswith("Bearer "):
-            return error_response(
-                401,
-                "INVALID_AUTH_FORMAT",
-                "Authorization header must be 'Bearer <token>'",
-            )
+    try:
+        # Lower-case header names once; HTTP header names are case-insensitive
+        headers = {k.lower(): v for k, v in (event.get("headers") or {}).items()}
 
-        token = auth_header[7:]  # Remove "Bearer " prefix
+        # Validate Authorization header
+        token, auth_error = extract_bearer(headers)
+        if auth_error:
+            return auth_error
 
         # Validate JWT token
         try:
             payload = validate_token(token)
         except jwt.ExpiredSignatureError:
-            return error_response(401, "TOKEN_EXPIRED", "Token has expired")
+            return TOKEN_EXPIRED_RESPONSE
         except jwt.InvalidTokenError:
-            return error_response(401, "INVALID_TOKEN", "Invalid token")
+            return INVALID_TOKEN_RESPONSE
 
         # Check if user has admin role
-        role = payload.get("role", "admin")
-        if role not in ["admin", "tenant_admin", "super_admin"]:
-            return error_response(
-                403, "INSUFFICIENT_PERMISSIONS", "Admin role required"
-            )
+        role = payload.get("role")
+        if role not in ADMIN_ROLES:
+            return ADMIN_ROLE_REQUIRED_RESPONSE
 
-        # Extract tenant ID from token
+        # Extract tenant ID from token and create tenant context
         admin_tenant_id = payload.get("tenantId")
+        tenant_context = {
+            "adminId": payload.get("sub"),
+            "role": role,
+            "tenantId": admin_tenant_id,
+        }
 
         # Parse request body
         if not event.get("body"):
             return error_response(400, "INVALID_REQUEST", "Request body is required")
 
-        content_type = headers.get("Content-Type") or headers.get("content-type", "")
+        content_type = headers.get("content-type", "")
 
         # Handle JSON with base64 encoded audio
         if "application/json" in content_type:
             try:
-                body = json.loads(event["body"])
-            except json.JSONDecodeError:
+                body = orjson.loads(event["body"])
+            except orjson.JSONDecodeError:
                 return error_response(
                     400, "INVALID_JSON", "Request body must be valid JSON"
                 )
@@ -141,7 +145,7 @@ def lambda_handler(event, context):
             try:
                 image_data = base64.b64decode(image_data_b64)
             except Exception as e:
-                print(f"Base64 decode error: {str(e)}")
+                logger.warning("Base64 decode error: %s", e)
                 return error_response(
                     400, "INVALID_IMAGE_DATA", "imageData must be valid base64"
                 )
@@ -174,7 +178,7 @@ def lambda_handler(event, context):
         try:
             session = get_item(QUIZ_SESSIONS_TABLE, {"sessionId": session_id})
         except Exception as e:
-            print(f"DynamoDB get error for session: {str(e)}")
+            logger.warning("DynamoDB get error for session: %s", e)
             return error_response(500, "DATABASE_ERROR", "Failed to retrieve session")
 
         if not session:
@@ -200,7 +204,7 @@ def lambda_handler(event, context):
             )
 
         # Generate unique S3 key
-        unique_id = str(uuid.uuid4())
+        unique_id = secrets.token_hex(16)
         image_key = f"sessions/{session_id}/images/{unique_id}.{file_extension}"
 
         # Determine content type
@@ -222,7 +226,7 @@ def lambda_handler(event, context):
                 ContentType=content_type,
             )
         except ClientError as e:
-            print(f"S3 upload error: {str(e)}")
+            logger.warning("S3 upload error: %s", e)
             return error_response(500, "UPLOAD_ERROR", "Failed to upload image file")
 
         # Generate presigned URL (valid for 1 hour)
@@ -233,7 +237,7 @@ def lambda_handler(event, context):
                 ExpiresIn=3600,
             )
         except ClientError as e:
-            print(f"Presigned URL generation error: {str(e)}")
+            logger.warning("Presigned URL generation error: %s", e)
             # File uploaded but URL generation failed - still return success
             presigned_url = None
 
@@ -244,16 +248,13 @@ def lambda_handler(event, context):
 
         response = {
             "statusCode": 201,
-            "body": json.dumps(response_body),
+            "body": orjson.dumps(response_body).decode(),
         }
 
         return add_cors_headers(response)
 
-    except Exception as e:
+    except Exception:
         # Log unexpected errors
-        print(f"Unexpected error in upload image: {str(e)}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("Unexpected error in upload image")
 
         return error_response(500, "INTERNAL_ERROR", "An unexpected error occurred")
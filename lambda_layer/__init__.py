@@ -1 +0,0 @@
-# Lambda layer package
@@ -14,6 +14,7 @@ import argparse
 import sys
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add lambda common directory to path for auth utilities
@@ -40,24 +41,33 @@ def create_admin_user(username, password, table_name="Admins"):
     dynamodb = boto3.resource("dynamodb")
     table = dynamodb.Table(table_name)
 
-    # Check if username already exists
-    try:
-        response = table.query(
-            IndexName="UsernameIndex",
-            KeyConditionExpression="username = :username",
-            ExpressionAttributeValues={":username": username},
-        )
-
-        if response.get("Items"):
-            print(f"Error: Admin user '{username}' already exists")
+    # Hash the password on a worker thread while the username check runs;
+    # the deliberately slow key derivation does not depend on the query
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        password_hash_future = executor.submit(hash_password, password)
+
+        # Check if username already exists; only the count of the first
+        # match is needed, not the stored admin records
+        try:
+            response = table.query(
+                IndexName="UsernameIndex",
+                KeyConditionExpression="username = :username",
+                ExpressionAttributeValues={":username": username},
+                Select="COUNT",
+                Limit=1,
+            )
+
+            if response.get("Count"):
+                print(f"Error: Admin user '{username}' already exists")
+                return None
+        except ClientError as e:
+            print(f"Error checking existing user: {str(e)}")
             return None
-    except ClientError as e:
-        print(f"Error checking existing user: {str(e)}")
-        return None
 
-    # Generate admin ID and hash password
+        password_hash = password_hash_future.result()
+
+    # Generate admin ID
     admin_id = str(uuid.uuid4())
-    password_hash = hash_password(password)
     created_at = datetime.utcnow().isoformat() + "Z"
 
     # Create admin item
@@ -14,55 +14,96 @@ Usage:
 import argparse
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add lambda common directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lambda", "common"))
 
 import boto3
+from boto3.dynamodb.conditions import Attr
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from throttling import retry_throttled
 
 # Default tenant ID (must match setup_default_tenant.py)
 DEFAULT_TENANT_ID = "00000000-0000-0000-0000-000000000001"
 
+# Number of parallel scan segments used to find unmigrated admins
+SCAN_SEGMENTS = 8
 
-def get_admins_without_tenant(table_name="Admins"):
+# Number of admin updates issued concurrently
+UPDATE_WORKERS = 16
+
+# Shared by all threads: keep-alive connections, one per worker and segment,
+# and adaptive retries so throttled writes back off instead of failing
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=UPDATE_WORKERS + SCAN_SEGMENTS,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+dynamodb = boto3.resource("dynamodb", config=DYNAMODB_CONFIG)
+
+
+def get_admins_without_tenant(table_name="Admins", segments=SCAN_SEGMENTS):
     """
     Query all admins that don't have a tenantId field.
 
+    The table is scanned as a parallel segmented scan, filtered server-side
+    and projected to the attributes the migration needs, so migrated admins
+    and unused attributes are never transferred.
+
     Args:
         table_name (str): DynamoDB table name
+        segments (int): Number of scan segments scanned in parallel
 
     Returns:
         list: List of admin items without tenantId
     """
-    dynamodb = boto3.resource("dynamodb")
     table = dynamodb.Table(table_name)
 
-    try:
-        # Scan for all admins
-        response = table.scan()
+    scan_params = {
+        "FilterExpression": Attr("tenantId").not_exists()
+        | Attr("tenantId").attribute_type("NULL"),
+        "ProjectionExpression": "#adminId, #username, #createdAt",
+        "ExpressionAttributeNames": {
+            "#adminId": "adminId",
+            "#username": "username",
+            "#createdAt": "createdAt",
+        },
+        "TotalSegments": segments,
+    }
+
+    def scan_segment(segment):
+        response = table.scan(Segment=segment, **scan_params)
         items = response.get("Items", [])
 
         # Handle pagination
         while "LastEvaluatedKey" in response:
-            response = table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
+            response = table.scan(
+                Segment=segment,
+                ExclusiveStartKey=response["LastEvaluatedKey"],
+                **scan_params,
+            )
             items.extend(response.get("Items", []))
 
-        # Filter admins without tenantId
-        admins_without_tenant = [
-            admin
-            for admin in items
-            if "tenantId" not in admin or admin.get("tenantId") is None
-        ]
+        return items
 
-        return admins_without_tenant
+    try:
+        with ThreadPoolExecutor(max_workers=segments) as executor:
+            return [
+                admin
+                for items in executor.map(scan_segment, range(segments))
+                for admin in items
+            ]
     except ClientError as e:
         print(f"Error querying admins: {str(e)}")
         return []
 
 
-def migrate_admin(admin, is_first_admin, table_name="Admins", dry_run=False):
+def migrate_admin(
+    admin, is_first_admin, table_name="Admins", dry_run=False, table=None
+):
     """
     Migrate a single admin to the multi-tenant model.
 
@@ -71,6 +112,8 @@ def migrate_admin(admin, is_first_admin, table_name="Admins", dry_run=False):
         is_first_admin (bool): Whether this is the first admin (becomes super_admin)
         table_name (str): DynamoDB table name
         dry_run (bool): If True, don't actually update the database
+        table (Table, optional): Table resource to reuse; created from
+            table_name if omitted
 
     Returns:
         bool: True if successful, False otherwise
@@ -95,8 +138,8 @@ def migrate_admin(admin, is_first_admin, table_name="Admins", dry_run=False):
         return True
 
     # Update the admin record
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table(table_name)
+    if table is None:
+        table = dynamodb.Table(table_name)
 
     try:
         # Use timezone-aware datetime
@@ -130,7 +173,8 @@ def migrate_admin(admin, is_first_admin, table_name="Admins", dry_run=False):
             update_expression += ", tenantId = :tenant_id"
             expression_attribute_values[":tenant_id"] = tenant_id
 
-        table.update_item(
+        retry_throttled(
+            table.update_item,
             Key={"adminId": admin_id},
             UpdateExpression=update_expression,
             ExpressionAttributeValues=expression_attribute_values,
@@ -143,7 +187,7 @@ def migrate_admin(admin, is_first_admin, table_name="Admins", dry_run=False):
         return False
 
 
-def main():
+def main(argv=None):
     """Main function to parse arguments and migrate admins."""
     parser = argparse.ArgumentParser(
         description="Migrate existing admins to multi-tenant model"
@@ -159,7 +203,7 @@ def main():
         help="Show what would be done without making changes",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     print("Starting admin migration...")
     if args.dry_run:
@@ -184,22 +228,26 @@ def main():
         elif isinstance(created_at, str):
             # ISO format string - convert to timestamp for sorting
             try:
-                from datetime import datetime
-
                 dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
                 return dt.timestamp()
-            except:
+            except ValueError:
                 return 0
         return 0
 
     admins.sort(key=get_sort_key)
 
-    # Migrate each admin
-    success_count = 0
-    for i, admin in enumerate(admins):
-        is_first = i == 0
-        if migrate_admin(admin, is_first, args.table_name, args.dry_run):
-            success_count += 1
+    # Migrate admins concurrently; the updates are independent, so their
+    # round trips overlap instead of running one after another
+    table = dynamodb.Table(args.table_name)
+
+    def migrate_at(index):
+        is_first = index == 0
+        return migrate_admin(
+            admins[index], is_first, args.table_name, args.dry_run, table
+        )
+
+    with ThreadPoolExecutor(max_workers=UPDATE_WORKERS) as executor:
+        success_count = sum(executor.map(migrate_at, range(len(admins))))
 
     print(
         f"\nMigration complete: {success_count}/{len(admins)} admins migrated successfully"
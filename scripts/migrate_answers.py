@@ -12,171 +12,215 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 
 # Add lambda common directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lambda", "common"))
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from migration_logging import start_logging
+from parallel_scan import parallel_scan
+from throttling import retry_throttled
+
+logger = logging.getLogger(__name__)
 
 # Default tenant ID (must match setup_default_tenant.py)
 DEFAULT_TENANT_ID = "00000000-0000-0000-0000-000000000001"
 
+# Default number of answers migrated concurrently (--concurrency)
+UPDATE_WORKERS = 32
+
+# Default number of scan segments read in parallel (--segments)
+SCAN_SEGMENTS = 16
+
+# Scanned answers between progress lines
+PROGRESS_INTERVAL = 1000
+
+# Shared by all threads: keep-alive connections, one per worker and segment,
+# and adaptive retries so throttled writes back off instead of failing
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=UPDATE_WORKERS + SCAN_SEGMENTS,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Low-level client: items stay in DynamoDB JSON ({"S": ...} attribute values),
+# so no per-item (de)serialization runs for fields that are only passed on
+dynamodb = boto3.client("dynamodb", config=DYNAMODB_CONFIG)
+
+# Update expression shared by every answer
+UPDATE_EXPRESSION = "SET tenantId = :tenant_id, participationId = :participation_id"
 
-def get_answers_without_tenant(table_name="Answers"):
+
+def string_value(item, name):
     """
-    Query all answers that don't have a tenantId field.
+    Read a string attribute from an item in DynamoDB JSON.
 
     Args:
-        table_name (str): DynamoDB table name
+        item (dict): Item as returned by the low-level client
+        name (str): Attribute name
 
     Returns:
-        list: List of answer items without tenantId
+        str: Attribute value, or None if the attribute is not a string
     """
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table(table_name)
+    return item.get(name, {}).get("S")
 
-    try:
-        # Scan for all answers
-        response = table.scan()
-        items = response.get("Items", [])
-
-        # Handle pagination
-        while "LastEvaluatedKey" in response:
-            response = table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(response.get("Items", []))
-
-        # Filter answers without tenantId
-        answers_without_tenant = [
-            answer
-            for answer in items
-            if "tenantId" not in answer or answer.get("tenantId") is None
-        ]
-
-        return answers_without_tenant
-    except ClientError as e:
-        print(f"Error querying answers: {str(e)}")
-        return []
 
+def get_answers_without_tenant(table_name="Answers", segments=SCAN_SEGMENTS):
+    """
+    Iterate over all answers that don't have a tenantId field.
+
+    The table is read as a parallel segmented scan, filtered server-side and
+    projected to the attributes the migration needs; pages are handed on as
+    they arrive.
 
-def get_session_tenant_id(session_id):
+    Args:
+        table_name (str): DynamoDB table name
+        segments (int): Number of scan segments read in parallel
+
+    Yields:
+        dict: Answer items without tenantId, in DynamoDB JSON
+
+    Raises:
+        ClientError: If the scan fails
+    """
+    yield from parallel_scan(
+        dynamodb,
+        segments,
+        TableName=table_name,
+        FilterExpression="attribute_not_exists(tenantId) OR attribute_type(tenantId, :null)",
+        ProjectionExpression="answerId, participantId, sessionId",
+        ExpressionAttributeValues={":null": {"S": "NULL"}},
+    )
+
+
+def load_session_tenants(segments=SCAN_SEGMENTS):
     """
-    Look up the tenantId for a session.
+    Load the tenantId of every session with one parallel segmented scan.
 
     Args:
-        session_id (str): Session ID
+        segments (int): Number of scan segments read in parallel
 
     Returns:
-        str: Tenant ID or DEFAULT_TENANT_ID if not found
-    """
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table("QuizSessions")
+        dict: Session ID -> tenant ID (DEFAULT_TENANT_ID when unset)
 
-    try:
-        response = table.get_item(Key={"sessionId": session_id})
-        if "Item" in response:
-            return response["Item"].get("tenantId", DEFAULT_TENANT_ID)
-        return DEFAULT_TENANT_ID
-    except ClientError:
-        return DEFAULT_TENANT_ID
+    Raises:
+        ClientError: If the scan fails
+    """
+    return {
+        string_value(session, "sessionId"): string_value(session, "tenantId")
+        or DEFAULT_TENANT_ID
+        for session in parallel_scan(
+            dynamodb,
+            segments,
+            TableName="QuizSessions",
+            ProjectionExpression="sessionId, tenantId",
+        )
+    }
 
 
-def get_participation_id(participant_id, session_id):
+def load_participation_index(segments=SCAN_SEGMENTS):
     """
-    Look up the participationId from SessionParticipations.
+    Load every session participation with one parallel segmented scan.
 
     Args:
-        participant_id (str): Participant ID
-        session_id (str): Session ID
+        segments (int): Number of scan segments read in parallel
 
     Returns:
-        str: Participation ID or None if not found
-    """
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table("SessionParticipations")
+        dict: (participant ID, session ID) -> participation ID
 
-    try:
-        # Query by ParticipantIndex
-        response = table.query(
-            IndexName="ParticipantIndex",
-            KeyConditionExpression="participantId = :pid",
-            ExpressionAttributeValues={":pid": participant_id},
+    Raises:
+        ClientError: If the scan fails
+    """
+    participation_index = {}
+
+    for participation in parallel_scan(
+        dynamodb,
+        segments,
+        TableName="SessionParticipations",
+        ProjectionExpression="participationId, participantId, sessionId",
+    ):
+        key = (
+            string_value(participation, "participantId"),
+            string_value(participation, "sessionId"),
         )
+        participation_index[key] = string_value(participation, "participationId")
 
-        # Find the participation for this session
-        for participation in response.get("Items", []):
-            if participation.get("sessionId") == session_id:
-                return participation.get("participationId")
-
-        return None
-    except ClientError as e:
-        print(f"      Error looking up participation: {str(e)}")
-        return None
+    return participation_index
 
 
-def migrate_answer(answer, dry_run=False):
+def migrate_answer(answer, participation_index, session_tenants, dry_run=False):
     """
     Migrate a single answer to the multi-tenant model.
 
     Args:
-        answer (dict): Answer item to migrate
+        answer (dict): Answer item to migrate, in DynamoDB JSON
+        participation_index (dict): From load_participation_index()
+        session_tenants (dict): From load_session_tenants()
         dry_run (bool): If True, don't actually update the database
 
     Returns:
         bool: True if successful, False otherwise
     """
-    answer_id = answer.get("answerId")
-    participant_id = answer.get("participantId")
-    session_id = answer.get("sessionId")
-
-    print(f"  Migrating answer {answer_id}")
+    answer_id = string_value(answer, "answerId")
+    participant_id = string_value(answer, "participantId")
+    session_id = string_value(answer, "sessionId")
 
     # Look up session's tenantId
-    tenant_id = get_session_tenant_id(session_id)
-    print(f"    Session tenant: {tenant_id}")
+    tenant_id = session_tenants.get(session_id, DEFAULT_TENANT_ID)
 
     # Look up participationId
-    participation_id = get_participation_id(participant_id, session_id)
+    participation_id = participation_index.get((participant_id, session_id))
     if not participation_id:
-        print(
-            f"    Warning: Could not find participationId for participant {participant_id} in session {session_id}"
+        logger.warning(
+            "Skipping answer %s: no participationId for participant %s in session %s",
+            answer_id,
+            participant_id,
+            session_id,
         )
-        print(f"    Skipping this answer")
         return False
 
-    print(f"    Participation ID: {participation_id}")
-
     if dry_run:
-        print(
-            f"    [DRY RUN] Would set tenantId={tenant_id}, participationId={participation_id}"
+        logger.info(
+            "[DRY RUN] Would set tenantId=%s, participationId=%s on answer %s",
+            tenant_id,
+            participation_id,
+            answer_id,
         )
         return True
 
     # Update the answer record
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table("Answers")
-
     try:
-        table.update_item(
-            Key={"answerId": answer_id},
-            UpdateExpression="SET tenantId = :tenant_id, participationId = :participation_id",
+        retry_throttled(
+            dynamodb.update_item,
+            TableName="Answers",
+            Key={"answerId": answer["answerId"]},
+            UpdateExpression=UPDATE_EXPRESSION,
             ExpressionAttributeValues={
-                ":tenant_id": tenant_id,
-                ":participation_id": participation_id,
+                ":tenant_id": {"S": tenant_id},
+                ":participation_id": {"S": participation_id},
             },
         )
 
-        print(f"    Successfully migrated answer")
+        logger.info(
+            "Migrated answer %s (tenantId=%s, participationId=%s)",
+            answer_id,
+            tenant_id,
+            participation_id,
+        )
         return True
     except ClientError as e:
-        print(f"    Error migrating answer: {str(e)}")
+        logger.error("Error migrating answer %s: %s", answer_id, e)
         return False
 
 
-def main():
+def main(argv=None):
     """Main function to parse arguments and migrate answers."""
     parser = argparse.ArgumentParser(
         description="Migrate existing answers to multi-tenant model"
@@ -186,34 +230,85 @@ def main():
         action="store_true",
         help="Show what would be done without making changes",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=UPDATE_WORKERS,
+        help=f"Number of answers migrated concurrently (default: {UPDATE_WORKERS})",
+    )
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=SCAN_SEGMENTS,
+        help=f"Number of scan segments read in parallel (default: {SCAN_SEGMENTS})",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log every migrated item (always on with --dry-run)",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    listener, log_handler = start_logging(args.verbose or args.dry_run)
 
     print("Starting answer migration...")
     if args.dry_run:
         print("[DRY RUN MODE - No changes will be made]\n")
 
-    # Get answers without tenant
-    answers = get_answers_without_tenant()
+    # Migrate answers concurrently as the scan returns them; the updates are
+    # independent, so their round trips overlap. The number of answers in
+    # flight is bounded so the scan is not read ahead unbounded.
+    answer_count = 0
+    success_count = 0
+    scan_error = None
+    try:
+        # Look up session tenants and participations once instead of per answer
+        try:
+            session_tenants = load_session_tenants(args.segments)
+            participation_index = load_participation_index(args.segments)
+        except ClientError as e:
+            print(f"Error loading sessions and participations: {str(e)}")
+            sys.exit(1)
+
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            pending = set()
+            for answer in get_answers_without_tenant(segments=args.segments):
+                answer_count += 1
+                if answer_count % PROGRESS_INTERVAL == 0:
+                    print(f"  ... {answer_count} answers scanned")
+                pending.add(
+                    executor.submit(
+                        migrate_answer,
+                        answer,
+                        participation_index,
+                        session_tenants,
+                        args.dry_run,
+                    )
+                )
+                if len(pending) >= 2 * args.concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    success_count += sum(future.result() for future in done)
+            success_count += sum(future.result() for future in wait(pending).done)
+    except ClientError as e:
+        # A failed scan leaves answers unmigrated, even if some were already read
+        scan_error = e
+    finally:
+        # Write out all per-item log lines before the summary
+        listener.stop()
+        logging.getLogger().removeHandler(log_handler)
+
+    if scan_error:
+        print(f"\nError scanning answers: {str(scan_error)}")
+        sys.exit(1)
+
+    skipped_count = answer_count - success_count
 
-    if not answers:
+    if not answer_count:
         print("No answers found that need migration.")
         sys.exit(0)
 
-    print(f"Found {len(answers)} answer(s) to migrate:\n")
-
-    # Migrate each answer
-    success_count = 0
-    skipped_count = 0
-    for answer in answers:
-        result = migrate_answer(answer, args.dry_run)
-        if result:
-            success_count += 1
-        else:
-            skipped_count += 1
-
     print(
-        f"\nMigration complete: {success_count}/{len(answers)} answers migrated successfully"
+        f"\nMigration complete: {success_count}/{answer_count} answers migrated successfully"
     )
     if skipped_count > 0:
         print(f"Skipped {skipped_count} answers due to missing participation records")
@@ -222,7 +317,7 @@ def main():
         print("\nThis was a dry run. Run without --dry-run to apply changes.")
         sys.exit(0)
 
-    if success_count == len(answers):
+    if success_count == answer_count:
         sys.exit(0)
     else:
         sys.exit(1)
@@ -12,8 +12,12 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
 import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 import uuid
 from datetime import datetime
 
@@ -21,94 +25,137 @@ from datetime import datetime
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lambda", "common"))
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from migration_logging import start_logging
+from parallel_scan import parallel_scan
+from throttling import retry_throttled
+
+logger = logging.getLogger(__name__)
 
 # Default tenant ID (must match setup_default_tenant.py)
 DEFAULT_TENANT_ID = "00000000-0000-0000-0000-000000000001"
 
+# Default number of participants migrated concurrently (--concurrency)
+UPDATE_WORKERS = 32
 
-def get_legacy_participants(table_name="Participants"):
-    """
-    Query all participants from the legacy Participants table.
-
-    Args:
-        table_name (str): DynamoDB table name
-
-    Returns:
-        list: List of legacy participant items
-    """
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table(table_name)
+# Default number of scan segments read in parallel (--segments)
+SCAN_SEGMENTS = 16
 
-    try:
-        # Scan for all participants
-        response = table.scan()
-        items = response.get("Items", [])
+# Scanned participants between progress lines
+PROGRESS_INTERVAL = 1000
 
-        # Handle pagination
-        while "LastEvaluatedKey" in response:
-            response = table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(response.get("Items", []))
+# Participants looked up per BatchGetItem request (the DynamoDB maximum)
+BATCH_GET_SIZE = 100
 
-        return items
-    except ClientError as e:
-        print(f"Error querying legacy participants: {str(e)}")
-        return []
+# Shared by all threads: keep-alive connections, one per worker and segment,
+# and adaptive retries so throttled writes back off instead of failing
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=UPDATE_WORKERS + SCAN_SEGMENTS,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+dynamodb = boto3.resource("dynamodb", config=DYNAMODB_CONFIG)
+global_participants_table = dynamodb.Table("GlobalParticipants")
+session_participations_table = dynamodb.Table("SessionParticipations")
 
 
-def check_global_participant_exists(participant_id, table_name="GlobalParticipants"):
+def get_legacy_participants(table_name="Participants", segments=SCAN_SEGMENTS):
     """
-    Check if a global participant already exists.
+    Iterate over all participants in the legacy Participants table.
+
+    The table is read as a parallel segmented scan and pages are handed on
+    as they arrive, so only a few pages are held in memory at a time.
 
     Args:
-        participant_id (str): Participant ID to check
         table_name (str): DynamoDB table name
+        segments (int): Number of scan segments read in parallel
 
-    Returns:
-        bool: True if exists, False otherwise
+    Yields:
+        dict: Legacy participant items
+
+    Raises:
+        ClientError: If the scan fails
     """
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table(table_name)
+    yield from parallel_scan(dynamodb.meta.client, segments, TableName=table_name)
 
-    try:
-        response = table.get_item(Key={"participantId": participant_id})
-        return "Item" in response
-    except ClientError:
-        return False
 
+def get_existing_global_participant_ids(participant_ids):
+    """
+    Find which participants already have a global participant record.
+
+    Looks up BATCH_GET_SIZE keys per BatchGetItem request, retrying
+    unprocessed keys with exponential backoff.
 
-def create_global_participant(participant, dry_run=False):
+    Args:
+        participant_ids (set): Participant IDs to check
+
+    Returns:
+        set: IDs of the participants that already exist
+
+    Raises:
+        ClientError: If DynamoDB operation fails
     """
-    Create a GlobalParticipants record from a legacy participant.
+    table_name = global_participants_table.name
+    keys = [{"participantId": participant_id} for participant_id in participant_ids]
+    existing_ids = set()
+
+    for start in range(0, len(keys), BATCH_GET_SIZE):
+        request = {
+            table_name: {
+                "Keys": keys[start : start + BATCH_GET_SIZE],
+                "ProjectionExpression": "participantId",
+            }
+        }
+        attempt = 0
+
+        while request:
+            response = retry_throttled(dynamodb.batch_get_item, RequestItems=request)
+            existing_ids.update(
+                item["participantId"]
+                for item in response.get("Responses", {}).get(table_name, [])
+            )
+            request = response.get("UnprocessedKeys")
+            if request:
+                time.sleep(min(0.05 * 2**attempt, 5))
+                attempt += 1
+
+    return existing_ids
+
+
+def build_global_participant(participant, exists, dry_run=False):
+    """
+    Build the GlobalParticipants record for a legacy participant.
 
     Args:
         participant (dict): Legacy participant item
-        dry_run (bool): If True, don't actually update the database
+        exists (bool): Whether the global participant was already created
+        dry_run (bool): If True, only report what would be created
 
     Returns:
-        bool: True if successful, False otherwise
+        dict: GlobalParticipants item to write, None if it already exists
+            or in a dry run
     """
     participant_id = participant.get("participantId")
     name = participant.get("name", "Unknown")
     avatar = participant.get("avatar", "😀")
 
     # Check if already migrated
-    if check_global_participant_exists(participant_id):
-        print(
-            f"    Global participant already exists for {name} (ID: {participant_id})"
+    if exists:
+        logger.info(
+            "Global participant already exists for %s (ID: %s)", name, participant_id
         )
-        return True
-
-    print(f"    Creating global participant for {name} (ID: {participant_id})")
+        return None
 
     if dry_run:
-        print(f"      [DRY RUN] Would create GlobalParticipants record")
-        return True
+        logger.info(
+            "[DRY RUN] Would create GlobalParticipants record for %s (ID: %s)",
+            name,
+            participant_id,
+        )
+        return None
 
     # Create global participant record
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table("GlobalParticipants")
-
     global_participant = {
         "participantId": participant_id,
         "tenantId": DEFAULT_TENANT_ID,
@@ -122,43 +169,35 @@ def create_global_participant(participant, dry_run=False):
     if "token" in participant:
         global_participant["token"] = participant["token"]
 
-    try:
-        table.put_item(Item=global_participant)
-        print(f"      Successfully created global participant")
-        return True
-    except ClientError as e:
-        print(f"      Error creating global participant: {str(e)}")
-        return False
+    return global_participant
 
 
-def create_session_participation(participant, dry_run=False):
+def build_session_participation(participant, dry_run=False):
     """
-    Create a SessionParticipations record from a legacy participant.
+    Build the SessionParticipations record for a legacy participant.
 
     Args:
         participant (dict): Legacy participant item
-        dry_run (bool): If True, don't actually update the database
+        dry_run (bool): If True, only report what would be created
 
     Returns:
-        bool: True if successful, False otherwise
+        dict: SessionParticipations item to write, None in a dry run
     """
     participant_id = participant.get("participantId")
     session_id = participant.get("sessionId")
     name = participant.get("name", "Unknown")
 
-    print(f"    Creating session participation for {name} in session {session_id}")
-
     if dry_run:
-        print(f"      [DRY RUN] Would create SessionParticipations record")
-        return True
+        logger.info(
+            "[DRY RUN] Would create SessionParticipations record for %s in session %s",
+            name,
+            session_id,
+        )
+        return None
 
     # Create session participation record
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table("SessionParticipations")
-
-    participation_id = str(uuid.uuid4())
-    participation = {
-        "participationId": participation_id,
+    return {
+        "participationId": str(uuid.uuid4()),
         "participantId": participant_id,
         "sessionId": session_id,
         "tenantId": DEFAULT_TENANT_ID,
@@ -167,49 +206,70 @@ def create_session_participation(participant, dry_run=False):
         "correctAnswers": participant.get("correctAnswers", 0),
     }
 
-    try:
-        table.put_item(Item=participation)
-        print(
-            f"      Successfully created session participation (ID: {participation_id})"
-        )
-        return True
-    except ClientError as e:
-        print(f"      Error creating session participation: {str(e)}")
-        return False
 
-
-def migrate_participant(participant, dry_run=False):
+def migrate_participant(participant, global_exists, dry_run=False):
     """
-    Migrate a single participant to the global participant model.
+    Build the records migrating a single participant to the global model.
+
+    The records are returned rather than written so the caller can send
+    them to DynamoDB in batches.
 
     Args:
         participant (dict): Legacy participant item to migrate
-        dry_run (bool): If True, don't actually update the database
+        global_exists (bool): Whether the global participant already exists
+        dry_run (bool): If True, only report what would be created
 
     Returns:
-        bool: True if successful, False otherwise
+        tuple: (global_participant, participation) items to write; either
+            is None when there is nothing to write
     """
     participant_id = participant.get("participantId")
     name = participant.get("name", "Unknown")
     session_id = participant.get("sessionId", "unknown")
 
-    print(
-        f"  Migrating participant '{name}' (ID: {participant_id}, Session: {session_id})"
+    logger.info(
+        "Migrating participant '%s' (ID: %s, Session: %s)",
+        name,
+        participant_id,
+        session_id,
     )
 
     # Create global participant (if not already exists)
-    if not create_global_participant(participant, dry_run):
-        return False
+    global_participant = build_global_participant(participant, global_exists, dry_run)
 
     # Create session participation
-    if not create_session_participation(participant, dry_run):
-        return False
+    participation = build_session_participation(participant, dry_run)
+
+    return global_participant, participation
+
+
+def migrate_participant_batch(participants, dry_run=False):
+    """
+    Build the records for a batch of participants with one existence lookup.
+
+    Args:
+        participants (list): Up to BATCH_GET_SIZE legacy participant items
+        dry_run (bool): If True, only report what would be created
+
+    Returns:
+        list: (global_participant, participation) tuples, one per participant
+
+    Raises:
+        ClientError: If the existence lookup fails
+    """
+    existing_ids = get_existing_global_participant_ids(
+        {participant["participantId"] for participant in participants}
+    )
 
-    print(f"    Successfully migrated participant '{name}'")
-    return True
+    return [
+        migrate_participant(
+            participant, participant["participantId"] in existing_ids, dry_run
+        )
+        for participant in participants
+    ]
 
 
-def main():
+def main(argv=None):
     """Main function to parse arguments and migrate participants."""
     parser = argparse.ArgumentParser(
         description="Migrate legacy participants to global participant model"
@@ -219,40 +279,93 @@ def main():
         action="store_true",
         help="Show what would be done without making changes",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=UPDATE_WORKERS,
+        help=f"Number of participants migrated concurrently (default: {UPDATE_WORKERS})",
+    )
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=SCAN_SEGMENTS,
+        help=f"Number of scan segments read in parallel (default: {SCAN_SEGMENTS})",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log every migrated item (always on with --dry-run)",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    listener, log_handler = start_logging(args.verbose or args.dry_run)
 
     print("Starting participant migration...")
     if args.dry_run:
         print("[DRY RUN MODE - No changes will be made]\n")
 
-    # Get legacy participants
-    participants = get_legacy_participants()
+    # Look up and build participants concurrently in batches as the scan
+    # returns them; each batch checks which global participants exist with
+    # batched gets, and the batches' round trips overlap. The number of
+    # batches in flight is bounded so the scan is not read ahead unbounded.
+    # The records are written from this thread through batch writers, 25
+    # puts per BatchWriteItem request, with unprocessed items retried.
+    participant_count = 0
+    migrate_error = None
+
+    def write(done):
+        for future in done:
+            for global_participant, participation in future.result():
+                if global_participant:
+                    global_writer.put_item(Item=global_participant)
+                if participation:
+                    participation_writer.put_item(Item=participation)
 
-    if not participants:
+    try:
+        with (
+            ThreadPoolExecutor(max_workers=args.concurrency) as executor,
+            global_participants_table.batch_writer(
+                overwrite_by_pkeys=["participantId"]
+            ) as global_writer,
+            session_participations_table.batch_writer() as participation_writer,
+        ):
+            pending = set()
+            participants = get_legacy_participants(segments=args.segments)
+            while batch := list(islice(participants, BATCH_GET_SIZE)):
+                participant_count += len(batch)
+                if participant_count % PROGRESS_INTERVAL < len(batch):
+                    print(f"  ... {participant_count} participants scanned")
+                pending.add(
+                    executor.submit(migrate_participant_batch, batch, args.dry_run)
+                )
+                if len(pending) >= 2 * args.concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    write(done)
+            write(wait(pending).done)
+    except ClientError as e:
+        migrate_error = e
+    finally:
+        # Write out all per-item log lines before the summary
+        listener.stop()
+        logging.getLogger().removeHandler(log_handler)
+
+    if migrate_error:
+        print(f"\nError migrating participants: {str(migrate_error)}")
+        sys.exit(1)
+
+    if not participant_count:
         print("No legacy participants found that need migration.")
         sys.exit(0)
 
-    print(f"Found {len(participants)} legacy participant(s) to migrate:\n")
-
-    # Migrate each participant
-    success_count = 0
-    for participant in participants:
-        if migrate_participant(participant, args.dry_run):
-            success_count += 1
-
+    # Every record was written once the batch writers flushed without error
     print(
-        f"\nMigration complete: {success_count}/{len(participants)} participants migrated successfully"
+        f"\nMigration complete: {participant_count}/{participant_count} participants migrated successfully"
     )
 
     if args.dry_run:
         print("\nThis was a dry run. Run without --dry-run to apply changes.")
-        sys.exit(0)
 
-    if success_count == len(participants):
-        sys.exit(0)
-    else:
-        sys.exit(1)
+    sys.exit(0)
 
 
 if __name__ == "__main__":
@@ -11,54 +11,80 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 
 # Add lambda common directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lambda", "common"))
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from migration_logging import start_logging
+from parallel_scan import parallel_scan
+from throttling import retry_throttled
+
+logger = logging.getLogger(__name__)
 
 # Default tenant ID (must match setup_default_tenant.py)
 DEFAULT_TENANT_ID = "00000000-0000-0000-0000-000000000001"
 
+# Default number of sessions migrated concurrently (--concurrency)
+UPDATE_WORKERS = 32
+
+# Default number of scan segments read in parallel (--segments)
+SCAN_SEGMENTS = 16
+
+# Scanned sessions between progress lines
+PROGRESS_INTERVAL = 1000
+
+# Shared by all threads: keep-alive connections, one per worker and segment,
+# and adaptive retries so throttled writes back off instead of failing
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=UPDATE_WORKERS + SCAN_SEGMENTS,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
 
-def get_sessions_without_tenant(table_name="QuizSessions"):
+# Low-level client: items stay in DynamoDB JSON ({"S": ...} attribute values),
+# so no per-item (de)serialization runs for fields that are only passed on
+dynamodb = boto3.client("dynamodb", config=DYNAMODB_CONFIG)
+
+# Update request parts that are the same for every session
+UPDATE_EXPRESSION = "SET tenantId = :tenant_id, updatedAt = :updated_at"
+TENANT_ID_VALUE = {"S": DEFAULT_TENANT_ID}
+
+
+def get_sessions_without_tenant(table_name="QuizSessions", segments=SCAN_SEGMENTS):
     """
-    Query all sessions that don't have a tenantId field.
+    Iterate over all sessions that don't have a tenantId field.
+
+    The table is read as a parallel segmented scan, filtered server-side and
+    projected to the attributes the migration needs; pages are handed on as
+    they arrive.
 
     Args:
         table_name (str): DynamoDB table name
+        segments (int): Number of scan segments read in parallel
 
-    Returns:
-        list: List of session items without tenantId
-    """
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table(table_name)
+    Yields:
+        dict: Session items without tenantId, in DynamoDB JSON
 
-    try:
-        # Scan for all sessions
-        response = table.scan()
-        items = response.get("Items", [])
-
-        # Handle pagination
-        while "LastEvaluatedKey" in response:
-            response = table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(response.get("Items", []))
-
-        # Filter sessions without tenantId
-        sessions_without_tenant = [
-            session
-            for session in items
-            if "tenantId" not in session or session.get("tenantId") is None
-        ]
-
-        return sessions_without_tenant
-    except ClientError as e:
-        print(f"Error querying sessions: {str(e)}")
-        return []
+    Raises:
+        ClientError: If the scan fails
+    """
+    yield from parallel_scan(
+        dynamodb,
+        segments,
+        TableName=table_name,
+        FilterExpression="attribute_not_exists(tenantId) OR attribute_type(tenantId, :null)",
+        ProjectionExpression="#sessionId, #title",
+        ExpressionAttributeNames={"#sessionId": "sessionId", "#title": "title"},
+        ExpressionAttributeValues={":null": {"S": "NULL"}},
+    )
 
 
 def migrate_session(session, table_name="QuizSessions", dry_run=False):
@@ -66,44 +92,46 @@ def migrate_session(session, table_name="QuizSessions", dry_run=False):
     Migrate a single session to the multi-tenant model.
 
     Args:
-        session (dict): Session item to migrate
+        session (dict): Session item to migrate, in DynamoDB JSON
         table_name (str): DynamoDB table name
         dry_run (bool): If True, don't actually update the database
 
     Returns:
         bool: True if successful, False otherwise
     """
-    session_id = session.get("sessionId")
-    title = session.get("title", "Untitled")
-
-    print(f"  Migrating session '{title}' (ID: {session_id})")
+    session_id = session["sessionId"]["S"]
+    title = session.get("title", {}).get("S", "Untitled")
 
     if dry_run:
-        print(f"    [DRY RUN] Would set tenantId={DEFAULT_TENANT_ID}")
+        logger.info(
+            "[DRY RUN] Would set tenantId=%s on session '%s' (ID: %s)",
+            DEFAULT_TENANT_ID,
+            title,
+            session_id,
+        )
         return True
 
     # Update the session record
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table(table_name)
-
     try:
-        table.update_item(
-            Key={"sessionId": session_id},
-            UpdateExpression="SET tenantId = :tenant_id, updatedAt = :updated_at",
+        retry_throttled(
+            dynamodb.update_item,
+            TableName=table_name,
+            Key={"sessionId": session["sessionId"]},
+            UpdateExpression=UPDATE_EXPRESSION,
             ExpressionAttributeValues={
-                ":tenant_id": DEFAULT_TENANT_ID,
-                ":updated_at": datetime.utcnow().isoformat(),
+                ":tenant_id": TENANT_ID_VALUE,
+                ":updated_at": {"S": datetime.utcnow().isoformat()},
             },
         )
 
-        print(f"    Successfully migrated session '{title}'")
+        logger.info("Migrated session '%s' (ID: %s)", title, session_id)
         return True
     except ClientError as e:
-        print(f"    Error migrating session '{title}': {str(e)}")
+        logger.error("Error migrating session '%s' (ID: %s): %s", title, session_id, e)
         return False
 
 
-def main():
+def main(argv=None):
     """Main function to parse arguments and migrate sessions."""
     parser = argparse.ArgumentParser(
         description="Migrate existing sessions to multi-tenant model"
@@ -118,37 +146,78 @@ def main():
         action="store_true",
         help="Show what would be done without making changes",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=UPDATE_WORKERS,
+        help=f"Number of sessions migrated concurrently (default: {UPDATE_WORKERS})",
+    )
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=SCAN_SEGMENTS,
+        help=f"Number of scan segments read in parallel (default: {SCAN_SEGMENTS})",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log every migrated item (always on with --dry-run)",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    listener, log_handler = start_logging(args.verbose or args.dry_run)
 
     print("Starting session migration...")
     if args.dry_run:
         print("[DRY RUN MODE - No changes will be made]\n")
 
-    # Get sessions without tenant
-    sessions = get_sessions_without_tenant(args.table_name)
+    # Migrate sessions concurrently as the scan returns them; the updates are
+    # independent, so their round trips overlap. The number of sessions in
+    # flight is bounded so the scan is not read ahead unbounded.
+    session_count = 0
+    success_count = 0
+    scan_error = None
+    try:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            pending = set()
+            for session in get_sessions_without_tenant(args.table_name, args.segments):
+                session_count += 1
+                if session_count % PROGRESS_INTERVAL == 0:
+                    print(f"  ... {session_count} sessions scanned")
+                pending.add(
+                    executor.submit(
+                        migrate_session, session, args.table_name, args.dry_run
+                    )
+                )
+                if len(pending) >= 2 * args.concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    success_count += sum(future.result() for future in done)
+            success_count += sum(future.result() for future in wait(pending).done)
+    except ClientError as e:
+        # A failed scan leaves sessions unmigrated, even if some were already read
+        scan_error = e
+    finally:
+        # Write out all per-item log lines before the summary
+        listener.stop()
+        logging.getLogger().removeHandler(log_handler)
+
+    if scan_error:
+        print(f"\nError scanning sessions: {str(scan_error)}")
+        sys.exit(1)
 
-    if not sessions:
+    if not session_count:
         print("No sessions found that need migration.")
         sys.exit(0)
 
-    print(f"Found {len(sessions)} session(s) to migrate:\n")
-
-    # Migrate each session
-    success_count = 0
-    for session in sessions:
-        if migrate_session(session, args.table_name, args.dry_run):
-            success_count += 1
-
     print(
-        f"\nMigration complete: {success_count}/{len(sessions)} sessions migrated successfully"
+        f"\nMigration complete: {success_count}/{session_count} sessions migrated successfully"
     )
 
     if args.dry_run:
         print("\nThis was a dry run. Run without --dry-run to apply changes.")
         sys.exit(0)
 
-    if success_count == len(sessions):
+    if success_count == session_count:
         sys.exit(0)
     else:
         sys.exit(1)
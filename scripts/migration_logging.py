@@ -0,0 +1,40 @@
+"""
+Migration Logging Helper
+
+Shared by the migration scripts. Per-item progress from the worker threads is
+logged through a queue to a single writer thread, so workers never wait on
+stdout and lines from different items are never interleaved.
+"""
+
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+
+def start_logging(verbose=False):
+    """
+    Send log records through a queue to stdout.
+
+    Args:
+        verbose (bool): Show per-item progress (INFO); otherwise only
+            warnings and errors are written
+
+    Returns:
+        tuple: (listener, handler) - the running QueueListener and the
+            QueueHandler added to the root logger; call listener.stop() to
+            flush all records, then remove the handler from the root logger
+    """
+    log_queue = queue.SimpleQueue()
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO if verbose else logging.WARNING)
+    queue_handler = QueueHandler(log_queue)
+    root.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener, queue_handler
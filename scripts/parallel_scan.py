@@ -0,0 +1,69 @@
+"""
+Parallel Segmented Scan Helper
+
+Shared by the migration scripts to read a DynamoDB table with several
+scan segments at once while still handing items to the caller page by page.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def parallel_scan(client, segments, **scan_params):
+    """
+    Iterate over all items of a parallel segmented scan.
+
+    Each segment is paginated on its own thread. Pages are passed to the
+    caller through a bounded queue as they arrive, so at most a few pages
+    per segment are held in memory, in no particular order.
+
+    Args:
+        client: DynamoDB client (a resource's meta.client accepts and
+            returns plain Python values)
+        segments (int): Number of scan segments read concurrently
+        **scan_params: Scan parameters (TableName, FilterExpression, ...)
+
+    Yields:
+        dict: Each item returned by the scan
+
+    Raises:
+        ClientError: If the scan of any segment fails
+    """
+    pages = queue.Queue(maxsize=2 * segments)
+    stop = threading.Event()
+    segment_done = object()
+
+    def scan_segment(segment):
+        try:
+            paginator = client.get_paginator("scan")
+            for page in paginator.paginate(
+                Segment=segment, TotalSegments=segments, **scan_params
+            ):
+                pages.put(page.get("Items", []))
+                if stop.is_set():
+                    break
+        finally:
+            pages.put(segment_done)
+
+    with ThreadPoolExecutor(max_workers=segments) as executor:
+        futures = [executor.submit(scan_segment, s) for s in range(segments)]
+        remaining = segments
+
+        try:
+            while remaining:
+                items = pages.get()
+                if items is segment_done:
+                    remaining -= 1
+                else:
+                    yield from items
+        finally:
+            # Unblock and stop segments still running when iteration ends
+            # early, then wait for every segment to finish
+            stop.set()
+            while remaining:
+                if pages.get() is segment_done:
+                    remaining -= 1
+
+        for future in futures:
+            future.result()
@@ -13,15 +13,24 @@ Usage:
 import argparse
 import sys
 import subprocess
+import tempfile
+import traceback
 
+import migrate_admins
+import migrate_answers
+import setup_default_tenant
 
-def run_script(script_name, args=None, description=""):
+
+def run_in_process(main_function, args=None, description=""):
     """
-    Run a migration script and check for success.
+    Run a migration script's main function in this process.
+
+    Saves starting another Python interpreter and importing boto3 again for
+    every step. Steps that run at the same time still use child processes.
 
     Args:
-        script_name (str): Name of the script to run
-        args (list): Additional arguments to pass to the script
+        main_function (callable): The script's main(argv) function
+        args (list): Arguments to pass to the script
         description (str): Description of what the script does
 
     Returns:
@@ -29,20 +38,75 @@ def run_script(script_name, args=None, description=""):
     """
     print(f"\n{'=' * 70}")
     print(f"Step: {description}")
-    print(f"Running: {script_name}")
+    print(f"Running: {main_function.__module__}.py (in process)")
     print(f"{'=' * 70}\n")
 
-    cmd = ["python", f"scripts/{script_name}"]
-    if args:
-        cmd.extend(args)
-
     try:
-        result = subprocess.run(cmd, check=True, capture_output=False)
+        main_function(args or [])
+        exit_code = 0
+    except SystemExit as e:
+        exit_code = e.code or 0
+    except Exception:
+        # e.g. BotoCoreError, which the scripts' ClientError handlers miss;
+        # report the step as failed instead of aborting the whole run
+        traceback.print_exc()
+        print(f"\n✗ {description} failed with an unexpected error")
+        return False
+
+    if exit_code == 0:
         print(f"\n✓ {description} completed successfully")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"\n✗ {description} failed with exit code {e.returncode}")
-        return False
+
+    print(f"\n✗ {description} failed with exit code {exit_code}")
+    return False
+
+
+def run_scripts_concurrently(steps, args=None):
+    """
+    Run independent migration scripts at the same time.
+
+    Each script's output goes to its own temporary file and is printed as a
+    block once all scripts have finished, so their output does not interleave.
+
+    Args:
+        steps (list): (step_number, script_name, description) tuples
+        args (list): Additional arguments to pass to every script
+
+    Returns:
+        list: Step numbers of the scripts that failed, in the given order
+    """
+    print(f"\n{'=' * 70}")
+    for _, script_name, description in steps:
+        print(f"Step: {description}")
+        print(f"Running: {script_name}")
+    print(f"{'=' * 70}\n")
+
+    running = []
+    for step_number, script_name, description in steps:
+        cmd = ["python", f"scripts/{script_name}"]
+        if args:
+            cmd.extend(args)
+
+        log = tempfile.TemporaryFile(mode="w+")
+        process = subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT, text=True)
+        running.append((step_number, description, process, log))
+
+    failed_steps = []
+    for step_number, description, process, log in running:
+        returncode = process.wait()
+
+        with log:
+            log.seek(0)
+            print(f"--- Output of: {description} ---")
+            print(log.read())
+
+        if returncode == 0:
+            print(f"✓ {description} completed successfully\n")
+        else:
+            print(f"✗ {description} failed with exit code {returncode}\n")
+            failed_steps.append(step_number)
+
+    return failed_steps
 
 
 def main():
@@ -91,8 +155,8 @@ def main():
 
     # Step 1: Create default tenant
     if not args.skip_tenant_setup:
-        if not run_script(
-            "setup_default_tenant.py",
+        if not run_in_process(
+            setup_default_tenant.main,
             script_args,
             "Create default tenant for backward compatibility",
         ):
@@ -102,31 +166,33 @@ def main():
         print("\nSkipping default tenant setup (--skip-tenant-setup)")
 
     # Step 2: Migrate admins
-    if not run_script(
-        "migrate_admins.py", script_args, "Migrate admins to multi-tenant model"
+    if not run_in_process(
+        migrate_admins.main, script_args, "Migrate admins to multi-tenant model"
     ):
         print("\n✗ Migration failed at step 2")
         sys.exit(1)
 
-    # Step 3: Migrate sessions
-    if not run_script(
-        "migrate_sessions.py", script_args, "Migrate sessions to multi-tenant model"
-    ):
-        print("\n✗ Migration failed at step 3")
-        sys.exit(1)
-
-    # Step 4: Migrate participants
-    if not run_script(
-        "migrate_participants.py",
+    # Steps 3 and 4: Migrate sessions and participants. Neither reads what
+    # the other writes, so they run at the same time; answers depend on both.
+    failed_steps = run_scripts_concurrently(
+        [
+            (3, "migrate_sessions.py", "Migrate sessions to multi-tenant model"),
+            (
+                4,
+                "migrate_participants.py",
+                "Migrate participants to global participant model",
+            ),
+        ],
         script_args,
-        "Migrate participants to global participant model",
-    ):
-        print("\n✗ Migration failed at step 4")
+    )
+    if failed_steps:
+        steps = " and ".join(str(step) for step in failed_steps)
+        print(f"\n✗ Migration failed at step {steps}")
         sys.exit(1)
 
     # Step 5: Migrate answers
-    if not run_script(
-        "migrate_answers.py", script_args, "Migrate answers to multi-tenant model"
+    if not run_in_process(
+        migrate_answers.main, script_args, "Migrate answers to multi-tenant model"
     ):
         print("\n✗ Migration failed at step 5")
         sys.exit(1)
@@ -47,12 +47,13 @@ def check_tenants_exist(table_name="Tenants"):
         return False
 
 
-def create_default_tenant(table_name="Tenants"):
+def create_default_tenant(table_name="Tenants", dry_run=False):
     """
     Create the default tenant in DynamoDB.
 
     Args:
         table_name (str): DynamoDB table name
+        dry_run (bool): If True, don't actually create the tenant
 
     Returns:
         dict: Created tenant data or None if failed
@@ -82,6 +83,10 @@ def create_default_tenant(table_name="Tenants"):
         "settings": {},
     }
 
+    if dry_run:
+        print(f"[DRY RUN] Would create default tenant: {DEFAULT_TENANT_NAME}")
+        return tenant_item
+
     try:
         table.put_item(Item=tenant_item)
         print(f"Successfully created default tenant: {DEFAULT_TENANT_NAME}")
@@ -92,8 +97,13 @@ def create_default_tenant(table_name="Tenants"):
         return None
 
 
-def main():
-    """Main function to parse arguments and create default tenant."""
+def main(argv=None):
+    """
+    Main function to parse arguments and create default tenant.
+
+    Args:
+        argv (list, optional): Arguments to parse instead of sys.argv[1:]
+    """
     parser = argparse.ArgumentParser(
         description="Create default tenant for backward compatibility"
     )
@@ -107,8 +117,13 @@ def main():
         action="store_true",
         help="Create default tenant even if other tenants exist",
     )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be done without making changes",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Check if tenants already exist
     if not args.force and check_tenants_exist(args.table_name):
@@ -117,7 +132,10 @@ def main():
         sys.exit(0)
 
     # Create default tenant
-    result = create_default_tenant(args.table_name)
+    result = create_default_tenant(args.table_name, args.dry_run)
+
+    if args.dry_run:
+        sys.exit(0 if result else 1)
 
     if result:
         print("\nDefault tenant created successfully!")
@@ -0,0 +1,57 @@
+"""
+Throttle Retry Helper
+
+Shared by the migration scripts so a DynamoDB request that is still throttled
+after the SDK's own retries is retried again instead of counted as a failure.
+"""
+
+import random
+import time
+
+from botocore.exceptions import ClientError
+
+# Error codes DynamoDB returns when a request exceeds provisioned or account
+# throughput
+THROTTLE_ERROR_CODES = frozenset(
+    {
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "ThrottlingException",
+    }
+)
+
+# Times a throttled request is attempted before the error is raised
+THROTTLE_ATTEMPTS = 6
+
+# Upper bound of the backoff between attempts, in seconds
+MAX_BACKOFF_SECONDS = 30
+
+
+def retry_throttled(operation, *args, **kwargs):
+    """
+    Call a DynamoDB operation, backing off and retrying while it is throttled.
+
+    Waits a random time up to an exponentially growing bound between
+    attempts (full jitter), so concurrent workers do not retry in lockstep.
+    The calling worker sleeps meanwhile, which also lowers the request rate.
+
+    Args:
+        operation (callable): Bound operation, e.g. table.update_item
+        *args: Positional arguments for the operation
+        **kwargs: Keyword arguments for the operation
+
+    Returns:
+        The operation's return value
+
+    Raises:
+        ClientError: If the error is not a throttle, or the request is still
+            throttled after THROTTLE_ATTEMPTS attempts
+    """
+    for attempt in range(THROTTLE_ATTEMPTS):
+        try:
+            return operation(*args, **kwargs)
+        except ClientError as e:
+            throttled = e.response.get("Error", {}).get("Code") in THROTTLE_ERROR_CODES
+            if not throttled or attempt == THROTTLE_ATTEMPTS - 1:
+                raise
+            time.sleep(random.uniform(0, min(MAX_BACKOFF_SECONDS, 2**attempt)))
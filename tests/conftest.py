@@ -0,0 +1,40 @@
+"""
+Shared pytest configuration.
+
+In AWS the common utilities are provided by the Lambda layer, which puts them
+on the import path of every handler. Mirror that for the test suite so handlers
+can be imported without mutating sys.path themselves.
+
+The integration and end-to-end tests import handlers as packages
+(e.g. `create_tenant.handler`), so the lambda directory is added once here as
+well instead of by every test module.
+
+Handlers, middlewares and migration scripts create their boto3 clients at
+import time, which needs a region; default one so collection works without
+AWS configuration.
+"""
+
+import os
+import sys
+
+LAMBDA_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "lambda"))
+COMMON_PATH = os.path.join(LAMBDA_PATH, "common")
+
+for path in (LAMBDA_PATH, COMMON_PATH):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+
+class StubUUID(str):
+    """
+    Stand-in for a uuid.uuid4() result that renders as a fixed ID.
+
+    Handlers use both `str(uuid.uuid4())` and `uuid.uuid4().hex`, so both give
+    the ID the test chose.
+    """
+
+    @property
+    def hex(self):
+        return str(self)
@@ -0,0 +1,327 @@
+"""
+Shared fixtures for the end-to-end tests.
+
+Each step fixture performs one step of the quiz workflow through its Lambda
+handler, asserts that the step succeeded and returns the parsed response body.
+The fixtures are module-scoped, so every step runs once no matter how many
+tests build on it, and a failing step only fails the tests that depend on it.
+
+The handlers' and middlewares' database and password helpers, and
+uuid.uuid4, are replaced by MagicMocks once per module through the `mocks` fixture; steps configure their
+return values instead of entering a patch() context for every call.
+"""
+
+import importlib
+import uuid
+import orjson
+import pytest
+from unittest.mock import MagicMock
+
+from admin_login.handler import lambda_handler as login_handler
+from create_quiz.handler import lambda_handler as create_session_handler
+from create_tenant.handler import lambda_handler as create_tenant_handler
+from create_tenant_admin.handler import lambda_handler as create_admin_handler
+from join_session.handler import lambda_handler as join_handler
+from register_global_participant.handler import lambda_handler as register_handler
+
+from ..conftest import StubUUID
+
+# IDs for the end-to-end workflow
+TENANT_ID = "e2e-tenant-001"
+ADMIN_ID = "e2e-admin-001"
+SESSION_ID = "e2e-session-001"
+
+PARTICIPANTS = [
+    {"id": "e2e-participant-001", "name": "Alice", "avatar": "😀"},
+    {"id": "e2e-participant-002", "name": "Bob", "avatar": "😎"},
+    {"id": "e2e-participant-003", "name": "Charlie", "avatar": "🤓"},
+]
+
+PARTICIPATION_IDS = [
+    "e2e-participation-001",
+    "e2e-participation-002",
+    "e2e-participation-003",
+]
+
+# Event parts shared by every request for the workflow's session and admin
+SESSION_PATH = {"sessionId": SESSION_ID}
+ADMIN_REQUEST_CONTEXT = {
+    "authorizer": {
+        "tenantId": TENANT_ID,
+        "adminId": ADMIN_ID,
+        "role": "tenant_admin",
+    }
+}
+
+# Module -> attributes replaced by a MagicMock; the middlewares read the
+# tenant and participant records the handlers' authorization depends on
+MOCKED_MODULE_ATTRIBUTES = {
+    "create_tenant.handler": ["put_item"],
+    "create_tenant_admin.handler": ["get_item", "query", "put_item"],
+    "admin_login.handler": ["query", "verify_password"],
+    "create_quiz.handler": ["put_item"],
+    "register_global_participant.handler": ["get_item", "scan", "put_item"],
+    "join_session.handler": ["get_item", "query", "put_item"],
+    "submit_answer.handler": ["get_item", "query", "put_item", "update_item"],
+    "get_scoreboard.handler": ["get_item", "query"],
+    "tenant_middleware": ["get_item"],
+    "participant_middleware": ["get_item"],
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mocks():
+    """
+    Replace the handlers' helpers with MagicMocks for the whole module.
+
+    The participant middleware reads back the participants the registration
+    handler stored, and its record cache starts empty.
+
+    Yields:
+        dict: 'package.attribute' (e.g. 'join_session.get_item',
+            'tenant_middleware.get_item') and 'uuid.uuid4' -> MagicMock
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        handler_mocks = {}
+        for module_name, attributes in MOCKED_MODULE_ATTRIBUTES.items():
+            module = importlib.import_module(module_name)
+            package = module_name.removesuffix(".handler")
+            for attribute in attributes:
+                mock = MagicMock()
+                monkeypatch.setattr(module, attribute, mock)
+                handler_mocks[f"{package}.{attribute}"] = mock
+
+        # Steps set the ID the next created record gets as its return value
+        handler_mocks["uuid.uuid4"] = MagicMock()
+        monkeypatch.setattr(uuid, "uuid4", handler_mocks["uuid.uuid4"])
+
+        handler_mocks["participant_middleware.get_item"].side_effect = (
+            lambda table_name, key: stored_participant(
+                handler_mocks, key["participantId"]
+            )
+        )
+        monkeypatch.setattr(
+            importlib.import_module("participant_middleware"),
+            "_participant_cache",
+            {},
+        )
+
+        yield handler_mocks
+
+
+def stored_participant(mocks, participant_id):
+    """
+    Look up a participant the registration handler stored.
+
+    Args:
+        mocks (dict): Handler mocks from the `mocks` fixture
+        participant_id (str): Participant to look up
+
+    Returns:
+        dict: Stored participant record, None if it was never registered
+    """
+    for put_call in mocks["register_global_participant.put_item"].call_args_list:
+        table_name, participant_item = put_call.args
+        if participant_item["participantId"] == participant_id:
+            return participant_item
+    return None
+
+
+def participant_request_context(participant_id, tenant_id=TENANT_ID):
+    """
+    Build the request context the participant authorizer passes on.
+
+    Args:
+        participant_id (str): Authenticated participant
+        tenant_id (str): Participant's tenant
+
+    Returns:
+        dict: Event 'requestContext' value
+    """
+    return {"authorizer": {"participantId": participant_id, "tenantId": tenant_id}}
+
+
+def register_participant(mocks, tenant_id, participant):
+    """
+    Register a global participant through the registration handler.
+
+    Args:
+        mocks (dict): Handler mocks from the `mocks` fixture
+        tenant_id (str): Tenant the participant registers with
+        participant (dict): Participant with 'id', 'name' and 'avatar'
+
+    Returns:
+        dict: Lambda response of the registration handler
+    """
+    mocks["register_global_participant.get_item"].return_value = {
+        "tenantId": tenant_id,
+        "name": "Acme Corporation",
+        "status": "active",
+    }
+    mocks["register_global_participant.scan"].return_value = []
+
+    register_event = {
+        "body": orjson.dumps(
+            {
+                "tenantId": tenant_id,
+                "name": participant["name"],
+                "avatar": participant["avatar"],
+            }
+        ).decode(),
+        "headers": {},
+    }
+
+    mocks["uuid.uuid4"].return_value = StubUUID(participant["id"])
+    return register_handler(register_event, {})
+
+
+@pytest.fixture(scope="module")
+def tenant(mocks):
+    """Super admin creates the tenant."""
+    create_tenant_event = {
+        "body": orjson.dumps(
+            {
+                "name": "Acme Corporation",
+                "description": "A test organization for E2E testing",
+            }
+        ).decode(),
+        "headers": {"Authorization": "Bearer super_admin_token"},
+    }
+
+    mocks["uuid.uuid4"].return_value = StubUUID(TENANT_ID)
+    tenant_response = create_tenant_handler(create_tenant_event, {})
+
+    assert tenant_response["statusCode"] == 201
+    return orjson.loads(tenant_response["body"])
+
+
+@pytest.fixture(scope="module")
+def admin(mocks):
+    """Super admin creates the tenant admin."""
+    mocks["create_tenant_admin.get_item"].return_value = {
+        "tenantId": TENANT_ID,
+        "name": "Acme Corporation",
+        "status": "active",
+    }
+    mocks["create_tenant_admin.query"].return_value = []
+
+    create_admin_event = {
+        "pathParameters": {"tenantId": TENANT_ID},
+        "body": orjson.dumps(
+            {
+                "username": "acme_admin",
+                "password": "SecurePassword123!",
+                "email": "admin@acme.com",
+            }
+        ).decode(),
+        "headers": {"Authorization": "Bearer super_admin_token"},
+    }
+
+    mocks["uuid.uuid4"].return_value = StubUUID(ADMIN_ID)
+    admin_response = create_admin_handler(create_admin_event, {})
+
+    assert admin_response["statusCode"] == 201
+    return orjson.loads(admin_response["body"])
+
+
+@pytest.fixture(scope="module")
+def admin_login(mocks):
+    """Tenant admin logs in."""
+    mocks["admin_login.query"].return_value = [
+        {
+            "adminId": ADMIN_ID,
+            "username": "acme_admin",
+            "passwordHash": "hashed_password",
+            "tenantId": TENANT_ID,
+            "role": "tenant_admin",
+        }
+    ]
+    mocks["admin_login.verify_password"].return_value = True
+
+    login_event = {
+        "body": orjson.dumps(
+            {"username": "acme_admin", "password": "SecurePassword123!"}
+        ).decode(),
+        "headers": {},
+    }
+
+    login_response = login_handler(login_event, {})
+
+    assert login_response["statusCode"] == 200
+    return orjson.loads(login_response["body"])
+
+
+@pytest.fixture(scope="module")
+def admin_token(admin_login):
+    """Token of the logged-in tenant admin."""
+    return admin_login["token"]
+
+
+@pytest.fixture(scope="module")
+def session(mocks, admin_token):
+    """Tenant admin creates the quiz session."""
+    mocks["tenant_middleware.get_item"].return_value = {
+        "tenantId": TENANT_ID,
+        "name": "Acme Corporation",
+        "status": "active",
+    }
+
+    create_session_event = {
+        "body": orjson.dumps(
+            {
+                "title": "General Knowledge Quiz",
+                "description": "Test your knowledge!",
+            }
+        ).decode(),
+        "headers": {"Authorization": f"Bearer {admin_token}"},
+        "requestContext": ADMIN_REQUEST_CONTEXT,
+    }
+
+    mocks["uuid.uuid4"].return_value = StubUUID(SESSION_ID)
+    session_response = create_session_handler(create_session_event, {})
+
+    assert session_response["statusCode"] == 201
+    return orjson.loads(session_response["body"])
+
+
+@pytest.fixture(scope="module")
+def participants(mocks):
+    """Participants register; maps each participant ID to its token."""
+    participant_tokens = {}
+
+    for participant in PARTICIPANTS:
+        register_response = register_participant(mocks, TENANT_ID, participant)
+
+        assert register_response["statusCode"] == 201
+        register_body = orjson.loads(register_response["body"])
+        assert register_body["participantId"] == participant["id"]
+        participant_tokens[participant["id"]] = register_body["token"]
+
+    return participant_tokens
+
+
+@pytest.fixture(scope="module")
+def participations(mocks, participants):
+    """Participants join the session; returns the join response bodies."""
+    mocks["join_session.get_item"].return_value = {
+        "sessionId": SESSION_ID,
+        "tenantId": TENANT_ID,
+        "title": "General Knowledge Quiz",
+    }
+    mocks["join_session.query"].return_value = []
+
+    join_bodies = []
+    for participant, participation_id in zip(PARTICIPANTS, PARTICIPATION_IDS):
+        join_event = {
+            "pathParameters": SESSION_PATH,
+            "headers": {"Authorization": f"Bearer {participants[participant['id']]}"},
+            "requestContext": participant_request_context(participant["id"]),
+        }
+
+        mocks["uuid.uuid4"].return_value = StubUUID(participation_id)
+        join_response = join_handler(join_event, {})
+
+        assert join_response["statusCode"] == 201
+        join_bodies.append(orjson.loads(join_response["body"]))
+
+    return join_bodies
@@ -0,0 +1,41 @@
+"""
+Shared fixtures for the integration tests.
+"""
+
+import boto3
+import pytest
+from unittest.mock import Mock
+
+
+@pytest.fixture
+def mocked_dynamodb(mocker):
+    """
+    Patch boto3.resource so every table it opens is the same table mock.
+
+    Returns:
+        Mock: The table returned by boto3.resource(...).Table(...)
+    """
+    # Spec'd against the Table class; a Table instance loads on introspection
+    mock_table = Mock(spec=type(boto3.resource("dynamodb").Table("Tenants")))
+    mocker.patch("boto3.resource").return_value.Table.return_value = mock_table
+    return mock_table
+
+
+@pytest.fixture
+def stored_participants(mocker):
+    """
+    Patch the participant middleware's reads onto an in-memory store.
+
+    The middleware's record cache starts empty, so each test only sees the
+    participants it stores.
+
+    Returns:
+        dict: participantId -> participant record the middleware reads
+    """
+    participants = {}
+    mocker.patch(
+        "participant_middleware.get_item",
+        side_effect=lambda table_name, key: participants.get(key["participantId"]),
+    )
+    mocker.patch.dict("participant_middleware._participant_cache", clear=True)
+    return participants
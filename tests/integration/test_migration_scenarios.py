@@ -10,21 +10,41 @@ Tests the migration from single-tenant to multi-tenant system:
 """
 
 import json
+import logging
 import pytest
-from unittest.mock import patch, MagicMock
+from botocore.exceptions import ClientError, NoCredentialsError
+from unittest.mock import Mock
 import sys
 import os
 
-lambda_path = os.path.abspath(
-    os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
+SCRIPTS_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "scripts")
 )
-sys.path.insert(0, lambda_path)
+if SCRIPTS_PATH not in sys.path:
+    sys.path.insert(0, SCRIPTS_PATH)
+
+import setup_default_tenant
+import migrate_admins
+import migrate_answers
+import migrate_sessions
+import migrate_participants
+import run_full_migration
+
+
+@pytest.fixture(autouse=True)
+def root_logger():
+    """Undo the root logger handler and level a script's main() installs."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    root.handlers[:] = handlers
+    root.setLevel(level)
 
 
 class TestMigrationScenarios:
     """Integration tests for migration scenarios"""
 
-    def test_default_tenant_setup(self):
+    def test_default_tenant_setup(self, mocked_dynamodb):
         """
         Test that default tenant is created correctly for backward compatibility.
 
@@ -35,34 +55,21 @@ class TestMigrationScenarios:
         """
         default_tenant_id = "00000000-0000-0000-0000-000000000001"
 
-        # Import the script module first
-        scripts_path = os.path.join(os.path.dirname(__file__), "..", "..", "scripts")
-        if scripts_path not in sys.path:
-            sys.path.insert(0, scripts_path)
-
-        import setup_default_tenant
-
-        mock_table = MagicMock()
-        mock_table.scan.return_value = {"Items": []}
-        mock_table.get_item.return_value = {}  # No existing default tenant
-        mock_table.put_item.return_value = {}
-
-        with patch("boto3.resource") as mock_boto3:
-            mock_dynamodb = MagicMock()
-            mock_boto3.return_value = mock_dynamodb
-            mock_dynamodb.Table.return_value = mock_table
+        mocked_dynamodb.scan.return_value = {"Items": []}
+        mocked_dynamodb.get_item.return_value = {}  # No existing default tenant
+        mocked_dynamodb.put_item.return_value = {}
 
-            # Run setup
-            result = setup_default_tenant.create_default_tenant()
+        # Run setup
+        result = setup_default_tenant.create_default_tenant()
 
-            # Verify default tenant was created
-            assert result is not None
-            assert result["tenantId"] == default_tenant_id
-            assert result["name"] == "Default Organization"
-            assert result["status"] == "active"
-            mock_table.put_item.assert_called_once()
+        # Verify default tenant was created
+        assert result is not None
+        assert result["tenantId"] == default_tenant_id
+        assert result["name"] == "Default Organization"
+        assert result["status"] == "active"
+        mocked_dynamodb.put_item.assert_called_once()
 
-    def test_admin_migration(self):
+    def test_admin_migration(self, mocker):
         """
         Test migration of existing admins to default tenant.
 
@@ -91,37 +98,31 @@ class TestMigrationScenarios:
             },
         ]
 
-        # Import the script module first
-        scripts_path = os.path.join(os.path.dirname(__file__), "..", "..", "scripts")
-        if scripts_path not in sys.path:
-            sys.path.insert(0, scripts_path)
-
-        import migrate_admins
-
-        mock_table = MagicMock()
-        mock_table.scan.return_value = {"Items": existing_admins}
+        # Spec'd against the Table class; a Table instance loads on introspection
+        mock_table = Mock(spec=type(migrate_admins.dynamodb.Table("Admins")))
+        mock_table.scan.side_effect = lambda **kwargs: {
+            "Items": existing_admins if kwargs["Segment"] == 0 else []
+        }
         mock_table.update_item.return_value = {}
 
-        with patch("boto3.resource") as mock_boto3:
-            mock_dynamodb = MagicMock()
-            mock_boto3.return_value = mock_dynamodb
-            mock_dynamodb.Table.return_value = mock_table
+        mock_dynamodb = mocker.patch.object(migrate_admins, "dynamodb", spec=True)
+        mock_dynamodb.Table.return_value = mock_table
 
-            # Get admins
-            admins = migrate_admins.get_admins_without_tenant()
-            assert len(admins) == 2
+        # Get admins
+        admins = migrate_admins.get_admins_without_tenant()
+        assert len(admins) == 2
 
-            # Migrate both admins
-            admins.sort(key=lambda x: x.get("createdAt", ""))
-            for i, admin in enumerate(admins):
-                is_first = i == 0
-                result = migrate_admins.migrate_admin(admin, is_first)
-                assert result is True
+        # Migrate both admins
+        admins.sort(key=lambda x: x.get("createdAt", ""))
+        for i, admin in enumerate(admins):
+            is_first = i == 0
+            result = migrate_admins.migrate_admin(admin, is_first)
+            assert result is True
 
-            # Verify both admins were updated
-            assert mock_table.update_item.call_count == 2
+        # Verify both admins were updated
+        assert mock_table.update_item.call_count == 2
 
-    def test_session_migration(self):
+    def test_session_migration(self, mocker):
         """
         Test migration of existing sessions to default tenant.
 
@@ -130,39 +131,63 @@ class TestMigrationScenarios:
         2. Run migration script
         3. Verify sessions are assigned to default tenant
         """
-        default_tenant_id = "00000000-0000-0000-0000-000000000000"
-
+        # Scanned sessions, in DynamoDB JSON
         existing_sessions = [
-            {
-                "sessionId": "session-1",
-                "title": "Old Quiz 1",
-                # No tenantId
-            },
-            {
-                "sessionId": "session-2",
-                "title": "Old Quiz 2",
-                # No tenantId
-            },
+            {"sessionId": {"S": "session-1"}, "title": {"S": "Old Quiz 1"}},
+            {"sessionId": {"S": "session-2"}, "title": {"S": "Old Quiz 2"}},
         ]
 
-        # Import the script module first
-        scripts_path = os.path.join(os.path.dirname(__file__), "..", "..", "scripts")
-        if scripts_path not in sys.path:
-            sys.path.insert(0, scripts_path)
+        # Low-level client: the scan goes through parallel_scan
+        mock_client = mocker.patch.object(migrate_sessions, "dynamodb", spec=True)
+        mock_scan = mocker.patch.object(
+            migrate_sessions, "parallel_scan", return_value=iter(existing_sessions)
+        )
+
+        with pytest.raises(SystemExit) as exit_info:
+            migrate_sessions.main(["--segments", "1"])
+
+        assert exit_info.value.code == 0
+        assert mock_scan.call_args.args == (mock_client, 1)
+        assert mock_scan.call_args.kwargs["TableName"] == "QuizSessions"
+
+        # Verify both sessions were assigned to the default tenant
+        assert mock_client.update_item.call_count == 2
+        for call in mock_client.update_item.call_args_list:
+            assert call.kwargs["TableName"] == "QuizSessions"
+            assert call.kwargs["ExpressionAttributeValues"][":tenant_id"] == {
+                "S": migrate_sessions.DEFAULT_TENANT_ID
+            }
+        assert {
+            call.kwargs["Key"]["sessionId"]["S"]
+            for call in mock_client.update_item.call_args_list
+        } == {"session-1", "session-2"}
 
-        import migrate_sessions
+    def test_session_migration_fails_on_scan_error(self, mocker):
+        """
+        Test that a scan failing after some sessions were read fails the run.
 
-        with (
-            patch.object(migrate_sessions, "sessions_table") as mock_table,
-        ):
-            mock_table.scan.return_value = {"Items": existing_sessions}
+        Workflow:
+        1. The scan yields a session, then fails
+        2. Run migration script
+        3. Verify the script exits with an error
+        """
+
+        def failing_scan(client, segments, **params):
+            yield {"sessionId": {"S": "session-1"}, "title": {"S": "Old Quiz 1"}}
+            raise ClientError(
+                {"Error": {"Code": "InternalServerError", "Message": "Scan failed"}},
+                "Scan",
+            )
 
-            migrate_sessions.migrate_sessions(default_tenant_id)
+        mocker.patch.object(migrate_sessions, "dynamodb", spec=True)
+        mocker.patch.object(migrate_sessions, "parallel_scan", side_effect=failing_scan)
 
-            # Verify both sessions were updated
-            assert mock_table.update_item.call_count == 2
+        with pytest.raises(SystemExit) as exit_info:
+            migrate_sessions.main(["--segments", "1"])
 
-    def test_participant_migration(self):
+        assert exit_info.value.code == 1
+
+    def test_participant_migration(self, mocker):
         """
         Test migration of session-specific participants to global participants.
 
@@ -173,8 +198,6 @@ class TestMigrationScenarios:
         4. Verify SessionParticipations records created
         5. Verify scores migrated correctly
         """
-        default_tenant_id = "00000000-0000-0000-0000-000000000000"
-
         old_participants = [
             {
                 "participantId": "old-participant-1",
@@ -194,77 +217,177 @@ class TestMigrationScenarios:
             },
         ]
 
-        # Import the script module first
-        scripts_path = os.path.join(os.path.dirname(__file__), "..", "..", "scripts")
-        if scripts_path not in sys.path:
-            sys.path.insert(0, scripts_path)
-
-        import migrate_participants
-
-        with (
-            patch.object(migrate_participants, "participants_table") as mock_old_table,
-            patch.object(
-                migrate_participants, "global_participants_table"
-            ) as mock_global_table,
-            patch.object(
-                migrate_participants, "session_participations_table"
-            ) as mock_participation_table,
-        ):
-            mock_old_table.scan.return_value = {"Items": old_participants}
+        mocker.patch.object(
+            migrate_participants, "parallel_scan", return_value=iter(old_participants)
+        )
+        # No global participant exists yet
+        mock_dynamodb = mocker.patch.object(migrate_participants, "dynamodb", spec=True)
+        mock_dynamodb.batch_get_item.return_value = {"Responses": {}}
+        table_class = type(migrate_participants.global_participants_table)
+        mock_global_table = mocker.patch.object(
+            migrate_participants, "global_participants_table", spec=table_class
+        )
+        mock_participation_table = mocker.patch.object(
+            migrate_participants, "session_participations_table", spec=table_class
+        )
+
+        with pytest.raises(SystemExit) as exit_info:
+            migrate_participants.main(["--segments", "1"])
+
+        assert exit_info.value.code == 0
+        mock_dynamodb.batch_get_item.assert_called_once()
+
+        # Verify GlobalParticipants and SessionParticipations were created
+        global_writer = mock_global_table.batch_writer.return_value.__enter__()
+        participation_writer = (
+            mock_participation_table.batch_writer.return_value.__enter__()
+        )
+        global_items = [c.kwargs["Item"] for c in global_writer.put_item.call_args_list]
+        participations = [
+            c.kwargs["Item"] for c in participation_writer.put_item.call_args_list
+        ]
 
-            migrate_participants.migrate_participants(default_tenant_id)
+        assert [item["participantId"] for item in global_items] == [
+            "old-participant-1",
+            "old-participant-2",
+        ]
+        assert all(
+            item["tenantId"] == migrate_participants.DEFAULT_TENANT_ID
+            for item in global_items
+        )
+        assert [
+            (item["participantId"], item["totalPoints"], item["correctAnswers"])
+            for item in participations
+        ] == [("old-participant-1", 100, 5), ("old-participant-2", 150, 7)]
+
+    def test_answer_migration(self, mocker):
+        """
+        Test migration of existing answers to their session's tenant.
 
-            # Verify GlobalParticipants and SessionParticipations were created
-            assert mock_global_table.put_item.call_count >= 2
-            assert mock_participation_table.put_item.call_count >= 2
+        Workflow:
+        1. Existing answers without tenantId or participationId
+        2. Run migration script
+        3. Verify answers get the session's tenant and the participation
+        4. Verify answers without a participation are skipped
+        """
+        # Scanned items per table, in DynamoDB JSON
+        scanned_items = {
+            "QuizSessions": [
+                {"sessionId": {"S": "session-1"}, "tenantId": {"S": "tenant-1"}},
+            ],
+            "SessionParticipations": [
+                {
+                    "participationId": {"S": "participation-1"},
+                    "participantId": {"S": "participant-1"},
+                    "sessionId": {"S": "session-1"},
+                },
+            ],
+            "Answers": [
+                {
+                    "answerId": {"S": "answer-1"},
+                    "participantId": {"S": "participant-1"},
+                    "sessionId": {"S": "session-1"},
+                },
+                {
+                    "answerId": {"S": "answer-2"},
+                    "participantId": {"S": "participant-2"},
+                    "sessionId": {"S": "session-1"},
+                },
+            ],
+        }
+
+        # Low-level client: the scans go through parallel_scan
+        mock_client = mocker.patch.object(migrate_answers, "dynamodb", spec=True)
+        mocker.patch.object(
+            migrate_answers,
+            "parallel_scan",
+            side_effect=lambda client, segments, **params: iter(
+                scanned_items[params["TableName"]]
+            ),
+        )
+
+        with pytest.raises(SystemExit) as exit_info:
+            migrate_answers.main(["--segments", "1"])
+
+        # The answer without a participation is skipped and fails the run
+        assert exit_info.value.code == 1
+        mock_client.update_item.assert_called_once()
+        update = mock_client.update_item.call_args.kwargs
+        assert update["Key"] == {"answerId": {"S": "answer-1"}}
+        assert update["ExpressionAttributeValues"] == {
+            ":tenant_id": {"S": "tenant-1"},
+            ":participation_id": {"S": "participation-1"},
+        }
+
+    def test_answer_migration_load_failure_stops_logging(self, mocker, root_logger):
+        """
+        Test that a failed lookup load stops and removes the log handler.
 
-    def test_backward_compatibility_api(self):
+        Workflow:
+        1. Loading the session tenants fails
+        2. Run migration script twice in this process
+        3. Verify each run exits 1 with its listener stopped
+        4. Verify no log handler is left on the root logger
+        """
+        handlers = root_logger.handlers[:]
+        mocker.patch.object(
+            migrate_answers,
+            "load_session_tenants",
+            side_effect=ClientError(
+                {"Error": {"Code": "ResourceNotFoundException"}}, "Scan"
+            ),
+        )
+        start_logging = mocker.spy(migrate_answers, "start_logging")
+
+        for _ in range(2):
+            with pytest.raises(SystemExit) as exit_info:
+                migrate_answers.main(["--segments", "1"])
+
+            assert exit_info.value.code == 1
+            listener, _ = start_logging.spy_return
+            assert listener._thread is None
+            assert root_logger.handlers == handlers
+
+    def test_backward_compatibility_api(self, mocker):
         """
         Test that APIs work without tenant context (backward compatibility).
 
         Workflow:
-        1. Call API without tenant context in token
-        2. Verify default tenant is used
+        1. Call API with a legacy token that has no tenant context
+        2. Verify the session is created
         3. Verify response format is unchanged
         """
-        default_tenant_id = "00000000-0000-0000-0000-000000000000"
-
-        from common import backward_compatibility
+        from auth import generate_token
         from create_quiz import handler as create_quiz_handler
 
-        with (
-            patch.object(
-                backward_compatibility, "ensure_tenant_context"
-            ) as mock_ensure,
-            patch.object(create_quiz_handler, "table") as mock_table,
-        ):
-            mock_ensure.return_value = default_tenant_id
-            mock_table.put_item.return_value = {}
-
-            # Legacy request without tenant context
-            event = {
-                "body": json.dumps(
-                    {
-                        "title": "Legacy Quiz",
-                        "description": "Created without tenant context",
-                    }
-                ),
-                "headers": {},
-                "requestContext": {},  # No authorizer
-            }
+        mock_put = mocker.patch.object(create_quiz_handler, "put_item")
+
+        # Legacy request without tenant context
+        event = {
+            "body": json.dumps(
+                {
+                    "title": "Legacy Quiz",
+                    "description": "Created without tenant context",
+                }
+            ),
+            "headers": {
+                "Authorization": f"Bearer {generate_token('admin-1', 'admin')}"
+            },
+        }
 
-            response = create_quiz_handler.lambda_handler(event, {})
+        response = create_quiz_handler.lambda_handler(event, {})
 
-            # Should succeed
-            assert response["statusCode"] == 201
-            body = json.loads(response["body"])
+        # Should succeed
+        assert response["statusCode"] == 201
+        body = json.loads(response["body"])
+        mock_put.assert_called_once()
 
-            # Response format should be unchanged (backward compatible)
-            assert "sessionId" in body
-            assert "title" in body
-            # tenantId might be included but not required for backward compatibility
+        # Response format should be unchanged (backward compatible)
+        assert "sessionId" in body
+        assert "title" in body
+        # tenantId might be included but not required for backward compatibility
 
-    def test_full_migration_workflow(self):
+    def test_full_migration_workflow(self, mocker):
         """
         Test the complete migration workflow from start to finish.
 
@@ -276,32 +399,58 @@ class TestMigrationScenarios:
         5. Migrate answers
         6. Verify system works end-to-end
         """
-        default_tenant_id = "00000000-0000-0000-0000-000000000000"
-
-        # Import the script module first
-        scripts_path = os.path.join(os.path.dirname(__file__), "..", "..", "scripts")
-        if scripts_path not in sys.path:
-            sys.path.insert(0, scripts_path)
-
-        import run_full_migration
-
-        # This would call the full migration script
-        with (
-            patch.object(run_full_migration, "setup_default_tenant") as mock_setup,
-            patch.object(run_full_migration, "migrate_admins") as mock_migrate_admins,
-            patch.object(
-                run_full_migration, "migrate_sessions"
-            ) as mock_migrate_sessions,
-            patch.object(
-                run_full_migration, "migrate_participants"
-            ) as mock_migrate_participants,
-            patch.object(run_full_migration, "migrate_answers") as mock_migrate_answers,
-        ):
-            run_full_migration.run_full_migration()
-
-            # Verify all migration steps were called
-            mock_setup.assert_called_once()
-            mock_migrate_admins.assert_called_once()
-            mock_migrate_sessions.assert_called_once()
-            mock_migrate_participants.assert_called_once()
-            mock_migrate_answers.assert_called_once()
+        mocker.patch.object(sys, "argv", ["run_full_migration.py", "--dry-run"])
+        mock_run_in_process = mocker.patch.object(
+            run_full_migration, "run_in_process", return_value=True
+        )
+        mock_run_concurrently = mocker.patch.object(
+            run_full_migration, "run_scripts_concurrently", return_value=[]
+        )
+
+        with pytest.raises(SystemExit) as exit_info:
+            run_full_migration.main()
+
+        assert exit_info.value.code == 0
+
+        # Tenant, admin and answer steps run in process, in order
+        assert [call.args[0] for call in mock_run_in_process.call_args_list] == [
+            setup_default_tenant.main,
+            migrate_admins.main,
+            migrate_answers.main,
+        ]
+        assert all(
+            call.args[1] == ["--dry-run"] for call in mock_run_in_process.call_args_list
+        )
+
+        # Sessions and participants run concurrently in between
+        steps, script_args = mock_run_concurrently.call_args.args
+        assert [script_name for _, script_name, _ in steps] == [
+            "migrate_sessions.py",
+            "migrate_participants.py",
+        ]
+        assert script_args == ["--dry-run"]
+
+    def test_full_migration_reports_crashing_step(self, mocker, capsys):
+        """
+        Test that an in-process step raising a non-ClientError fails its step.
+
+        Workflow:
+        1. Admin migration raises NoCredentialsError
+        2. Run the full migration
+        3. Verify it stops with the failed-step summary and exit code 1
+        """
+        mocker.patch.object(sys, "argv", ["run_full_migration.py", "--dry-run"])
+        mocker.patch.object(setup_default_tenant, "main")
+        mocker.patch.object(migrate_admins, "main", side_effect=NoCredentialsError())
+        mock_run_concurrently = mocker.patch.object(
+            run_full_migration, "run_scripts_concurrently"
+        )
+
+        with pytest.raises(SystemExit) as exit_info:
+            run_full_migration.main()
+
+        assert exit_info.value.code == 1
+        captured = capsys.readouterr()
+        assert "NoCredentialsError" in captured.err
+        assert "Migration failed at step 2" in captured.out
+        mock_run_concurrently.assert_not_called()
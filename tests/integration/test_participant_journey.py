@@ -12,20 +12,22 @@ Tests the full participant experience including:
 
 import json
 import pytest
-from unittest.mock import patch, MagicMock
-import sys
-import os
+from unittest.mock import patch
 
-lambda_path = os.path.abspath(
-    os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
-)
-sys.path.insert(0, lambda_path)
+from auth import generate_token
+from get_scoreboard.handler import lambda_handler as scoreboard_handler
+from join_session.handler import lambda_handler as join_handler
+from register_global_participant.handler import lambda_handler as register_handler
+from submit_answer.handler import lambda_handler as submit_handler
+from update_global_participant.handler import lambda_handler as update_handler
+
+from ..conftest import StubUUID
 
 
 class TestParticipantJourney:
     """Integration tests for complete participant journey"""
 
-    def test_complete_participant_journey(self):
+    def test_complete_participant_journey(self, stored_participants):
         """
         Test the complete journey of a participant from registration to scoring.
 
@@ -46,14 +48,11 @@ class TestParticipantJourney:
         # Step 1: Register participant
         with (
             patch("register_global_participant.handler.get_item") as mock_get_tenant,
+            patch("register_global_participant.handler.scan", return_value=[]),
             patch(
                 "register_global_participant.handler.put_item"
             ) as mock_put_participant,
         ):
-            from register_global_participant.handler import (
-                lambda_handler as register_handler,
-            )
-
             mock_get_tenant.return_value = {
                 "tenantId": tenant_id,
                 "name": "Test Org",
@@ -67,7 +66,7 @@ class TestParticipantJourney:
                 "headers": {},
             }
 
-            with patch("uuid.uuid4", return_value=MagicMock(hex=participant_id)):
+            with patch("uuid.uuid4", return_value=StubUUID(participant_id)):
                 response = register_handler(register_event, {})
 
             assert response["statusCode"] == 201
@@ -77,14 +76,16 @@ class TestParticipantJourney:
             assert "token" in body
             participant_token = body["token"]
 
+            # The participant middleware reads back the stored record
+            mock_put_participant.assert_called_once()
+            stored_participants[participant_id] = mock_put_participant.call_args.args[1]
+
         # Step 2: Join session
         with (
             patch("join_session.handler.get_item") as mock_get_session,
             patch("join_session.handler.query") as mock_query_participation,
             patch("join_session.handler.put_item") as mock_put_participation,
         ):
-            from join_session.handler import lambda_handler as join_handler
-
             mock_get_session.return_value = {
                 "sessionId": session_id,
                 "tenantId": tenant_id,
@@ -105,10 +106,10 @@ class TestParticipantJourney:
                 },
             }
 
-            with patch("uuid.uuid4", return_value=MagicMock(hex=participation_id)):
+            with patch("uuid.uuid4", return_value=StubUUID(participation_id)):
                 response = join_handler(join_event, {})
 
-            assert response["statusCode"] == 200
+            assert response["statusCode"] == 201
             body = json.loads(response["body"])
             assert body["participationId"] == participation_id
             assert body["totalPoints"] == 0
@@ -120,19 +121,19 @@ class TestParticipantJourney:
             patch("submit_answer.handler.put_item") as mock_put_answer,
             patch("submit_answer.handler.update_item") as mock_update_participation,
         ):
-            from submit_answer.handler import lambda_handler as submit_handler
-
-            mock_get_session_answer.return_value = {
-                "sessionId": session_id,
-                "tenantId": tenant_id,
-                "currentRound": 1,
-            }
+            # Session lookup, then the round lookup (keyed by roundNumber)
+            mock_get_session_answer.side_effect = lambda table_name, key: (
+                {"sessionId": session_id, "roundNumber": 1, "correctAnswer": 2}
+                if "roundNumber" in key
+                else {"sessionId": session_id, "tenantId": tenant_id, "currentRound": 1}
+            )
 
             mock_query_participation_answer.return_value = [
                 {
                     "participationId": participation_id,
                     "participantId": participant_id,
                     "sessionId": session_id,
+                    "tenantId": tenant_id,
                     "totalPoints": 0,
                     "correctAnswers": 0,
                 }
@@ -141,10 +142,10 @@ class TestParticipantJourney:
             submit_event = {
                 "body": json.dumps(
                     {
+                        "participantId": participant_id,
                         "sessionId": session_id,
                         "roundNumber": 1,
                         "answer": 2,
-                        "timeElapsed": 5.5,
                     }
                 ),
                 "headers": {"Authorization": f"Bearer {participant_token}"},
@@ -158,31 +159,35 @@ class TestParticipantJourney:
 
             response = submit_handler(submit_event, {})
 
-            assert response["statusCode"] == 200
+            assert response["statusCode"] == 201
             body = json.loads(response["body"])
-            assert "points" in body
+            assert body["isCorrect"] is True
+            assert body["points"] > 0
+
+            # Score is added to the participation
+            mock_put_answer.assert_called_once()
+            mock_update_participation.assert_called_once()
 
         # Step 4: Check scoreboard
         with (
-            patch("get_scoreboard.handler.get_item") as mock_get_session_scoreboard,
+            patch("get_scoreboard.handler.get_item") as mock_get_scoreboard,
             patch("get_scoreboard.handler.query") as mock_query_participations,
         ):
-            from get_scoreboard.handler import lambda_handler as scoreboard_handler
-
-            mock_get_session_scoreboard.return_value = {
-                "sessionId": session_id,
-                "tenantId": tenant_id,
-            }
+            # Session lookup, then the participant profile lookup
+            mock_get_scoreboard.side_effect = lambda table_name, key: (
+                stored_participants.get(key["participantId"])
+                if "participantId" in key
+                else {"sessionId": session_id, "tenantId": tenant_id}
+            )
 
             mock_query_participations.return_value = [
                 {
                     "participationId": participation_id,
                     "participantId": participant_id,
                     "sessionId": session_id,
+                    "tenantId": tenant_id,
                     "totalPoints": 100,
                     "correctAnswers": 1,
-                    "name": "John Doe",
-                    "avatar": "😀",
                 }
             ]
 
@@ -194,27 +199,22 @@ class TestParticipantJourney:
             response = scoreboard_handler(scoreboard_event, {})
 
             assert response["statusCode"] == 200
-            body = json.loads(response["body"])
-            assert len(body["participants"]) == 1
-            assert body["participants"][0]["name"] == "John Doe"
-            assert body["participants"][0]["totalPoints"] == 100
+            scoreboard = json.loads(response["body"])["scoreboard"]
+            assert len(scoreboard) == 1
+            assert scoreboard[0]["name"] == "John Doe"
+            assert scoreboard[0]["totalPoints"] == 100
 
         # Step 5: Update profile
         with (
-            patch("update_global_participant.handler.get_item") as mock_get_participant,
+            patch("update_global_participant.handler.scan", return_value=[]),
             patch(
                 "update_global_participant.handler.update_item"
             ) as mock_update_participant,
         ):
-            from update_global_participant.handler import (
-                lambda_handler as update_handler,
-            )
-
-            mock_get_participant.return_value = {
-                "participantId": participant_id,
-                "tenantId": tenant_id,
-                "name": "John Doe",
-                "avatar": "😀",
+            mock_update_participant.return_value = {
+                **stored_participants[participant_id],
+                "name": "Jane Doe",
+                "avatar": "😎",
             }
 
             update_event = {
@@ -236,74 +236,53 @@ class TestParticipantJourney:
             assert body["name"] == "Jane Doe"
             assert body["avatar"] == "😎"
 
-    def test_multi_session_participation(self):
+    @pytest.mark.parametrize(
+        "session_id,participation_id,total_points",
+        [
+            ("session-1", "participation-1", 100),
+            ("session-2", "participation-2", 200),
+        ],
+        ids=["session-1", "session-2"],
+    )
+    def test_multi_session_participation(
+        self, stored_participants, session_id, participation_id, total_points
+    ):
         """
         Test participant joining multiple sessions with independent scores.
 
-        Workflow:
-        1. Participant registers
-        2. Participant joins session 1
-        3. Participant earns points in session 1
-        4. Participant joins session 2
-        5. Participant earns different points in session 2
-        6. Verify scores are independent
+        Each case is one of the participant's sessions:
+        1. Participant joins the session
+        2. Participant earns the session's points
+        3. Verify the session's scoreboard shows only those points
         """
         tenant_id = "test-tenant"
         participant_id = "participant-123"
-        session1_id = "session-1"
-        session2_id = "session-2"
-        participation1_id = "participation-1"
-        participation2_id = "participation-2"
 
-        # Register participant (already tested above, simplified here)
-        participant_token = "mock_token"
+        # Registered participant (registration is tested above)
+        stored_participants[participant_id] = {
+            "participantId": participant_id,
+            "tenantId": tenant_id,
+            "name": "Test User",
+            "avatar": "😀",
+        }
+        participant_token = generate_token(participant_id, "participant", tenant_id)
 
-        # Join session 1
         with (
             patch("join_session.handler.get_item") as mock_get_session,
             patch("join_session.handler.query") as mock_query,
-            patch("join_session.handler.put_item") as mock_put,
-        ):
-            from join_session.handler import lambda_handler as join_handler
-
-            mock_get_session.return_value = {
-                "sessionId": session1_id,
-                "tenantId": tenant_id,
-            }
-            mock_query.return_value = []
-
-            event1 = {
-                "pathParameters": {"sessionId": session1_id},
-                "headers": {"Authorization": f"Bearer {participant_token}"},
-                "requestContext": {
-                    "authorizer": {
-                        "participantId": participant_id,
-                        "tenantId": tenant_id,
-                    }
-                },
-            }
-
-            with patch("uuid.uuid4", return_value=MagicMock(hex=participation1_id)):
-                response1 = join_handler(event1, {})
-
-            assert response1["statusCode"] == 200
-            body1 = json.loads(response1["body"])
-            assert body1["participationId"] == participation1_id
-
-        # Join session 2
-        with (
-            patch("join_session.handler.get_item") as mock_get_session,
-            patch("join_session.handler.query") as mock_query,
-            patch("join_session.handler.put_item") as mock_put,
+            patch("join_session.handler.put_item"),
+            patch("get_scoreboard.handler.get_item") as mock_get_session_scoreboard,
+            patch("get_scoreboard.handler.query") as mock_query_scoreboard,
         ):
+            # Join the session
             mock_get_session.return_value = {
-                "sessionId": session2_id,
+                "sessionId": session_id,
                 "tenantId": tenant_id,
             }
             mock_query.return_value = []
 
-            event2 = {
-                "pathParameters": {"sessionId": session2_id},
+            join_event = {
+                "pathParameters": {"sessionId": session_id},
                 "headers": {"Authorization": f"Bearer {participant_token}"},
                 "requestContext": {
                     "authorizer": {
@@ -313,63 +292,41 @@ class TestParticipantJourney:
                 },
             }
 
-            with patch("uuid.uuid4", return_value=MagicMock(hex=participation2_id)):
-                response2 = join_handler(event2, {})
-
-            assert response2["statusCode"] == 200
-            body2 = json.loads(response2["body"])
-            assert body2["participationId"] == participation2_id
-            # Verify different participation IDs
-            assert participation1_id != participation2_id
+            with patch("uuid.uuid4", return_value=StubUUID(participation_id)):
+                response = join_handler(join_event, {})
 
-        # Verify independent scoreboards
-        with (
-            patch("get_scoreboard.handler.get_item") as mock_get_session,
-            patch("get_scoreboard.handler.query") as mock_query,
-        ):
-            from get_scoreboard.handler import lambda_handler as scoreboard_handler
+            assert response["statusCode"] == 201
+            body = json.loads(response["body"])
+            assert body["participationId"] == participation_id
 
-            # Session 1 scoreboard
-            mock_get_session.return_value = {
-                "sessionId": session1_id,
-                "tenantId": tenant_id,
-            }
-            mock_query.return_value = [
+            # Verify the session's scoreboard
+            mock_get_session_scoreboard.side_effect = lambda table_name, key: (
+                stored_participants.get(key["participantId"])
+                if "participantId" in key
+                else {"sessionId": session_id, "tenantId": tenant_id}
+            )
+            mock_query_scoreboard.return_value = [
                 {
-                    "participationId": participation1_id,
-                    "totalPoints": 100,
-                    "name": "Test User",
+                    "participationId": participation_id,
+                    "participantId": participant_id,
+                    "sessionId": session_id,
+                    "tenantId": tenant_id,
+                    "totalPoints": total_points,
                 }
             ]
 
-            event_sb1 = {"pathParameters": {"sessionId": session1_id}, "headers": {}}
-
-            response_sb1 = scoreboard_handler(event_sb1, {})
-            body_sb1 = json.loads(response_sb1["body"])
-
-            # Session 2 scoreboard
-            mock_get_session.return_value = {
-                "sessionId": session2_id,
-                "tenantId": tenant_id,
+            scoreboard_event = {
+                "pathParameters": {"sessionId": session_id},
+                "headers": {},
             }
-            mock_query.return_value = [
-                {
-                    "participationId": participation2_id,
-                    "totalPoints": 200,
-                    "name": "Test User",
-                }
-            ]
 
-            event_sb2 = {"pathParameters": {"sessionId": session2_id}, "headers": {}}
+            scoreboard_response = scoreboard_handler(scoreboard_event, {})
+            scoreboard_body = json.loads(scoreboard_response["body"])
 
-            response_sb2 = scoreboard_handler(event_sb2, {})
-            body_sb2 = json.loads(response_sb2["body"])
+            assert scoreboard_body["scoreboard"][0]["name"] == "Test User"
+            assert scoreboard_body["scoreboard"][0]["totalPoints"] == total_points
 
-            # Verify different scores
-            assert body_sb1["participants"][0]["totalPoints"] == 100
-            assert body_sb2["participants"][0]["totalPoints"] == 200
-
-    def test_cross_tenant_participant_isolation(self):
+    def test_cross_tenant_participant_isolation(self, stored_participants):
         """
         Test that participants cannot join sessions from different tenants.
 
@@ -384,11 +341,14 @@ class TestParticipantJourney:
         participant_id = "participant-123"
         session2_id = "session-in-tenant-2"
 
-        with (
-            patch("join_session.handler.get_item") as mock_get_session,
-        ):
-            from join_session.handler import lambda_handler as join_handler
+        stored_participants[participant_id] = {
+            "participantId": participant_id,
+            "tenantId": tenant1_id,
+            "name": "Test User",
+        }
+        participant_token = generate_token(participant_id, "participant", tenant1_id)
 
+        with (patch("join_session.handler.get_item") as mock_get_session,):
             # Session belongs to tenant 2
             mock_get_session.return_value = {
                 "sessionId": session2_id,
@@ -399,7 +359,7 @@ class TestParticipantJourney:
             # Participant from tenant 1 tries to join
             event = {
                 "pathParameters": {"sessionId": session2_id},
-                "headers": {"Authorization": "Bearer mock_token"},
+                "headers": {"Authorization": f"Bearer {participant_token}"},
                 "requestContext": {
                     "authorizer": {
                         "participantId": participant_id,
@@ -11,16 +11,11 @@ Tests the full lifecycle of tenant management including:
 """
 
 import json
-import pytest
-from unittest.mock import patch, MagicMock
-import sys
-import os
+from unittest.mock import patch
 
-# Add lambda directories to path
-lambda_path = os.path.abspath(
-    os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
-)
-sys.path.insert(0, lambda_path)
+from auth import generate_token
+
+from ..conftest import StubUUID
 
 
 class TestTenantLifecycle:
@@ -58,7 +53,7 @@ class TestTenantLifecycle:
 
             mock_put_tenant.return_value = None
 
-            with patch("uuid.uuid4", return_value=MagicMock(hex=tenant_id)):
+            with patch("uuid.uuid4", return_value=StubUUID(tenant_id)):
                 response = create_tenant_handler(create_tenant_event, {})
 
             assert response["statusCode"] == 201
@@ -98,7 +93,7 @@ class TestTenantLifecycle:
                 "headers": {},
             }
 
-            with patch("uuid.uuid4", return_value=MagicMock(hex=admin_id)):
+            with patch("uuid.uuid4", return_value=StubUUID(admin_id)):
                 response = create_admin_handler(create_admin_event, {})
 
             assert response["statusCode"] == 201
@@ -137,18 +132,26 @@ class TestTenantLifecycle:
             body = json.loads(response["body"])
             assert "token" in body
             assert body["tenantId"] == tenant_id
+            admin_token = body["token"]
 
         # Step 4: Tenant admin creates session
-        with patch("create_quiz.handler.put_item") as mock_put_session:
+        with (
+            patch("create_quiz.handler.put_item") as mock_put_session,
+            patch("tenant_middleware.get_item") as mock_get_tenant_session,
+        ):
             from create_quiz.handler import lambda_handler as create_session_handler
 
+            mock_get_tenant_session.return_value = {
+                "tenantId": tenant_id,
+                "name": "Test Organization",
+                "status": "active",
+            }
+
             create_session_event = {
                 "body": json.dumps(
                     {"title": "Test Quiz", "description": "A test quiz session"}
                 ),
-                "headers": {
-                    "Authorization": f"Bearer mock_token_with_tenant_{tenant_id}"
-                },
+                "headers": {"Authorization": f"Bearer {admin_token}"},
                 "requestContext": {
                     "authorizer": {
                         "tenantId": tenant_id,
@@ -158,7 +161,7 @@ class TestTenantLifecycle:
                 },
             }
 
-            with patch("uuid.uuid4", return_value=MagicMock(hex=session_id)):
+            with patch("uuid.uuid4", return_value=StubUUID(session_id)):
                 response = create_session_handler(create_session_event, {})
 
             assert response["statusCode"] == 201
@@ -166,15 +169,12 @@ class TestTenantLifecycle:
             assert body["tenantId"] == tenant_id
 
         # Step 5: Update tenant
-        with (
-            patch("update_tenant.handler.get_item") as mock_get_tenant_update,
-            patch("update_tenant.handler.update_item") as mock_update_tenant,
-        ):
+        with patch("update_tenant.handler.update_item") as mock_update_tenant:
             from update_tenant.handler import lambda_handler as update_tenant_handler
 
-            mock_get_tenant_update.return_value = {
+            mock_update_tenant.return_value = {
                 "tenantId": tenant_id,
-                "name": "Test Organization",
+                "name": "Updated Organization Name",
                 "status": "active",
             }
 
@@ -187,6 +187,8 @@ class TestTenantLifecycle:
             response = update_tenant_handler(update_tenant_event, {})
 
             assert response["statusCode"] == 200
+            body = json.loads(response["body"])
+            assert body["name"] == "Updated Organization Name"
 
         # Step 6: Delete tenant
         with (
@@ -210,7 +212,7 @@ class TestTenantLifecycle:
 
             assert response["statusCode"] == 200
             body = json.loads(response["body"])
-            assert "deleted successfully" in body["message"].lower()
+            assert body["message"] == "Tenant successfully deleted"
 
     def test_tenant_admin_isolation(self):
         """
@@ -229,31 +231,34 @@ class TestTenantLifecycle:
         admin2_id = "admin-2"
         session1_id = "session-1"
 
-        # Create sessions for both tenants
-        with patch("create_quiz.handler.put_item"):
+        # Admin 1 creates session in tenant 1
+        with (
+            patch("create_quiz.handler.put_item"),
+            patch("tenant_middleware.get_item") as mock_get_tenant,
+        ):
             from create_quiz.handler import lambda_handler as create_session_handler
 
-            # Admin 1 creates session in tenant 1
+            mock_get_tenant.return_value = {"tenantId": tenant1_id, "status": "active"}
+
             event1 = {
                 "body": json.dumps({"title": "Tenant 1 Quiz"}),
-                "headers": {},
-                "requestContext": {
-                    "authorizer": {
-                        "tenantId": tenant1_id,
-                        "adminId": admin1_id,
-                        "role": "tenant_admin",
-                    }
+                "headers": {
+                    "Authorization": "Bearer "
+                    + generate_token(admin1_id, "tenant_admin", tenant1_id)
                 },
             }
 
-            with patch("uuid.uuid4", return_value=MagicMock(hex=session1_id)):
+            with patch("uuid.uuid4", return_value=StubUUID(session1_id)):
                 response1 = create_session_handler(event1, {})
 
             assert response1["statusCode"] == 201
+            assert json.loads(response1["body"])["tenantId"] == tenant1_id
 
-        # Admin 2 tries to access tenant 1's session
-        with patch("get_quiz.handler.get_item") as mock_get_session:
-            from get_quiz.handler import lambda_handler as get_session_handler
+        # Admin 2 tries to list the participants of tenant 1's session
+        with patch("get_participants.handler.get_item") as mock_get_session:
+            from get_participants.handler import (
+                lambda_handler as get_participants_handler,
+            )
 
             mock_get_session.return_value = {
                 "sessionId": session1_id,
@@ -263,17 +268,14 @@ class TestTenantLifecycle:
 
             event2 = {
                 "pathParameters": {"sessionId": session1_id},
-                "headers": {},
-                "requestContext": {
-                    "authorizer": {
-                        "tenantId": tenant2_id,  # Different tenant!
-                        "adminId": admin2_id,
-                        "role": "tenant_admin",
-                    }
+                "headers": {
+                    "Authorization": "Bearer "
+                    # Different tenant!
+                    + generate_token(admin2_id, "tenant_admin", tenant2_id)
                 },
             }
 
-            response2 = get_session_handler(event2, {})
+            response2 = get_participants_handler(event2, {})
 
             # Should be denied
             assert response2["statusCode"] == 403
@@ -285,32 +287,24 @@ class TestTenantLifecycle:
         Test that the system works in single-tenant mode with default tenant.
 
         Workflow:
-        1. Create session without explicit tenant context
-        2. Verify session is assigned to default tenant
-        3. Verify existing admins work with default tenant
+        1. Legacy admin token without a tenant creates a session
+        2. Verify the session is created without a tenant lookup
         """
-        default_tenant_id = "00000000-0000-0000-0000-000000000000"
-
-        with (
-            patch("create_quiz.handler.put_item") as mock_put,
-            patch("backward_compatibility.ensure_tenant_context") as mock_ensure_tenant,
-        ):
+        with patch("create_quiz.handler.put_item") as mock_put:
             from create_quiz.handler import lambda_handler as create_session_handler
 
-            # Mock backward compatibility to add default tenant
-            mock_ensure_tenant.return_value = default_tenant_id
-
-            # Request without tenant context (legacy format)
+            # Legacy admin token (no tenant context)
             event = {
                 "body": json.dumps({"title": "Legacy Quiz"}),
-                "headers": {},
-                "requestContext": {},  # No authorizer with tenant
+                "headers": {
+                    "Authorization": f"Bearer {generate_token('legacy-admin', 'admin')}"
+                },
             }
 
             response = create_session_handler(event, {})
 
-            # Should succeed with default tenant
+            # Should succeed without a tenant lookup
             assert response["statusCode"] == 201
             body = json.loads(response["body"])
-            # Verify default tenant was used
             assert "sessionId" in body
+            mock_put.assert_called_once()
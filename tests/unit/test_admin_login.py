@@ -10,6 +10,7 @@ Tests cover:
 - Missing username or password fields
 - DynamoDB query errors
 - Admin with missing password hash
+- Scheduled warm-up pings
 """
 import json
 import pytest
@@ -382,3 +383,20 @@ class TestAdminLoginCORS:
         assert "Access-Control-Allow-Origin" in response["headers"]
         assert "Access-Control-Allow-Methods" in response["headers"]
         assert "Access-Control-Allow-Headers" in response["headers"]
+
+
+class TestAdminLoginWarmup:
+    """Test scheduled warm-up ping handling"""
+
+    @patch("handler.query")
+    def test_warmup_ping_skips_work(self, mock_query):
+        """Test warm-up ping returns pong without touching DynamoDB"""
+        from handler import lambda_handler
+
+        event = {"source": "aws.events", "detail-type": "Scheduled Event"}
+
+        response = lambda_handler(event, {})
+
+        assert response == {"statusCode": 200, "body": "pong"}
+        mock_query.assert_not_called()
+
@@ -0,0 +1,130 @@
+"""
+Property-Based Tests for the admin_route Handler Decorator
+
+Tests cover:
+- Requests without a valid admin token never reach the wrapped handler
+- Admin tokens reach the handler with the tenant context from the token
+- Tokens without a role claim are not treated as admin tokens
+- Unexpected exceptions become 500 INTERNAL_ERROR responses
+
+These tests use Hypothesis for property-based testing to verify universal properties
+across many randomly generated inputs.
+"""
+
+import json
+from hypothesis import given, settings, strategies as st
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add lambda directories to path
+lambda_path = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
+)
+sys.path.insert(0, os.path.join(lambda_path, "common"))
+
+
+class TestAdminRouteProperties:
+    """Property-based tests for the admin_route decorator"""
+
+    @settings(max_examples=50, deadline=None)
+    @given(
+        role=st.sampled_from(["admin", "tenant_admin", "super_admin"]),
+        admin_id=st.uuids(),
+        tenant_id=st.uuids(),
+    )
+    def test_admin_token_reaches_handler_with_tenant_context(
+        self, role, admin_id, tenant_id
+    ):
+        """For any admin role, the handler receives the token's tenant context"""
+        from auth import generate_token
+        from tenant_middleware import admin_route
+
+        inner = MagicMock(return_value={"statusCode": 200})
+        handler = admin_route()(inner)
+        token = generate_token(str(admin_id), role, str(tenant_id))
+
+        response = handler({"headers": {"Authorization": f"Bearer {token}"}}, {})
+
+        assert response == {"statusCode": 200}
+        tenant_context = inner.call_args[0][2]
+        assert tenant_context == {
+            "adminId": str(admin_id),
+            "role": role,
+            "tenantId": str(tenant_id),
+        }
+
+    @settings(max_examples=50, deadline=None)
+    @given(participant_id=st.uuids(), tenant_id=st.uuids())
+    def test_non_admin_role_is_rejected(self, participant_id, tenant_id):
+        """For any non-admin token, the handler is not called and 403 is returned"""
+        from auth import generate_token
+        from tenant_middleware import admin_route
+
+        inner = MagicMock()
+        handler = admin_route()(inner)
+        token = generate_token(str(participant_id), "participant", str(tenant_id))
+
+        response = handler({"headers": {"Authorization": f"Bearer {token}"}}, {})
+
+        assert response["statusCode"] == 403
+        body = json.loads(response["body"])
+        assert body["error"]["code"] == "INSUFFICIENT_PERMISSIONS"
+        inner.assert_not_called()
+
+    def test_token_without_role_is_rejected(self):
+        """A validly signed token without a role claim never reaches the handler"""
+        import time
+        import jwt
+        from auth import JWT_ALGORITHM, JWT_SECRET
+        from tenant_middleware import admin_route
+
+        inner = MagicMock()
+        handler = admin_route()(inner)
+        token = jwt.encode(
+            {"sub": "admin-1", "exp": int(time.time()) + 3600},
+            JWT_SECRET,
+            algorithm=JWT_ALGORITHM,
+        )
+
+        response = handler({"headers": {"Authorization": f"Bearer {token}"}}, {})
+
+        assert response["statusCode"] == 403
+        inner.assert_not_called()
+
+    @settings(max_examples=50, deadline=None)
+    @given(
+        headers=st.one_of(
+            st.none(),
+            st.just({}),
+            st.builds(
+                lambda value: {"Authorization": value},
+                st.text(max_size=50).filter(lambda x: not x.startswith("Bearer ")),
+            ),
+        )
+    )
+    def test_missing_or_malformed_header_is_rejected(self, headers):
+        """For any missing or malformed Authorization header, 401 is returned"""
+        from tenant_middleware import admin_route
+
+        inner = MagicMock()
+        handler = admin_route()(inner)
+
+        response = handler({"headers": headers}, {})
+
+        assert response["statusCode"] == 401
+        inner.assert_not_called()
+
+    def test_unexpected_error_returns_internal_error(self):
+        """Exceptions raised by the handler are turned into a 500 response"""
+        from auth import generate_token
+        from tenant_middleware import admin_route
+
+        handler = admin_route()(MagicMock(side_effect=RuntimeError("boom")))
+        token = generate_token("admin-1", "admin")
+
+        response = handler({"headers": {"Authorization": f"Bearer {token}"}}, {})
+
+        assert response["statusCode"] == 500
+        body = json.loads(response["body"])
+        assert body["error"]["code"] == "INTERNAL_ERROR"
@@ -345,3 +345,47 @@ class TestAPICompatibilityProperties:
         # Test with tenant context and tenantId
         result = get_tenant_from_context_or_default({"tenantId": "custom-tenant"})
         assert result == "custom-tenant"
+
+    def test_prebuilt_errors_match_error_response(self):
+        """
+        Prebuilt authentication errors are identical to freshly built ones.
+
+        Validates: Requirements 6.4
+        """
+        import errors
+
+        prebuilt = [
+            (errors.MISSING_TOKEN_RESPONSE, 401, "MISSING_TOKEN"),
+            (errors.INVALID_AUTH_FORMAT_RESPONSE, 401, "INVALID_AUTH_FORMAT"),
+            (errors.TOKEN_EXPIRED_RESPONSE, 401, "TOKEN_EXPIRED"),
+            (errors.INVALID_TOKEN_RESPONSE, 401, "INVALID_TOKEN"),
+            (errors.ADMIN_ROLE_REQUIRED_RESPONSE, 403, "INSUFFICIENT_PERMISSIONS"),
+            (
+                errors.PARTICIPANT_ROLE_REQUIRED_RESPONSE,
+                403,
+                "INSUFFICIENT_PERMISSIONS",
+            ),
+            (errors.MISSING_PARTICIPANT_ID_RESPONSE, 401, "INVALID_TOKEN"),
+            (errors.MISSING_TENANT_ID_RESPONSE, 401, "INVALID_TOKEN"),
+        ]
+
+        for response, status_code, error_code in prebuilt:
+            body = json.loads(response["body"])
+            assert response == errors.error_response(
+                status_code, error_code, body["error"]["message"]
+            )
+
+    def test_cors_headers_not_shared_between_responses(self):
+        """
+        Headers added to one response never leak into another.
+
+        Validates: Requirements 6.4
+        """
+        from cors import add_cors_headers, CORS_HEADERS
+
+        first = add_cors_headers({"statusCode": 200, "body": "{}"})
+        first["headers"]["Content-Type"] = "application/json"
+        second = add_cors_headers({"statusCode": 200, "body": "{}"})
+
+        assert "Content-Type" not in second["headers"]
+        assert second["headers"] == CORS_HEADERS
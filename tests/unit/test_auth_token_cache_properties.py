@@ -0,0 +1,90 @@
+"""
+Property-Based Tests for JWT Validation Caching
+
+Tests cover:
+- Repeat validation of the same token skips signature verification
+- Cached payloads are never served past the token's expiry
+- Invalid tokens are never cached
+
+These tests use Hypothesis for property-based testing to verify universal properties
+across many randomly generated inputs.
+"""
+
+import pytest
+from hypothesis import given, settings, strategies as st
+from unittest.mock import patch
+import sys
+import os
+import jwt
+import time
+
+# Add lambda directories to path
+lambda_path = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
+)
+sys.path.insert(0, os.path.join(lambda_path, "common"))
+
+import auth
+
+
+def _make_token(user_id, tenant_id, expires_in):
+    now = int(time.time())
+    payload = {
+        "sub": user_id,
+        "role": "participant",
+        "tenantId": tenant_id,
+        "iat": now,
+        "exp": now + expires_in,
+    }
+    return jwt.encode(payload, auth.JWT_SECRET, algorithm=auth.JWT_ALGORITHM)
+
+
+class TestTokenCacheProperties:
+    """Property-based tests for validated token caching"""
+
+    def setup_method(self):
+        auth._token_cache.clear()
+
+    @settings(max_examples=50, deadline=None)
+    @given(user_id=st.uuids(), tenant_id=st.uuids(), repeats=st.integers(2, 5))
+    def test_repeat_validation_decodes_once(self, user_id, tenant_id, repeats):
+        """For any valid token, only the first validation verifies the signature"""
+        auth._token_cache.clear()
+        token = _make_token(str(user_id), str(tenant_id), 3600)
+
+        with patch("auth.jwt.decode", wraps=jwt.decode) as mock_decode:
+            payloads = [auth.validate_token(token) for _ in range(repeats)]
+
+        assert mock_decode.call_count == 1
+        assert all(p["sub"] == str(user_id) for p in payloads)
+        assert all(p["tenantId"] == str(tenant_id) for p in payloads)
+
+    def test_cached_payload_not_served_after_expiry(self):
+        """A cached token is re-verified once its expiry has passed"""
+        token = _make_token("user-1", "tenant-1", 30)
+        auth.validate_token(token)
+
+        with patch("auth.time.time", return_value=time.time() + 31):
+            with patch("auth.jwt.decode", wraps=jwt.decode) as mock_decode:
+                auth.validate_token(token)
+
+        mock_decode.assert_called_once()
+
+    def test_invalid_token_not_cached(self):
+        """Validation failures are never stored"""
+        with pytest.raises(jwt.InvalidTokenError):
+            auth.validate_token("not-a-jwt")
+
+        assert auth._token_cache == {}
+
+    def test_legacy_check_applies_to_cached_payloads(self):
+        """allow_legacy=False still rejects tenantless tokens served from cache"""
+        token = jwt.encode(
+            {"sub": "admin-1", "role": "admin", "exp": int(time.time()) + 3600},
+            auth.JWT_SECRET,
+            algorithm=auth.JWT_ALGORITHM,
+        )
+        auth.validate_token(token)
+
+        with pytest.raises(jwt.InvalidTokenError):
+            auth.validate_token(token, allow_legacy=False)
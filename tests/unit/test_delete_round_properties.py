@@ -0,0 +1,103 @@
+"""
+Property-Based Tests for Delete Round Lambda Handler
+
+Tests cover:
+- Admins can delete rounds of sessions in their own tenant
+- Cross-tenant deletes are rejected before anything is deleted
+
+These tests use Hypothesis for property-based testing to verify universal properties
+across many randomly generated inputs.
+"""
+
+import json
+from hypothesis import given, settings, strategies as st
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+# Add lambda directories to path
+lambda_path = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
+)
+sys.path.insert(0, os.path.join(lambda_path, "delete_round"))
+sys.path.insert(0, os.path.join(lambda_path, "common"))
+
+
+def _event(token, session_id, round_number=1):
+    return {
+        "headers": {"Authorization": f"Bearer {token}"},
+        "pathParameters": {"sessionId": session_id, "roundNumber": str(round_number)},
+    }
+
+
+def _tables(session_tenant_id):
+    """Sessions and rounds table mocks for a session of the given tenant."""
+    sessions_table = MagicMock()
+    sessions_table.get_item.return_value = {
+        "Item": {"sessionId": "session-1", "tenantId": session_tenant_id}
+    }
+    rounds_table = MagicMock()
+    rounds_table.get_item.return_value = {
+        "Item": {"sessionId": "session-1", "roundNumber": 1}
+    }
+    rounds_table.query.return_value = {"Count": 0}
+    return sessions_table, rounds_table
+
+
+class TestDeleteRoundProperties:
+    """Property-based tests for deleting rounds"""
+
+    @settings(max_examples=50, deadline=None)
+    @given(tenant_id=st.uuids(), round_number=st.integers(min_value=1, max_value=50))
+    def test_same_tenant_delete_succeeds(self, tenant_id, round_number):
+        """For any round of a session in the admin's tenant, the round is deleted"""
+        from auth import generate_token
+
+        sessions_table, rounds_table = _tables(str(tenant_id))
+
+        with patch("handler.get_table") as mock_get_table:
+            from handler import QUIZ_SESSIONS_TABLE, lambda_handler
+
+            mock_get_table.side_effect = lambda name: (
+                sessions_table if name == QUIZ_SESSIONS_TABLE else rounds_table
+            )
+            token = generate_token("admin-1", "tenant_admin", str(tenant_id))
+
+            response = lambda_handler(_event(token, "session-1", round_number), {})
+
+            assert response["statusCode"] == 200
+            body = json.loads(response["body"])
+            assert body["roundNumber"] == round_number
+            rounds_table.delete_item.assert_called_once_with(
+                Key={"sessionId": "session-1", "roundNumber": round_number}
+            )
+
+    @settings(max_examples=50, deadline=None)
+    @given(admin_tenant=st.uuids(), session_tenant=st.uuids())
+    def test_cross_tenant_delete_rejected(self, admin_tenant, session_tenant):
+        """For any session of another tenant, the delete is rejected with 403"""
+        from auth import generate_token
+
+        if admin_tenant == session_tenant:
+            return
+
+        sessions_table, rounds_table = _tables(str(session_tenant))
+
+        with (
+            patch("handler.get_table") as mock_get_table,
+            patch("handler.s3_client") as mock_s3,
+        ):
+            from handler import QUIZ_SESSIONS_TABLE, lambda_handler
+
+            mock_get_table.side_effect = lambda name: (
+                sessions_table if name == QUIZ_SESSIONS_TABLE else rounds_table
+            )
+            token = generate_token("admin-1", "tenant_admin", str(admin_tenant))
+
+            response = lambda_handler(_event(token, "session-1"), {})
+
+            assert response["statusCode"] == 403
+            body = json.loads(response["body"])
+            assert body["error"]["code"] == "CROSS_TENANT_ACCESS"
+            rounds_table.delete_item.assert_not_called()
+            mock_s3.delete_object.assert_not_called()
@@ -0,0 +1,100 @@
+"""
+Property-Based Tests for Delete Session Lambda Handler
+
+Tests cover:
+- Admins can delete sessions of their own tenant, with their rounds
+- Cross-tenant deletes are rejected before anything is deleted
+
+These tests use Hypothesis for property-based testing to verify universal properties
+across many randomly generated inputs.
+"""
+
+import json
+from hypothesis import given, settings, strategies as st
+from unittest.mock import patch
+import sys
+import os
+
+# Add lambda directories to path
+lambda_path = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
+)
+sys.path.insert(0, os.path.join(lambda_path, "delete_session"))
+sys.path.insert(0, os.path.join(lambda_path, "common"))
+
+
+def _event(token, session_id):
+    return {
+        "headers": {"Authorization": f"Bearer {token}"},
+        "pathParameters": {"sessionId": session_id},
+    }
+
+
+class TestDeleteSessionProperties:
+    """Property-based tests for deleting sessions"""
+
+    @settings(max_examples=50, deadline=None)
+    @given(tenant_id=st.uuids(), round_count=st.integers(min_value=0, max_value=5))
+    def test_same_tenant_delete_succeeds(self, tenant_id, round_count):
+        """For any session of the admin's tenant, it is deleted with its rounds"""
+        from auth import generate_token
+
+        with (
+            patch("handler.get_item") as mock_get_item,
+            patch("handler.query") as mock_query,
+            patch("handler.delete_item") as mock_delete_item,
+            patch("handler.s3_client") as mock_s3,
+        ):
+            from handler import lambda_handler
+
+            mock_get_item.return_value = {
+                "sessionId": "session-1",
+                "tenantId": str(tenant_id),
+            }
+            mock_query.return_value = [
+                {"sessionId": "session-1", "roundNumber": n, "audioKey": f"a/{n}.mp3"}
+                for n in range(1, round_count + 1)
+            ]
+            token = generate_token("admin-1", "tenant_admin", str(tenant_id))
+
+            response = lambda_handler(_event(token, "session-1"), {})
+
+            assert response["statusCode"] == 200
+            body = json.loads(response["body"])
+            assert body["deletedRounds"] == round_count
+            assert body["deletedAudioFiles"] == round_count
+            assert mock_s3.delete_object.call_count == round_count
+            # Every round, then the session
+            assert mock_delete_item.call_count == round_count + 1
+
+    @settings(max_examples=50, deadline=None)
+    @given(admin_tenant=st.uuids(), session_tenant=st.uuids())
+    def test_cross_tenant_delete_rejected(self, admin_tenant, session_tenant):
+        """For any session of another tenant, the delete is rejected with 403"""
+        from auth import generate_token
+
+        if admin_tenant == session_tenant:
+            return
+
+        with (
+            patch("handler.get_item") as mock_get_item,
+            patch("handler.query") as mock_query,
+            patch("handler.delete_item") as mock_delete_item,
+            patch("handler.s3_client") as mock_s3,
+        ):
+            from handler import lambda_handler
+
+            mock_get_item.return_value = {
+                "sessionId": "session-1",
+                "tenantId": str(session_tenant),
+            }
+            token = generate_token("admin-1", "tenant_admin", str(admin_tenant))
+
+            response = lambda_handler(_event(token, "session-1"), {})
+
+            assert response["statusCode"] == 403
+            body = json.loads(response["body"])
+            assert body["error"]["code"] == "CROSS_TENANT_ACCESS"
+            mock_query.assert_not_called()
+            mock_delete_item.assert_not_called()
+            mock_s3.delete_object.assert_not_called()
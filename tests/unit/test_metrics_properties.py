@@ -0,0 +1,91 @@
+"""
+Property-Based Tests for CloudWatch Embedded Metric Format Output
+
+Tests cover:
+- Every metric is a single stdout line that follows the EMF structure
+- Participant authentication failures emit a failure counter by reason
+
+These tests use Hypothesis for property-based testing to verify universal properties
+across many randomly generated inputs.
+"""
+
+import io
+import json
+import pytest
+from contextlib import redirect_stdout
+from hypothesis import given, settings, strategies as st
+from unittest.mock import patch
+import sys
+import os
+
+# Add lambda directories to path
+lambda_path = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
+)
+sys.path.insert(0, os.path.join(lambda_path, "common"))
+
+import participant_middleware
+from auth import generate_token
+from metrics import emit_metric
+
+identifiers = st.text(
+    alphabet=st.characters(whitelist_categories=("Lu", "Ll", "Nd")),
+    min_size=1,
+    max_size=20,
+)
+
+
+class TestMetricsProperties:
+    """Property-based tests for EMF metric lines"""
+
+    @settings(max_examples=50, deadline=None)
+    @given(
+        name=identifiers,
+        value=st.integers(min_value=0, max_value=1000),
+        dimensions=st.dictionaries(identifiers, identifiers, max_size=3),
+    )
+    def test_metric_is_single_emf_line(self, name, value, dimensions):
+        """For any metric, one JSON line declares it and carries its value"""
+        dimensions = {k: v for k, v in dimensions.items() if k != name}
+
+        with redirect_stdout(io.StringIO()) as stdout:
+            emit_metric("MusicQuiz/Test", name, value, dimensions=dimensions)
+
+        lines = stdout.getvalue().splitlines()
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        (directive,) = record["_aws"]["CloudWatchMetrics"]
+        assert isinstance(record["_aws"]["Timestamp"], int)
+        assert directive["Namespace"] == "MusicQuiz/Test"
+        assert directive["Metrics"] == [{"Name": name, "Unit": "Count"}]
+        assert directive["Dimensions"] == [list(dimensions)]
+        assert record[name] == value
+        for key, dimension_value in dimensions.items():
+            assert record[key] == dimension_value
+
+    @pytest.mark.parametrize(
+        "record,reason",
+        [
+            (None, "PARTICIPANT_NOT_FOUND"),
+            ({"participantId": "p-1", "tenantId": "tenant-2"}, "TENANT_MISMATCH"),
+        ],
+    )
+    def test_participant_auth_failure_emits_metric(self, record, reason):
+        """Participant lookups that fail authentication are counted by reason"""
+        participant_middleware._participant_cache.clear()
+        token = generate_token("p-1", "participant", "tenant-1")
+        event = {"headers": {"Authorization": f"Bearer {token}"}}
+
+        with (
+            patch("participant_middleware.get_item", return_value=record),
+            patch("participant_middleware.emit_metric") as mock_emit,
+        ):
+            context, error = participant_middleware.require_participant_auth(event)
+
+        assert context is None
+        assert error is not None
+        mock_emit.assert_called_once_with(
+            participant_middleware.METRICS_NAMESPACE,
+            "ParticipantAuthFailure",
+            dimensions={"Reason": reason},
+        )
@@ -418,9 +418,11 @@ class TestParticipantAuthenticationProperties:
 
         This test verifies participant existence validation.
         """
-        from participant_middleware import require_participant_auth
+        from participant_middleware import require_participant_auth, _participant_cache
         from auth import generate_token
 
+        _participant_cache.clear()
+
         # Arrange - Generate valid token but participant doesn't exist
         token = generate_token(
             user_id=str(participant_id), role="participant", tenant_id=str(tenant_id)
@@ -468,9 +470,11 @@ class TestParticipantAuthenticationProperties:
         if token_tenant_id == db_tenant_id:
             pytest.skip("Tenant IDs must be different for this test")
 
-        from participant_middleware import require_participant_auth
+        from participant_middleware import require_participant_auth, _participant_cache
         from auth import generate_token
 
+        _participant_cache.clear()
+
         # Arrange - Generate token with one tenant ID
         token = generate_token(
             user_id=str(participant_id),
@@ -518,9 +522,11 @@ class TestParticipantAuthenticationProperties:
 
         This is a positive test case to ensure the authentication flow works correctly.
         """
-        from participant_middleware import require_participant_auth
+        from participant_middleware import require_participant_auth, _participant_cache
         from auth import generate_token
 
+        _participant_cache.clear()
+
         # Arrange - Generate valid token and mock participant exists
         token = generate_token(
             user_id=str(participant_id), role="participant", tenant_id=str(tenant_id)
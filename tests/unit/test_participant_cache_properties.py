@@ -0,0 +1,93 @@
+"""
+Property-Based Tests for Participant Record Caching
+
+Tests cover:
+- Repeat authentication of the same participant reads DynamoDB once
+- Cached records are re-read once they expire or are forgotten
+- Tenant mismatches are rejected even when the record comes from cache
+- Missing participants are never cached
+
+These tests use Hypothesis for property-based testing to verify universal properties
+across many randomly generated inputs.
+"""
+
+from hypothesis import given, settings, strategies as st
+from unittest.mock import patch
+import sys
+import os
+import time
+
+# Add lambda directories to path
+lambda_path = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
+)
+sys.path.insert(0, os.path.join(lambda_path, "common"))
+
+import participant_middleware
+from auth import generate_token
+
+
+def _event(participant_id, tenant_id):
+    token = generate_token(participant_id, "participant", tenant_id)
+    return {"headers": {"Authorization": f"Bearer {token}"}}
+
+
+class TestParticipantCacheProperties:
+    """Property-based tests for cached participant lookups"""
+
+    def setup_method(self):
+        participant_middleware._participant_cache.clear()
+
+    @settings(max_examples=50, deadline=None)
+    @given(participant_id=st.uuids(), tenant_id=st.uuids(), repeats=st.integers(2, 5))
+    def test_repeat_authentication_reads_once(self, participant_id, tenant_id, repeats):
+        """For any participant, only the first authentication reads DynamoDB"""
+        participant_middleware._participant_cache.clear()
+        record = {"participantId": str(participant_id), "tenantId": str(tenant_id)}
+        event = _event(str(participant_id), str(tenant_id))
+
+        with patch("participant_middleware.get_item", return_value=record) as mock_get:
+            results = [
+                participant_middleware.require_participant_auth(event)
+                for _ in range(repeats)
+            ]
+
+        assert mock_get.call_count == 1
+        assert all(error is None for _, error in results)
+        assert all(context["participant"] == record for context, _ in results)
+
+    def test_expired_or_forgotten_record_is_reread(self):
+        """A cached record is read again after expiry or forget_participant"""
+        record = {"participantId": "p-1", "tenantId": "tenant-1"}
+
+        with patch("participant_middleware.get_item", return_value=record) as mock_get:
+            participant_middleware.get_participant("p-1")
+
+            future = time.time() + participant_middleware.PARTICIPANT_CACHE_TTL_SECONDS
+            with patch("participant_middleware.time.time", return_value=future + 1):
+                participant_middleware.get_participant("p-1")
+
+            participant_middleware.forget_participant("p-1")
+            participant_middleware.get_participant("p-1")
+
+        assert mock_get.call_count == 3
+
+    def test_tenant_mismatch_rejected_on_cache_hit(self):
+        """A cached record whose tenant differs from the token is rejected"""
+        record = {"participantId": "p-1", "tenantId": "tenant-1"}
+
+        with patch("participant_middleware.get_item", return_value=record):
+            participant_middleware.require_participant_auth(_event("p-1", "tenant-1"))
+            context, error = participant_middleware.require_participant_auth(
+                _event("p-1", "tenant-2")
+            )
+
+        assert context is None
+        assert error["statusCode"] == 401
+
+    def test_missing_participant_not_cached(self):
+        """Lookups that find no participant are never stored"""
+        with patch("participant_middleware.get_item", return_value=None):
+            assert participant_middleware.get_participant("p-1") is None
+
+        assert participant_middleware._participant_cache == {}
@@ -381,3 +381,86 @@ class TestSubmitAnswerProperties:
 
                 assert stored_answer["participationId"] == expected_participation_id
                 assert stored_answer["sessionId"] == session_id_str
+
+    @patch("handler.update_item")
+    @patch("handler.put_item")
+    @patch("handler.get_item")
+    @patch("handler.query")
+    def test_session_and_round_are_read_once(
+        self, mock_query, mock_get_item, mock_put_item, mock_update_item
+    ):
+        """
+        The session and round are each fetched exactly once per submission,
+        including when the answer is correct and points depend on the round
+        start time.
+        """
+        from handler import lambda_handler, QUIZ_SESSIONS_TABLE, QUIZ_ROUNDS_TABLE
+
+        mock_query.return_value = [
+            {
+                "participationId": "participation-1",
+                "participantId": "participant-1",
+                "sessionId": "session-1",
+                "tenantId": "tenant-1",
+            }
+        ]
+        mock_get_item.side_effect = lambda table, key: {
+            QUIZ_SESSIONS_TABLE: {"sessionId": "session-1", "status": "active"},
+            QUIZ_ROUNDS_TABLE: {
+                "sessionId": "session-1",
+                "roundNumber": 1,
+                "correctAnswer": 2,
+            },
+        }[table]
+
+        event = {
+            "body": json.dumps(
+                {
+                    "participantId": "participant-1",
+                    "sessionId": "session-1",
+                    "roundNumber": 1,
+                    "answer": 2,
+                }
+            )
+        }
+
+        response = lambda_handler(event, {})
+
+        assert response["statusCode"] == 201
+        assert json.loads(response["body"])["isCorrect"] is True
+        tables_read = sorted(call[0][0] for call in mock_get_item.call_args_list)
+        assert tables_read == sorted([QUIZ_SESSIONS_TABLE, QUIZ_ROUNDS_TABLE])
+
+    @settings(max_examples=50, deadline=None)
+    @given(
+        answer=st.one_of(
+            st.booleans(),
+            st.text(),
+            st.integers(min_value=4),
+            st.integers(max_value=-1),
+        )
+    )
+    @patch("handler.query")
+    def test_invalid_answer_rejected_before_lookups(self, mock_query, answer):
+        """
+        Answers that are not integers between 0 and 3 (including booleans) are
+        rejected with 400 before any database lookup is issued.
+        """
+        from handler import lambda_handler
+
+        event = {
+            "body": json.dumps(
+                {
+                    "participantId": "participant-1",
+                    "sessionId": "session-1",
+                    "roundNumber": 1,
+                    "answer": answer,
+                }
+            )
+        }
+
+        response = lambda_handler(event, {})
+
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["error"]["code"] == "INVALID_ANSWER"
+        mock_query.assert_not_called()
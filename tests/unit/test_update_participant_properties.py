@@ -0,0 +1,165 @@
+"""
+Property-Based Tests for Update Participant Lambda Handler
+
+Tests cover:
+- Admins can update participants in sessions of their own tenant
+- Cross-tenant updates are rejected by the session condition check
+- Missing sessions and participants are reported from cancellation reasons
+- Invalid bodies are rejected before any DynamoDB access
+
+These tests use Hypothesis for property-based testing to verify universal properties
+across many randomly generated inputs.
+"""
+
+import json
+import pytest
+from hypothesis import given, settings, strategies as st
+from unittest.mock import patch
+from botocore.exceptions import ClientError
+import sys
+import os
+
+# Add lambda directories to path
+lambda_path = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
+)
+sys.path.insert(0, os.path.join(lambda_path, "update_participant"))
+sys.path.insert(0, os.path.join(lambda_path, "common"))
+
+
+def _cancelled(*codes, session_item=None):
+    reasons = [{"Code": code} for code in codes]
+    if session_item:
+        reasons[0]["Item"] = session_item
+    return ClientError(
+        {
+            "Error": {"Code": "TransactionCanceledException"},
+            "CancellationReasons": reasons,
+        },
+        "TransactWriteItems",
+    )
+
+
+def _event(token, session_id, participant_id, name="New Name", avatar="😎"):
+    return {
+        "headers": {"Authorization": f"Bearer {token}"},
+        "pathParameters": {"sessionId": session_id, "participantId": participant_id},
+        "body": json.dumps({"name": name, "avatar": avatar}),
+    }
+
+
+class TestUpdateParticipantProperties:
+    """Property-based tests for updating participants"""
+
+    @settings(max_examples=50, deadline=None)
+    @given(
+        tenant_id=st.uuids(),
+        session_id=st.uuids(),
+        participant_id=st.uuids(),
+        name=st.text(min_size=1, max_size=30),
+    )
+    def test_same_tenant_update_succeeds(
+        self, tenant_id, session_id, participant_id, name
+    ):
+        """For any session of the admin's tenant, the participant is updated"""
+        from auth import generate_token
+
+        with patch("handler.transact_write_items") as mock_transact:
+            from handler import lambda_handler
+
+            token = generate_token("admin-1", "tenant_admin", str(tenant_id))
+
+            response = lambda_handler(
+                _event(token, str(session_id), str(participant_id), name=name), {}
+            )
+
+            assert response["statusCode"] == 200
+            body = json.loads(response["body"])
+            assert body["participantId"] == str(participant_id)
+            assert body["name"] == name
+            mock_transact.assert_called_once()
+            check, update = mock_transact.call_args[0][0]
+            assert check["ConditionCheck"]["Key"] == {"sessionId": str(session_id)}
+            assert check["ConditionCheck"]["ExpressionAttributeValues"] == {
+                ":tenantId": str(tenant_id)
+            }
+            assert update["Update"]["Key"] == {"participantId": str(participant_id)}
+            assert "sessionId = :sid" in update["Update"]["ConditionExpression"]
+            assert update["Update"]["ExpressionAttributeValues"][":sid"] == str(
+                session_id
+            )
+            assert update["Update"]["ExpressionAttributeValues"][":name"] == name
+
+    @settings(max_examples=50, deadline=None)
+    @given(admin_tenant=st.uuids(), session_tenant=st.uuids())
+    def test_cross_tenant_update_rejected(self, admin_tenant, session_tenant):
+        """For any session of another tenant, the failed check maps to 403"""
+        from auth import generate_token
+
+        if admin_tenant == session_tenant:
+            return
+
+        with patch("handler.transact_write_items") as mock_transact:
+            from handler import lambda_handler
+
+            mock_transact.side_effect = _cancelled(
+                "ConditionalCheckFailed",
+                "None",
+                session_item={"tenantId": {"S": str(session_tenant)}},
+            )
+            token = generate_token("admin-1", "tenant_admin", str(admin_tenant))
+
+            response = lambda_handler(_event(token, "session-1", "p-1"), {})
+
+            assert response["statusCode"] == 403
+            body = json.loads(response["body"])
+            assert body["error"]["code"] == "CROSS_TENANT_ACCESS"
+
+    @pytest.mark.parametrize(
+        "codes,expected_code",
+        [
+            (("ConditionalCheckFailed", "None"), "SESSION_NOT_FOUND"),
+            (("None", "ConditionalCheckFailed"), "PARTICIPANT_NOT_FOUND"),
+        ],
+    )
+    def test_missing_item_returns_404(self, codes, expected_code):
+        """A failed existence condition in the transaction maps to 404"""
+        from auth import generate_token
+
+        with patch("handler.transact_write_items") as mock_transact:
+            from handler import lambda_handler
+
+            mock_transact.side_effect = _cancelled(*codes)
+            token = generate_token("admin-1", "admin")
+
+            response = lambda_handler(_event(token, "session-1", "p-1"), {})
+
+            assert response["statusCode"] == 404
+            body = json.loads(response["body"])
+            assert body["error"]["code"] == expected_code
+
+    @settings(max_examples=50, deadline=None)
+    @given(
+        body=st.one_of(
+            st.lists(st.integers(), max_size=3),
+            st.text(max_size=10),
+            st.integers(),
+            st.fixed_dictionaries({"name": st.integers(), "avatar": st.just("😎")}),
+            st.fixed_dictionaries({"name": st.just("")}),
+        )
+    )
+    def test_invalid_body_rejected_before_writes(self, body):
+        """For any non-object or incomplete body, 400 is returned without writes"""
+        from auth import generate_token
+
+        with patch("handler.transact_write_items") as mock_transact:
+            from handler import lambda_handler
+
+            token = generate_token("admin-1", "admin")
+            event = _event(token, "session-1", "p-1")
+            event["body"] = json.dumps(body)
+
+            response = lambda_handler(event, {})
+
+            assert response["statusCode"] == 400
+            mock_transact.assert_not_called()
@@ -0,0 +1,107 @@
+"""
+Property-Based Tests for Update Session Lambda Handler
+
+Tests cover:
+- Admins can update sessions of their own tenant
+- Numeric attributes of the updated session are returned as JSON numbers
+- Cross-tenant updates are rejected by the update condition
+
+These tests use Hypothesis for property-based testing to verify universal properties
+across many randomly generated inputs.
+"""
+
+import json
+from decimal import Decimal
+from hypothesis import given, settings, strategies as st
+from unittest.mock import patch
+from botocore.exceptions import ClientError
+import sys
+import os
+
+# Add lambda directories to path
+lambda_path = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
+)
+sys.path.insert(0, os.path.join(lambda_path, "update_session"))
+sys.path.insert(0, os.path.join(lambda_path, "common"))
+
+
+def _event(token, session_id, body):
+    return {
+        "headers": {"Authorization": f"Bearer {token}"},
+        "pathParameters": {"sessionId": session_id},
+        "body": json.dumps(body),
+    }
+
+
+class TestUpdateSessionProperties:
+    """Property-based tests for updating sessions"""
+
+    @settings(max_examples=50, deadline=None)
+    @given(
+        tenant_id=st.uuids(),
+        status=st.sampled_from(["draft", "active", "completed"]),
+        current_round=st.integers(min_value=0, max_value=100),
+    )
+    def test_same_tenant_update_returns_session(self, tenant_id, status, current_round):
+        """For any session of the admin's tenant, the updated session is returned"""
+        from auth import generate_token
+
+        with patch("handler.update_item") as mock_update_item:
+            from handler import lambda_handler
+
+            # ALL_NEW returns numbers as Decimal
+            mock_update_item.return_value = {
+                "sessionId": "session-1",
+                "tenantId": str(tenant_id),
+                "status": status,
+                "currentRound": Decimal(current_round),
+                "roundTimeLimit": Decimal("12.5"),
+            }
+            token = generate_token("admin-1", "tenant_admin", str(tenant_id))
+
+            response = lambda_handler(
+                _event(token, "session-1", {"status": status}), {}
+            )
+
+            assert response["statusCode"] == 200
+            session = json.loads(response["body"])["session"]
+            assert session["status"] == status
+            assert session["currentRound"] == current_round
+            assert session["roundTimeLimit"] == 12.5
+            assert mock_update_item.call_args.kwargs["return_values"] == "ALL_NEW"
+
+    @settings(max_examples=50, deadline=None)
+    @given(admin_tenant=st.uuids(), session_tenant=st.uuids())
+    def test_cross_tenant_update_rejected(self, admin_tenant, session_tenant):
+        """For any session of another tenant, the update is rejected with 403"""
+        from auth import generate_token
+
+        if admin_tenant == session_tenant:
+            return
+
+        with (
+            patch("handler.update_item") as mock_update_item,
+            patch("tenant_middleware.get_item") as mock_get_item,
+        ):
+            from handler import lambda_handler
+
+            mock_update_item.side_effect = ClientError(
+                {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+            )
+            mock_get_item.side_effect = lambda table_name, key: (
+                {"sessionId": "session-1", "tenantId": str(session_tenant)}
+                if "sessionId" in key
+                else {"tenantId": key["tenantId"], "status": "active"}
+            )
+            token = generate_token("admin-1", "tenant_admin", str(admin_tenant))
+
+            response = lambda_handler(
+                _event(token, "session-1", {"status": "active"}), {}
+            )
+
+            assert response["statusCode"] == 403
+            body = json.loads(response["body"])
+            assert body["error"]["code"] == "CROSS_TENANT_ACCESS"
+            condition = mock_update_item.call_args.kwargs["condition_expression"]
+            assert "tenantId = :tenantId" in condition
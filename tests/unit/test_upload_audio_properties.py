@@ -0,0 +1,303 @@
+"""
+Property-Based Tests for Upload Audio Lambda Handler
+
+Tests cover:
+- Requests without audioData get a pre-signed PUT URL and upload nothing
+- Base64 audio is uploaded byte-for-byte, in a single PutObject or in parts
+- Line-wrapped (MIME) base64 is uploaded byte-for-byte in parts
+- Invalid base64 aborts the multipart upload and returns 400
+- Invalid base64 is rejected with 400 in a single part and in parts alike
+- Binary bodies that API Gateway did not base64-encode are rejected
+- Uploads to sessions of another tenant are rejected before any upload
+
+These tests use Hypothesis for property-based testing to verify universal properties
+across many randomly generated inputs.
+"""
+
+import base64
+import json
+from hypothesis import given, settings, strategies as st
+from unittest.mock import patch
+import sys
+import os
+
+# Add lambda directories to path
+lambda_path = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
+)
+sys.path.insert(0, os.path.join(lambda_path, "upload_audio"))
+sys.path.insert(0, os.path.join(lambda_path, "common"))
+
+
+def _event(token, audio_data_b64):
+    return {
+        "headers": {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        },
+        "body": json.dumps(
+            {
+                "audioData": audio_data_b64,
+                "fileName": "song.mp3",
+                "sessionId": "session-1",
+            }
+        ),
+    }
+
+
+class TestUploadAudioProperties:
+    """Property-based tests for uploading audio"""
+
+    @settings(max_examples=25, deadline=None)
+    @given(
+        session_id=st.uuids(),
+        extension=st.sampled_from(["mp3", "wav", "ogg", "m4a"]),
+    )
+    def test_direct_upload_returns_presigned_put_url(self, session_id, extension):
+        """For any session and file type, a PUT URL is issued for the S3 key"""
+        from auth import generate_token
+
+        with (
+            patch("handler.get_item") as mock_get_item,
+            patch("handler.s3_client") as mock_s3,
+        ):
+            from handler import lambda_handler
+
+            mock_get_item.return_value = {"sessionId": str(session_id)}
+            mock_s3.generate_presigned_url.return_value = "https://example.com/put"
+            token = generate_token("admin-1", "admin")
+            event = _event(token, None)
+            event["body"] = json.dumps(
+                {"fileName": f"song.{extension}", "sessionId": str(session_id)}
+            )
+
+            response = lambda_handler(event, {})
+
+            assert response["statusCode"] == 201
+            body = json.loads(response["body"])
+            assert body["uploadUrl"] == "https://example.com/put"
+            assert body["audioKey"].startswith(f"sessions/{session_id}/audio/")
+            assert body["audioKey"].endswith(f".{extension}")
+            (operation,) = mock_s3.generate_presigned_url.call_args.args
+            params = mock_s3.generate_presigned_url.call_args.kwargs["Params"]
+            assert operation == "put_object"
+            assert params["Key"] == body["audioKey"]
+            assert params["ContentType"] == f"audio/{extension}"
+            mock_s3.put_object.assert_not_called()
+
+    @settings(max_examples=25, deadline=None)
+    @given(
+        audio=st.binary(min_size=1, max_size=64),
+        part_size=st.sampled_from([3, 6, 12]),
+    )
+    def test_uploaded_bytes_match_decoded_audio(self, audio, part_size):
+        """For any audio and part size, the uploaded parts decode to the audio"""
+        from auth import generate_token
+
+        with (
+            patch("handler.get_item") as mock_get_item,
+            patch("handler.s3_client") as mock_s3,
+            patch("handler.UPLOAD_PART_B64_CHARS", part_size // 3 * 4),
+        ):
+            from handler import lambda_handler
+
+            mock_get_item.return_value = {"sessionId": "session-1"}
+            mock_s3.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+            mock_s3.upload_part.side_effect = lambda **kwargs: {
+                "ETag": str(kwargs["PartNumber"])
+            }
+            mock_s3.generate_presigned_url.return_value = "https://example.com"
+            token = generate_token("admin-1", "admin")
+
+            response = lambda_handler(
+                _event(token, base64.b64encode(audio).decode()), {}
+            )
+
+            assert response["statusCode"] == 201
+            if mock_s3.put_object.called:
+                uploaded = mock_s3.put_object.call_args.kwargs["Body"]
+                mock_s3.create_multipart_upload.assert_not_called()
+            else:
+                part_calls = mock_s3.upload_part.call_args_list
+                uploaded = b"".join(c.kwargs["Body"] for c in part_calls)
+                assert [c.kwargs["PartNumber"] for c in part_calls] == list(
+                    range(1, len(part_calls) + 1)
+                )
+                mock_s3.complete_multipart_upload.assert_called_once()
+            assert uploaded == audio
+
+    @settings(max_examples=25, deadline=None)
+    @given(
+        audio=st.binary(min_size=58, max_size=256),
+        part_size=st.sampled_from([3, 6, 12]),
+    )
+    def test_line_wrapped_base64_uploaded_in_parts(self, audio, part_size):
+        """For any audio encoded in 76-character lines, the parts decode to it"""
+        from auth import generate_token
+
+        with (
+            patch("handler.get_item") as mock_get_item,
+            patch("handler.s3_client") as mock_s3,
+            patch("handler.UPLOAD_PART_B64_CHARS", part_size // 3 * 4),
+        ):
+            from handler import lambda_handler
+
+            mock_get_item.return_value = {"sessionId": "session-1"}
+            mock_s3.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+            mock_s3.upload_part.side_effect = lambda **kwargs: {
+                "ETag": str(kwargs["PartNumber"])
+            }
+            mock_s3.generate_presigned_url.return_value = "https://example.com"
+            token = generate_token("admin-1", "admin")
+
+            response = lambda_handler(
+                _event(token, base64.encodebytes(audio).decode()), {}
+            )
+
+            assert response["statusCode"] == 201
+            part_calls = mock_s3.upload_part.call_args_list
+            assert b"".join(c.kwargs["Body"] for c in part_calls) == audio
+            mock_s3.complete_multipart_upload.assert_called_once()
+            mock_s3.abort_multipart_upload.assert_not_called()
+
+    def test_invalid_base64_aborts_multipart_upload(self):
+        """A decode failure in a later part aborts the upload with a 400"""
+        from auth import generate_token
+
+        with (
+            patch("handler.get_item") as mock_get_item,
+            patch("handler.s3_client") as mock_s3,
+            patch("handler.UPLOAD_PART_B64_CHARS", 4),
+        ):
+            from handler import lambda_handler
+
+            mock_get_item.return_value = {"sessionId": "session-1"}
+            mock_s3.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+            mock_s3.upload_part.return_value = {"ETag": "etag"}
+            token = generate_token("admin-1", "admin")
+
+            response = lambda_handler(_event(token, "QUJD" + "QQ"), {})
+
+            assert response["statusCode"] == 400
+            body = json.loads(response["body"])
+            assert body["error"]["code"] == "INVALID_AUDIO_DATA"
+            mock_s3.abort_multipart_upload.assert_called_once()
+            mock_s3.complete_multipart_upload.assert_not_called()
+
+    @settings(max_examples=25, deadline=None)
+    @given(
+        audio=st.binary(min_size=1, max_size=64),
+        position=st.integers(min_value=0),
+        part_size=st.sampled_from([3, 6, 12, 3000]),
+    )
+    def test_invalid_base64_rejected_at_any_size(self, audio, position, part_size):
+        """For any base64 with a character outside the alphabet, 400 is returned"""
+        from auth import generate_token
+
+        audio_data_b64 = base64.b64encode(audio).decode()
+        position %= len(audio_data_b64) + 1
+        audio_data_b64 = audio_data_b64[:position] + "*" + audio_data_b64[position:]
+
+        with (
+            patch("handler.get_item") as mock_get_item,
+            patch("handler.s3_client") as mock_s3,
+            patch("handler.UPLOAD_PART_B64_CHARS", part_size // 3 * 4),
+        ):
+            from handler import lambda_handler
+
+            mock_get_item.return_value = {"sessionId": "session-1"}
+            mock_s3.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+            mock_s3.upload_part.return_value = {"ETag": "etag"}
+            token = generate_token("admin-1", "admin")
+
+            response = lambda_handler(_event(token, audio_data_b64), {})
+
+            assert response["statusCode"] == 400
+            body = json.loads(response["body"])
+            assert body["error"]["code"] == "INVALID_AUDIO_DATA"
+            mock_s3.put_object.assert_not_called()
+            mock_s3.complete_multipart_upload.assert_not_called()
+
+    @settings(max_examples=25, deadline=None)
+    @given(body=st.text(min_size=1, max_size=64))
+    def test_unencoded_binary_body_rejected(self, body):
+        """For any body not base64-encoded by API Gateway, 400 is returned"""
+        from auth import generate_token
+
+        with (
+            patch("handler.get_item") as mock_get_item,
+            patch("handler.s3_client") as mock_s3,
+        ):
+            from handler import lambda_handler
+
+            token = generate_token("admin-1", "admin")
+            event = {
+                "headers": {
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": "audio/mpeg",
+                },
+                "queryStringParameters": {"sessionId": "session-1"},
+                "body": body,
+                "isBase64Encoded": False,
+            }
+
+            response = lambda_handler(event, {})
+
+            assert response["statusCode"] == 400
+            body = json.loads(response["body"])
+            assert body["error"]["code"] == "INVALID_BINARY"
+            mock_get_item.assert_not_called()
+            mock_s3.put_object.assert_not_called()
+
+    @settings(max_examples=50, deadline=None)
+    @given(admin_tenant=st.uuids(), session_tenant=st.uuids())
+    def test_cross_tenant_upload_rejected(self, admin_tenant, session_tenant):
+        """For any session of another tenant, the upload is rejected with 403"""
+        from auth import generate_token
+
+        if admin_tenant == session_tenant:
+            return
+
+        with (
+            patch("handler.get_item") as mock_get_item,
+            patch("handler.s3_client") as mock_s3,
+        ):
+            from handler import lambda_handler
+
+            mock_get_item.return_value = {
+                "sessionId": "session-1",
+                "tenantId": str(session_tenant),
+            }
+            token = generate_token("admin-1", "tenant_admin", str(admin_tenant))
+
+            response = lambda_handler(_event(token, "QUJD"), {})
+
+            assert response["statusCode"] == 403
+            body = json.loads(response["body"])
+            assert body["error"]["code"] == "CROSS_TENANT_ACCESS"
+            mock_s3.put_object.assert_not_called()
+            mock_s3.generate_presigned_url.assert_not_called()
+
+    @settings(max_examples=50, deadline=None)
+    @given(tenant_id=st.uuids())
+    def test_same_tenant_upload_succeeds(self, tenant_id):
+        """For any session of the admin's tenant, the audio is uploaded"""
+        from auth import generate_token
+
+        with (
+            patch("handler.get_item") as mock_get_item,
+            patch("handler.s3_client") as mock_s3,
+        ):
+            from handler import lambda_handler
+
+            mock_get_item.return_value = {
+                "sessionId": "session-1",
+                "tenantId": str(tenant_id),
+            }
+            mock_s3.generate_presigned_url.return_value = "https://example.com"
+            token = generate_token("admin-1", "tenant_admin", str(tenant_id))
+
+            response = lambda_handler(_event(token, "QUJD"), {})
+
+            assert response["statusCode"] == 201
+            assert mock_s3.put_object.call_args.kwargs["Body"] == b"ABC"
@@ -0,0 +1,99 @@
+"""
+Property-Based Tests for Upload Image Lambda Handler
+
+Tests cover:
+- Admins can upload images to sessions of their own tenant
+- Cross-tenant uploads are rejected before anything is uploaded
+
+These tests use Hypothesis for property-based testing to verify universal properties
+across many randomly generated inputs.
+"""
+
+import base64
+import json
+from hypothesis import given, settings, strategies as st
+from unittest.mock import patch
+import sys
+import os
+
+# Add lambda directories to path
+lambda_path = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
+)
+sys.path.insert(0, os.path.join(lambda_path, "upload_image"))
+sys.path.insert(0, os.path.join(lambda_path, "common"))
+
+
+def _event(token, image, session_id="session-1"):
+    return {
+        "headers": {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        },
+        "body": json.dumps(
+            {
+                "imageData": base64.b64encode(image).decode(),
+                "fileName": "cover.png",
+                "sessionId": session_id,
+            }
+        ),
+    }
+
+
+class TestUploadImageProperties:
+    """Property-based tests for uploading images"""
+
+    @settings(max_examples=50, deadline=None)
+    @given(tenant_id=st.uuids(), image=st.binary(min_size=1, max_size=64))
+    def test_same_tenant_upload_succeeds(self, tenant_id, image):
+        """For any session of the admin's tenant, the image is uploaded"""
+        from auth import generate_token
+
+        with (
+            patch("handler.get_item") as mock_get_item,
+            patch("handler.s3_client") as mock_s3,
+        ):
+            from handler import lambda_handler
+
+            mock_get_item.return_value = {
+                "sessionId": "session-1",
+                "tenantId": str(tenant_id),
+            }
+            mock_s3.generate_presigned_url.return_value = "https://example.com/get"
+            token = generate_token("admin-1", "tenant_admin", str(tenant_id))
+
+            response = lambda_handler(_event(token, image), {})
+
+            assert response["statusCode"] == 201
+            body = json.loads(response["body"])
+            assert body["imageKey"].startswith("sessions/session-1/images/")
+            assert mock_s3.put_object.call_args.kwargs["Body"] == image
+            assert mock_s3.put_object.call_args.kwargs["ContentType"] == "image/png"
+
+    @settings(max_examples=50, deadline=None)
+    @given(admin_tenant=st.uuids(), session_tenant=st.uuids())
+    def test_cross_tenant_upload_rejected(self, admin_tenant, session_tenant):
+        """For any session of another tenant, the upload is rejected with 403"""
+        from auth import generate_token
+
+        if admin_tenant == session_tenant:
+            return
+
+        with (
+            patch("handler.get_item") as mock_get_item,
+            patch("handler.s3_client") as mock_s3,
+        ):
+            from handler import lambda_handler
+
+            mock_get_item.return_value = {
+                "sessionId": "session-1",
+                "tenantId": str(session_tenant),
+            }
+            token = generate_token("admin-1", "tenant_admin", str(admin_tenant))
+
+            response = lambda_handler(_event(token, b"image"), {})
+
+            assert response["statusCode"] == 403
+            body = json.loads(response["body"])
+            assert body["error"]["code"] == "CROSS_TENANT_ACCESS"
+            mock_s3.put_object.assert_not_called()